@@ -9,32 +9,62 @@ import sys
 import os
 from pathlib import Path
 
-# Add src directory to Python path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src directory to Python path for imports (once, even if re-imported)
+src_path = Path(__file__).resolve().parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from ui.display import GameDisplay
 from ui.input_handler import InputHandler
 from data.manager import DataManager
 from game.game_engine import GameEngine
 from game.player import Player
-from training.content_loader import ContentLoader
-from training.trainer import PokerTrainer, QuizType
-from training.adaptive_trainer import AdaptiveTrainer
-from training.progression_analyzer import WeaknessType
-from training.career_tracker import CareerTracker
-from training.analyzer import SessionReviewer
+
+_SEP = "-" * 70
+_REVIEW_HAND_LIMIT = 10  # Hands listed in "Review Recent Hands"
+
+# Menu options are fixed, so build them once at import time.
+_PLAYER_MENU = ("Create New Player", "Select Existing Player", "Exit")
+_GAME_TYPES = ("Cash Game", "Tournament", "Training Session", "Back to Player Selection")
+_LIMIT_TYPES = ("No Limit", "Limit", "Back")
+_TRAINING_MENU = (
+    "Personalized Drill (from your weaknesses)",
+    "Quick Quiz (Pot Odds)",
+    "Quick Quiz (Mixed Fundamentals)",
+    "Practice Scenario (from your weaknesses)",
+    "Review Recent Hands",
+    "Session Review (Last Session)",
+    "Career Report",
+    "Show Random Tip",
+    "Export Default Study Content Files",
+    "Back",
+)
+_HAND_VIEW_MENU = ("Quick view (print full hand)", "Replay (street-by-street)", "Back")
+
+# Shared across training sessions so educational content is read only once.
+_content_loader = None
+
+
+def _get_content_loader():
+    """Return the process-wide ContentLoader, creating it on first use."""
+    global _content_loader
+    if _content_loader is None:
+        from training.content_loader import ContentLoader
+
+        _content_loader = ContentLoader()
+    return _content_loader
 
 
 def main():
     """Main game entry point."""
+    data_manager = None
     try:
         # Initialize display
         display = GameDisplay()
         display.show_welcome_screen()
         
         # Initialize data manager
-        data_manager = DataManager()
+        data_manager = DataManager(write_ahead_log=True)
         
         # Initialize input handler
         input_handler = InputHandler()
@@ -71,15 +101,16 @@ def main():
         print(f"\nAn unexpected error occurred: {e}")
         print("Please report this issue if it persists.")
     finally:
-        # Clean up resources if needed
-        pass
+        # Flush buffered hand history and close its files
+        if data_manager is not None:
+            data_manager.close()
 
 
 def handle_player_selection(data_manager, input_handler, display):
     """Handle player selection or creation."""
     while True:
         display.show_player_menu()
-        choice = input_handler.get_menu_choice(["Create New Player", "Select Existing Player", "Exit"])
+        choice = input_handler.get_menu_choice(_PLAYER_MENU)
         
         if choice == 1:
             # Create new player
@@ -181,71 +212,126 @@ def select_existing_player(data_manager, input_handler, display):
 
 def handle_game_mode_selection(input_handler, display):
     """Handle game mode selection."""
-    display.clear_screen()
-    display.show_header("Game Mode Selection")
-    
-    # Game type selection
-    game_types = ["Cash Game", "Tournament", "Training Session", "Back to Player Selection"]
-    type_choice = input_handler.get_menu_choice(game_types)
-    
-    if type_choice == 4:  # Back
-        return None
+    while True:
+        display.clear_screen()
+        display.show_header("Game Mode Selection")
 
-    if type_choice == 3:
-        return {"type": "training"}
+        # Game type selection
+        type_choice = input_handler.get_menu_choice(_GAME_TYPES)
 
-    game_type = "cash" if type_choice == 1 else "tournament"
-    
-    # Limit type selection
-    display.show_subheader("Select Limit Type")
-    limit_types = ["No Limit", "Limit", "Back"]
-    limit_choice = input_handler.get_menu_choice(limit_types)
-    
-    if limit_choice == 3:  # Back
-        return handle_game_mode_selection(input_handler, display)
-        
-    limit_type = "no_limit" if limit_choice == 1 else "limit"
-
-    training_enabled = input_handler.get_yes_no_input("Enable in-game training (quizzes/tips)?")
-    hud_enabled = False
-    post_hand_feedback = False
-    if training_enabled:
-        hud_enabled = input_handler.get_yes_no_input("Enable HUD (opponent stats / pot odds)?")
-        post_hand_feedback = input_handler.get_yes_no_input("Enable post-hand feedback?")
-    
-    return {
-        'type': game_type,
-        'limit': limit_type,
-        'training': training_enabled,
-        'in_game_quizzes': training_enabled,
-        'hud': hud_enabled,
-        'post_hand_feedback': post_hand_feedback,
-    }
+        if type_choice == 4:  # Back
+            return None
+
+        if type_choice == 3:
+            return {"type": "training"}
+
+        game_type = "cash" if type_choice == 1 else "tournament"
+
+        # Limit type selection
+        display.show_subheader("Select Limit Type")
+        limit_choice = input_handler.get_menu_choice(_LIMIT_TYPES)
+
+        if limit_choice == 3:  # Back to game type selection
+            continue
+
+        limit_type = "no_limit" if limit_choice == 1 else "limit"
+
+        training_enabled = input_handler.get_yes_no_input("Enable in-game training (quizzes/tips)?")
+        hud_enabled = False
+        post_hand_feedback = False
+        if training_enabled:
+            hud_enabled = input_handler.get_yes_no_input("Enable HUD (opponent stats / pot odds)?")
+            post_hand_feedback = input_handler.get_yes_no_input("Enable post-hand feedback?")
+
+        return {
+            'type': game_type,
+            'limit': limit_type,
+            'training': training_enabled,
+            'in_game_quizzes': training_enabled,
+            'hud': hud_enabled,
+            'post_hand_feedback': post_hand_feedback,
+        }
+
+
+def _prompt_quiz_parameters(input_handler, include_bet=True):
+    """Ask for the pot size (and bet to call) used by a quiz."""
+    pot_size = int(input_handler.get_number_input("Pot size (50-500)? ", 50, 500, integer_only=True))
+    if not include_bet:
+        return pot_size, None
+    bet_to_call = int(
+        input_handler.get_number_input(
+            "Bet to call (10-250)? ", 10, min(250, pot_size), integer_only=True
+        )
+    )
+    return pot_size, bet_to_call
+
+
+def _random_quiz_parameters():
+    """Pick a pot size and bet to call within the same ranges as the prompts."""
+    import random
+
+    pot_size = random.randint(50, 500)
+    return pot_size, random.randint(10, min(250, pot_size))
+
+
+def _run_quiz(trainer, input_handler, quiz_type, pot_size, bet_to_call=None):
+    """
+    Ask a single numeric quiz question and print the feedback.
+
+    Pot-odds style quizzes take a bet to call and a percentage answer;
+    bet-sizing quizzes (``bet_to_call=None``) take a dollar answer.
+    """
+    if bet_to_call is None:
+        quiz = trainer.generate_quiz(quiz_type, pot_size=pot_size)
+    else:
+        quiz = trainer.generate_quiz(quiz_type, pot_size=pot_size, bet_to_call=bet_to_call)
+
+    print("\n" + _SEP)
+    print(quiz["question"])
+    if bet_to_call is None:
+        user_answer = input_handler.get_number_input(
+            "Your answer ($): ", 0, max(1, pot_size * 3), integer_only=True
+        )
+        result = trainer.evaluate_answer(float(quiz["correct_answer"]), float(user_answer), tolerance=0.2)
+    else:
+        user_answer = input_handler.get_number_input("Your answer (%): ", 0, 100, integer_only=True)
+        result = trainer.evaluate_answer(quiz["correct_answer"], user_answer, tolerance=0.05)
+    print(result["feedback"])
+    print(quiz["explanation"])
+    print(_SEP)
+    return result
 
 
 def run_training_session(player: Player, data_manager, input_handler, display) -> None:
     """Run a standalone training session (quizzes + study prompts)."""
+    # Training subsystems are imported lazily so cash/tournament play does not
+    # pay for loading them at startup.
+    from training.trainer import PokerTrainer, QuizType
+    from training.adaptive_trainer import AdaptiveTrainer
+    from training.progression_analyzer import WeaknessType
+    from training.career_tracker import CareerTracker
+    from training.analyzer import SessionReviewer
+
     display.clear_screen()
     display.show_header("Training Session")
 
-    import random
-
-    player_record = {}
-    if data_manager:
-        try:
-            record = data_manager.get_player(player.name)
-            if isinstance(record, dict):
-                player_record = record
-        except Exception:
-            player_record = {}
+    # DataManager serves profiles from memory; a miss simply returns None.
+    player_record = (data_manager.get_player(player.name) if data_manager else None) or {}
 
+    # Normalize the stored profile once so the menu branches can trust the types.
     skill_level = player_record.get("skill_level", "unknown")
-    weaknesses = player_record.get("weaknesses", [])
+    weaknesses = player_record.get("weaknesses")
+    weaknesses = weaknesses if isinstance(weaknesses, list) else []
     recommended_topics = player_record.get("recommended_topics", [])
-    sessions = player_record.get("sessions", []) if isinstance(player_record.get("sessions"), list) else []
-    recent_hands = (
-        player_record.get("recent_hands", []) if isinstance(player_record.get("recent_hands"), list) else []
-    )
+    sessions = player_record.get("sessions")
+    sessions = [s for s in sessions if isinstance(s, dict)] if isinstance(sessions, list) else []
+    recent_hands = player_record.get("recent_hands")
+    recent_hands = [h for h in recent_hands if isinstance(h, dict)] if isinstance(recent_hands, list) else []
+    practice_history = player_record.get("practice_history")
+    practice_history = list(practice_history) if isinstance(practice_history, list) else None
+    last_session = player_record.get("last_session")
+    if not isinstance(last_session, dict):
+        last_session = sessions[-1] if sessions else None
 
     if weaknesses:
         print(f"Current skill level: {skill_level}")
@@ -257,22 +343,23 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
 
     trainer = PokerTrainer()
     trainer.enable_training()
-    content = ContentLoader()
+    content = _get_content_loader()
     reviewer = SessionReviewer()
 
     weakness_enums = []
-    if isinstance(weaknesses, list):
-        for w in weaknesses:
-            try:
-                weakness_enums.append(WeaknessType(str(w)))
-            except Exception:
-                continue
+    for w in weaknesses:
+        try:
+            weakness_enums.append(w if isinstance(w, WeaknessType) else WeaknessType(str(w)))
+        except Exception:
+            continue
+    # The focus-area menu is fixed for the whole session.
+    weakness_labels = [w.value.replace("_", " ").title() for w in weakness_enums] + ["Back"]
+    weakness_back_choice = len(weakness_labels) - 1
 
     adaptive = AdaptiveTrainer(player.name)
     # Restore prior practice history/difficulty if present.
-    existing_practice = player_record.get("practice_history")
-    if isinstance(existing_practice, list):
-        adaptive.practice_history = list(existing_practice)
+    if practice_history is not None:
+        adaptive.practice_history = practice_history
     try:
         adaptive.current_difficulty = int(player_record.get("training_difficulty", adaptive.current_difficulty))
     except Exception:
@@ -282,30 +369,17 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
 
     while True:
         print("\nWhat would you like to do?")
-        choice = input_handler.get_menu_choice(
-            [
-                "Personalized Drill (from your weaknesses)",
-                "Quick Quiz (Pot Odds)",
-                "Quick Quiz (Mixed Fundamentals)",
-                "Practice Scenario (from your weaknesses)",
-                "Review Recent Hands",
-                "Session Review (Last Session)",
-                "Career Report",
-                "Show Random Tip",
-                "Export Default Study Content Files",
-                "Back",
-            ]
-        )
+        choice = input_handler.get_menu_choice(_TRAINING_MENU)
 
         if choice == 10:
             return
 
         if choice == 8:
             tip = content.get_random_tip()
-            print("\n" + "-" * 70)
+            print("\n" + _SEP)
             print(f"Tip: {tip.get('title', '')}")
             print(tip.get("content", ""))
-            print("-" * 70)
+            print(_SEP)
             continue
 
         if choice == 9:
@@ -315,15 +389,12 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
 
         if choice == 7:
             career = CareerTracker(player.name)
-            for s in sessions:
-                if not isinstance(s, dict):
-                    continue
-                session_copy = dict(s)
-                session_copy["profit"] = session_copy.get("profit", session_copy.get("net_result", 0))
-                career.record_session(session_copy)
+            career.record_sessions(
+                dict(s, profit=s.get("profit", s.get("net_result", 0))) for s in sessions
+            )
 
             metrics = career.get_career_metrics()
-            print("\n" + "-" * 70)
+            print("\n" + _SEP)
             print("📈 Career Report")
             print(f"  Sessions: {metrics.total_sessions}  |  Hands: {metrics.total_hands}")
             print(f"  Avg VPIP: {metrics.avg_vpip*100:.1f}%  |  Avg PFR: {metrics.avg_pfr*100:.1f}%")
@@ -334,14 +405,11 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                 print("  Milestones:")
                 for m in milestones[-3:]:
                     print(f"    - {m.get('type')} (hands: {m.get('total_hands')})")
-            print("-" * 70)
+            print(_SEP)
             continue
 
         if choice == 6:
-            last_session = player_record.get("last_session")
-            if not isinstance(last_session, dict):
-                last_session = sessions[-1] if sessions and isinstance(sessions[-1], dict) else None
-            if not isinstance(last_session, dict):
+            if last_session is None:
                 print("No session data available yet. Play a few hands first.")
                 continue
 
@@ -349,7 +417,7 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
             session_for_review["net_result"] = int(session_for_review.get("profit", 0) or 0)
             report = reviewer.generate_session_report(session_for_review)
 
-            print("\n" + "-" * 70)
+            print("\n" + _SEP)
             summary = report.get("session_summary", {})
             grade = report.get("overall_grade", {})
             print("🧾 Last Session Review")
@@ -370,7 +438,7 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                     print(f"  - {rec.get('action', '')}")
                     if rec.get("specific"):
                         print(f"    {rec.get('specific')}")
-            print("-" * 70)
+            print(_SEP)
             continue
 
         if choice == 5:
@@ -379,22 +447,22 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                 try:
                     load_fn = getattr(data_manager, "load_hand_history", None)
                     if callable(load_fn):
-                        stored_hands = load_fn(player.name, limit=50, reverse=True) or []
+                        stored_hands = load_fn(player.name, limit=_REVIEW_HAND_LIMIT, reverse=True) or []
                 except Exception:
                     stored_hands = []
 
-            hands_for_review = []
+            # load_hand_history only returns dict records.
             if stored_hands:
-                hands_for_review = [h for h in stored_hands if isinstance(h, dict)]
-            elif recent_hands:
-                hands_for_review = [h for h in list(recent_hands)[-50:] if isinstance(h, dict)]
+                hands_for_review = stored_hands
+            else:
+                hands_for_review = recent_hands[-_REVIEW_HAND_LIMIT:]
                 hands_for_review.reverse()  # newest-first
 
             if not hands_for_review:
                 print("No hand history saved yet. Play a few hands first.")
                 continue
 
-            show_count = min(10, len(hands_for_review))
+            show_count = min(_REVIEW_HAND_LIMIT, len(hands_for_review))
             hands_slice = hands_for_review[:show_count]
             print("\nHands:")
             for i, hand in enumerate(hands_slice, 1):
@@ -416,14 +484,7 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                 continue
 
             selected = hands_slice[choice_idx - 1]
-            view_mode = input_handler.get_menu_choice(
-                [
-                    "Quick view (print full hand)",
-                    "Replay (street-by-street)",
-                    "Back",
-                ],
-                "How would you like to view it",
-            )
+            view_mode = input_handler.get_menu_choice(_HAND_VIEW_MENU, "How would you like to view it")
             if view_mode == 3:
                 continue
 
@@ -443,19 +504,18 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
             continue
 
         if choice in (1, 4):
-            weakness_labels = [w.value.replace("_", " ").title() for w in weakness_enums] + ["Back"]
             weakness_choice = input_handler.get_menu_choice(weakness_labels, "Choose a focus area") - 1
-            if weakness_choice == len(weakness_labels) - 1:
+            if weakness_choice == weakness_back_choice:
                 continue
             weakness = weakness_enums[weakness_choice]
 
             if choice == 4:
                 scenario = adaptive.create_practice_scenario(weakness)
-                print("\n" + "-" * 70)
+                print("\n" + _SEP)
                 print("🎯 Practice Scenario")
                 for k, v in scenario.items():
                     print(f"{k.replace('_', ' ').title()}: {v}")
-                print("-" * 70)
+                print(_SEP)
                 adaptive.track_practice_result(
                     {"weakness_type": weakness.value, "correct": True, "time_taken": 0}
                 )
@@ -464,20 +524,8 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
 
             # Personalized drill (quiz) based on weakness
             if weakness == WeaknessType.POOR_POT_ODDS:
-                pot_size = int(input_handler.get_number_input("Pot size (50-500)? ", 50, 500, integer_only=True))
-                bet_to_call = int(
-                    input_handler.get_number_input(
-                        "Bet to call (10-250)? ", 10, min(250, pot_size), integer_only=True
-                    )
-                )
-                quiz = trainer.generate_quiz(QuizType.POT_ODDS, pot_size=pot_size, bet_to_call=bet_to_call)
-                print("\n" + "-" * 70)
-                print(quiz["question"])
-                user_answer = input_handler.get_number_input("Your answer (%): ", 0, 100, integer_only=True)
-                result = trainer.evaluate_answer(quiz["correct_answer"], user_answer, tolerance=0.05)
-                print(result["feedback"])
-                print(quiz["explanation"])
-                print("-" * 70)
+                pot_size, bet_to_call = _prompt_quiz_parameters(input_handler)
+                result = _run_quiz(trainer, input_handler, QuizType.POT_ODDS, pot_size, bet_to_call)
                 adaptive.track_practice_result(
                     {"weakness_type": weakness.value, "correct": bool(result.get("correct")), "time_taken": 0}
                 )
@@ -485,17 +533,8 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                 continue
 
             if weakness in (WeaknessType.TOO_PASSIVE, WeaknessType.POOR_BET_SIZING):
-                pot_size = int(input_handler.get_number_input("Pot size (50-500)? ", 50, 500, integer_only=True))
-                quiz = trainer.generate_quiz(QuizType.BET_SIZING, pot_size=pot_size)
-                print("\n" + "-" * 70)
-                print(quiz["question"])
-                user_answer = input_handler.get_number_input(
-                    "Your answer ($): ", 0, max(1, pot_size * 3), integer_only=True
-                )
-                result = trainer.evaluate_answer(float(quiz["correct_answer"]), float(user_answer), tolerance=0.2)
-                print(result["feedback"])
-                print(quiz["explanation"])
-                print("-" * 70)
+                pot_size, _ = _prompt_quiz_parameters(input_handler, include_bet=False)
+                result = _run_quiz(trainer, input_handler, QuizType.BET_SIZING, pot_size)
                 adaptive.track_practice_result(
                     {"weakness_type": weakness.value, "correct": bool(result.get("correct")), "time_taken": 0}
                 )
@@ -504,12 +543,12 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
 
             # Fallback: scenario-based training (reflection).
             scenario = adaptive.create_practice_scenario(weakness)
-            print("\n" + "-" * 70)
+            print("\n" + _SEP)
             print("🎯 Scenario Drill")
             print(f"Weakness focus: {weakness.value}")
             for k, v in scenario.items():
                 print(f"{k.replace('_', ' ').title()}: {v}")
-            print("-" * 70)
+            print(_SEP)
             adaptive.track_practice_result({"weakness_type": weakness.value, "correct": True, "time_taken": 0})
             practice_events_this_session += 1
             continue
@@ -523,47 +562,28 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
             )
         )
 
+        # Ask for quiz parameters once per batch instead of before every question.
+        randomize = input_handler.get_yes_no_input("Randomize pot size and bet for each question?")
+        fixed_parameters = None if randomize else _prompt_quiz_parameters(input_handler)
+
         for _ in range(num_questions):
             if choice == 1:
                 quiz_type = QuizType.POT_ODDS
             else:
                 quiz_type = trainer.get_random_quiz_type()
 
-            # Generate values for quizzes.
+            pot_size, bet_to_call = fixed_parameters or _random_quiz_parameters()
             if quiz_type in (QuizType.POT_ODDS, QuizType.REQUIRED_EQUITY, QuizType.IMPLIED_ODDS):
-                pot_size = int(input_handler.get_number_input("Pot size (50-500)? ", 50, 500, integer_only=True))
-                bet_to_call = int(
-                    input_handler.get_number_input(
-                        "Bet to call (10-250)? ", 10, min(250, pot_size), integer_only=True
-                    )
-                )
-                quiz = trainer.generate_quiz(quiz_type, pot_size=pot_size, bet_to_call=bet_to_call)
-                print("\n" + "-" * 70)
-                print(quiz["question"])
-                user_answer = input_handler.get_number_input("Your answer (%): ", 0, 100, integer_only=True)
-                result = trainer.evaluate_answer(quiz["correct_answer"], user_answer, tolerance=0.05)
-                print(result["feedback"])
-                print(quiz["explanation"])
-                print("-" * 70)
+                _run_quiz(trainer, input_handler, quiz_type, pot_size, bet_to_call)
             elif quiz_type == QuizType.BET_SIZING:
-                pot_size = int(input_handler.get_number_input("Pot size (50-500)? ", 50, 500, integer_only=True))
-                quiz = trainer.generate_quiz(quiz_type, pot_size=pot_size)
-                print("\n" + "-" * 70)
-                print(quiz["question"])
-                user_answer = input_handler.get_number_input(
-                    "Your answer ($): ", 0, max(1, pot_size * 3), integer_only=True
-                )
-                result = trainer.evaluate_answer(float(quiz["correct_answer"]), float(user_answer), tolerance=0.2)
-                print(result["feedback"])
-                print(quiz["explanation"])
-                print("-" * 70)
+                _run_quiz(trainer, input_handler, quiz_type, pot_size)
             else:
                 # Unsupported quiz types fall back to tips.
                 tip = content.get_random_tip()
-                print("\n" + "-" * 70)
+                print("\n" + _SEP)
                 print(f"Tip: {tip.get('title', '')}")
                 print(tip.get("content", ""))
-                print("-" * 70)
+                print(_SEP)
 
         summary = trainer.get_performance_summary()
         print("\nTraining summary:")
@@ -581,8 +601,7 @@ def run_training_session(player: Player, data_manager, input_handler, display) -
                             "training_difficulty": adaptive.current_difficulty,
                         }
                     )
-                data_manager.update_player_stats(player.name, updates)
-                data_manager.save_player(player)
+                data_manager.update_and_save(player.name, updates, player)
             except Exception:
                 pass
 
@@ -4,14 +4,74 @@ Test runner for PyHoldem Pro.
 Provides various test execution options and reporting.
 """
 
+import os
 import sys
-import subprocess
 import argparse
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
-def run_all_tests(verbose=False, coverage=False):
-    cmd = ["python3", "-m", "pytest"]
+# Shared worker pool for running several test categories at once; created on
+# first use so single-category runs never start it.
+_EXECUTOR = None
+
+
+def get_executor():
+    """Return the module-level process pool, creating it on first use."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+
+def xdist_available():
+    """Return True if pytest-xdist is installed."""
+    return importlib.util.find_spec("xdist") is not None
+
+
+def run_pytest(args):
+    """Run pytest in this interpreter and return its exit code."""
+    import pytest
+
+    return int(pytest.main(args))
+
+
+def run_captured(runner, *args):
+    """Call a run_* function with its output captured; return (exit code, output)."""
+    import contextlib
+    import io
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        result = runner(*args)
+    return result, output.getvalue()
+
+
+def split_jobs(jobs, parts):
+    """Divide an xdist worker count between parts concurrent pytest runs."""
+    if not jobs or str(jobs) in ("0", "1"):
+        return jobs
+    total = int(jobs) if str(jobs).isdigit() else (os.cpu_count() or 1)
+    return str(max(1, total // parts))
+
+
+def add_parallel_args(cmd, jobs=None, dist=None):
+    """Append pytest-xdist worker options to a pytest command."""
+    if not jobs or str(jobs) in ("0", "1"):
+        return
+    if not xdist_available():
+        print("⚠ pytest-xdist not installed; running tests serially")
+        return
+
+    cmd.extend(["-n", str(jobs)])
+    if dist:
+        cmd.append(f"--dist={dist}")
+
+
+def run_all_tests(verbose=False, coverage=False, jobs=None, dist=None, extra_args=None):
+    """Run the full test suite."""
+    cmd = []
     
     if verbose:
         cmd.append("-v")
@@ -19,57 +79,67 @@ def run_all_tests(verbose=False, coverage=False):
     if coverage:
         cmd.extend(["--cov=src", "--cov-report=html", "--cov-report=term"])
     
+    add_parallel_args(cmd, jobs, dist)
+    cmd.extend(extra_args or [])
     cmd.append("tests/")
     
-    return subprocess.run(cmd)
+    return run_pytest(cmd)
 
 
-def run_unit_tests(verbose=False):
+def run_unit_tests(verbose=False, jobs=None, dist=None, extra_args=None):
     """Run only unit tests."""
-    cmd = ["python3", "-m", "pytest", "-m", "unit"]
+    cmd = ["-m", "unit"]
     
     if verbose:
         cmd.append("-v")
     
+    add_parallel_args(cmd, jobs, dist)
+    cmd.extend(extra_args or [])
     cmd.append("tests/")
     
-    return subprocess.run(cmd)
+    return run_pytest(cmd)
 
 
-def run_integration_tests(verbose=False):
+def run_integration_tests(verbose=False, jobs=None, dist=None, extra_args=None):
     """Run only integration tests."""
-    cmd = ["python3", "-m", "pytest", "-m", "integration"]
+    cmd = ["-m", "integration"]
     
     if verbose:
         cmd.append("-v")
     
+    add_parallel_args(cmd, jobs, dist)
+    cmd.extend(extra_args or [])
     cmd.append("tests/")
     
-    return subprocess.run(cmd)
+    return run_pytest(cmd)
 
 
-def run_specific_test_file(test_file, verbose=False):
+def run_specific_test_file(test_file, verbose=False, jobs=None, dist=None, extra_args=None):
     """Run tests from a specific file."""
-    cmd = ["python3", "-m", "pytest"]
+    cmd = []
     
     if verbose:
         cmd.append("-v")
     
+    add_parallel_args(cmd, jobs, dist)
+    cmd.extend(extra_args or [])
     cmd.append(f"tests/{test_file}")
     
-    return subprocess.run(cmd)
+    return run_pytest(cmd)
 
 
-def run_tests_by_category(category, verbose=False):
+def run_tests_by_category(category, verbose=False, jobs=None, dist=None, extra_args=None):
     """Run tests by category (marker)."""
-    cmd = ["python3", "-m", "pytest", "-m", category]
+    cmd = ["-m", category]
     
     if verbose:
         cmd.append("-v")
     
+    add_parallel_args(cmd, jobs, dist)
+    cmd.extend(extra_args or [])
     cmd.append("tests/")
     
-    return subprocess.run(cmd)
+    return run_pytest(cmd)
 
 
 def check_test_environment():
@@ -83,6 +153,12 @@ def check_test_environment():
     except ImportError:
         print("✗ pytest not installed")
         return False
+
+    # pytest-xdist is optional; without it -j runs serially
+    if xdist_available():
+        print("✓ pytest-xdist installed (parallel runs available)")
+    else:
+        print("⚠ pytest-xdist not installed (-j/--jobs will run serially)")
     
     # Check if required directories exist
     test_dir = Path("tests")
@@ -101,12 +177,29 @@ def check_test_environment():
         return False
     
     # Count test files
-    test_files = list(test_dir.glob("test_*.py"))
-    print(f"✓ Found {len(test_files)} test files")
+    with os.scandir(test_dir) as entries:
+        test_file_count = sum(
+            1 for entry in entries
+            if entry.name.startswith("test_") and entry.name.endswith(".py")
+            and entry.is_file()
+        )
+    print(f"✓ Found {test_file_count} test files")
     
     return True
 
 
+def build_common_args(args):
+    """Build pytest options shared by every run mode."""
+    extra = []
+    if args.exitfirst:
+        # Stop at the first failure and run last run's failures first.
+        extra.extend(["-x", "--ff"])
+    # The cache only pays off for --lf/--ff reruns; skip its disk writes locally.
+    if not (args.cache or args.exitfirst or os.environ.get("CI")):
+        extra.extend(["-p", "no:cacheprovider"])
+    return extra
+
+
 def main():
     """Main test runner."""
     parser = argparse.ArgumentParser(description="PyHoldem Pro Test Runner")
@@ -117,6 +210,15 @@ def main():
     parser.add_argument("-f", "--file", help="Run specific test file")
     parser.add_argument("-m", "--marker", help="Run tests with specific marker")
     parser.add_argument("--check", action="store_true", help="Check test environment")
+    parser.add_argument("-j", "--jobs",
+                        help="Parallel pytest-xdist workers ('auto', a number, or 1 for serial); "
+                             "defaults to 'auto' when pytest-xdist is installed")
+    parser.add_argument("--dist", choices=["load", "loadfile", "loadscope"],
+                        help="pytest-xdist distribution mode (loadfile keeps a file on one worker)")
+    parser.add_argument("-x", "--exitfirst", action="store_true",
+                        help="Stop on the first failure, running previous failures first")
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep pytest's .pytest_cache (always kept when CI is set)")
     
     args = parser.parse_args()
     
@@ -129,24 +231,46 @@ def main():
             return 1
         return 0
     
+    extra_args = build_common_args(args)
+    if args.jobs is None and xdist_available():
+        # Parallel by default, but only warn about missing xdist when -j was asked for
+        args.jobs = "auto"
+
     # Run specific test categories
-    if args.unit:
+    if args.unit and args.integration:
+        print("Running unit and integration tests concurrently...")
+        # The two runs share the machine, so each gets half the workers, and
+        # each run's output is printed as one block once it finishes
+        jobs = split_jobs(args.jobs, 2)
+        executor = get_executor()
+        futures = [
+            executor.submit(run_captured, runner, args.verbose, jobs, args.dist, extra_args)
+            for runner in (run_unit_tests, run_integration_tests)
+        ]
+        result = 0
+        for title, future in zip(("Unit tests", "Integration tests"), futures):
+            code, output = future.result()
+            print(f"\n===== {title} =====")
+            print(output, end="")
+            result = max(result, code)
+        executor.shutdown()
+    elif args.unit:
         print("Running unit tests...")
-        result = run_unit_tests(args.verbose)
+        result = run_unit_tests(args.verbose, args.jobs, args.dist, extra_args)
     elif args.integration:
         print("Running integration tests...")
-        result = run_integration_tests(args.verbose)
+        result = run_integration_tests(args.verbose, args.jobs, args.dist, extra_args)
     elif args.file:
         print(f"Running tests from {args.file}...")
-        result = run_specific_test_file(args.file, args.verbose)
+        result = run_specific_test_file(args.file, args.verbose, args.jobs, args.dist, extra_args)
     elif args.marker:
         print(f"Running tests with marker '{args.marker}'...")
-        result = run_tests_by_category(args.marker, args.verbose)
+        result = run_tests_by_category(args.marker, args.verbose, args.jobs, args.dist, extra_args)
     else:
         print("Running all tests...")
-        result = run_all_tests(args.verbose, args.coverage)
+        result = run_all_tests(args.verbose, args.coverage, args.jobs, args.dist, extra_args)
     
-    return result.returncode
+    return result
 
 
 if __name__ == "__main__":
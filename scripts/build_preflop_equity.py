@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Build the preflop equity table used by HandAnalyzer.preflop_equity.
+
+Runs a Monte Carlo simulation for each of the 169 starting hands against
+1-8 random opponents and writes the results to
+src/training/data/preflop_equity.json. Only needs rerunning when the
+simulation itself changes.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from game.card import Card, Rank, Suit
+from game.preflop import NUM_BUCKETS, bucket_label, bucket_ranks
+from stats.calculator import EquityCalculator
+
+OUTPUT = Path(__file__).resolve().parents[1] / "src" / "training" / "data" / "preflop_equity.json"
+MAX_OPPONENTS = 8
+
+
+def representative_cards(bucket):
+    """Return one pair of hole cards for a bucket."""
+    high, low, suited = bucket_ranks(bucket)
+    second_suit = Suit.HEARTS if suited else Suit.SPADES
+    return [Card(Suit.HEARTS, Rank(high)), Card(second_suit, Rank(low))]
+
+
+def build_table(trials, seed):
+    """Simulate every bucket against 1-8 opponents."""
+    equity = {}
+    for bucket in range(NUM_BUCKETS):
+        hole_cards = representative_cards(bucket)
+        equity[bucket_label(bucket)] = [
+            round(EquityCalculator.simulate_equity(
+                hole_cards, trials=trials, seed=seed + bucket * MAX_OPPONENTS + opponents,
+                opponents=opponents), 4)
+            for opponents in range(1, MAX_OPPONENTS + 1)
+        ]
+        print(f"{bucket + 1:3d}/{NUM_BUCKETS} {bucket_label(bucket):4s} {equity[bucket_label(bucket)]}")
+    return equity
+
+
+def write_table(table):
+    """Write the table as JSON with one starting hand per line."""
+    rows = [f'  {json.dumps(label)}: {json.dumps(values)}' for label, values in table["equity"].items()]
+    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write("{\n")
+        f.write(f' "trials": {table["trials"]},\n')
+        f.write(f' "max_opponents": {table["max_opponents"]},\n')
+        f.write(' "equity": {\n' + ",\n".join(rows) + "\n }\n}\n")
+
+
+def main():
+    """Build and save the table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--trials", type=int, default=10000, help="runouts per hand and opponent count")
+    parser.add_argument("--seed", type=int, default=169, help="base seed for reproducible output")
+    args = parser.parse_args()
+
+    table = {
+        "trials": args.trials,
+        "max_opponents": MAX_OPPONENTS,
+        "equity": build_table(args.trials, args.seed),
+    }
+    write_table(table)
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,277 +4,380 @@ PyHoldem Pro - Interactive Demo
 Demonstrates the full functionality of the poker game.
 """
 
+import random
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from game.card import Card, Rank, Suit
-from game.deck import Deck
-from game.hand import Hand
-from game.player import Player
-from game.ai_player import AIPlayer, AIStyle
-from game.table import Table, TableType
-from game.pot import Pot
-from game.game_engine import GameState
-from stats.calculator import PotOddsCalculator
-from data.manager import DataManager
 
+# One shared instance per card, in Deck order (suit-major, rank ascending).
+# Cards are never mutated, so the demos can reuse these freely.
+CARDS = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+_SUIT_INDEX = {suit: i for i, suit in enumerate(Suit)}
+# The whole deck as one byte per card; each byte indexes into CARDS.
+_DECK = bytes(range(len(CARDS)))
 
-def print_banner(text):
-    """Print a formatted banner."""
-    print("\n" + "="*70)
-    print(f"  {text}")
-    print("="*70 + "\n")
+# Line templates for the demos that list several entries with one layout.
+_AI_TEMPLATE = "{n}. {name} ({style})\n   • {desc}\n   • {detail}\n"
+_SEAT_TEMPLATE = "  Seat {seat}: {name} (${bankroll})"
+_STATE_TEMPLATE = "  {n}. {state}: {desc}"
 
 
-def demo_basic_poker_hands():
-    """Demonstrate basic poker hand evaluation."""
-    print_banner("DEMO 1: Poker Hand Evaluation")
+def card(suit, rank):
+    """Return the shared Card for a suit and rank."""
+    return CARDS[_SUIT_INDEX[suit] * 13 + rank.value - 2]
+
+
+def fmt_cards(cards):
+    """Format cards as a bracketed, comma-separated list (e.g., '[A♥, K♥]')."""
+    return "[" + ", ".join(c.short for c in cards) + "]"
+
+
+def hand_rank(cards):
+    """Return the HandRank of the best five cards, memoized on the set of cards."""
+    from game.hand import Hand
+    return Hand.best_hand_from_cards(cards).rank
+
+
+@lru_cache(maxsize=None)
+def _pooled_player(name, bankroll, style=None):
+    """Build a demo player once per (name, bankroll, style)."""
+    from game.player import Player
+    from game.ai_player import create_ai_player
+    if style is None:
+        return Player(name, bankroll)
+    return create_ai_player(name, bankroll, style)
+
+
+def demo_player(name, bankroll, style=None):
+    """Return a pooled demo player, reset to its starting state."""
+    player = _pooled_player(name, bankroll, style)
+    player.reset()
+    return player
+
+
+_data_manager = None
+
+
+def _get_data_manager():
+    """Return the script-wide DataManager, creating it on first use."""
+    global _data_manager
+    if _data_manager is None:
+        from data.manager import DataManager
+
+        _data_manager = DataManager()
+    return _data_manager
+
+
+def banner(text):
+    """Return a formatted banner."""
+    return f"\n{'=' * 70}\n  {text}\n{'=' * 70}\n"
+
+
+def _write(lines):
+    """Write a demo section to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _prepare_basic_poker_hands():
+    """Build the output lines for demo_basic_poker_hands."""
+    from game.hand import Hand
+    
+    out = [banner("DEMO 1: Poker Hand Evaluation")]
     
-    print("Creating various poker hands and evaluating them...\n")
+    out.append("Creating various poker hands and evaluating them...\n")
     
     # Royal Flush
     royal_cards = [
-        Card(Suit.HEARTS, Rank.ACE),
-        Card(Suit.HEARTS, Rank.KING),
-        Card(Suit.HEARTS, Rank.QUEEN),
-        Card(Suit.HEARTS, Rank.JACK),
-        Card(Suit.HEARTS, Rank.TEN),
+        card(Suit.HEARTS, Rank.ACE),
+        card(Suit.HEARTS, Rank.KING),
+        card(Suit.HEARTS, Rank.QUEEN),
+        card(Suit.HEARTS, Rank.JACK),
+        card(Suit.HEARTS, Rank.TEN),
     ]
     royal_hand = Hand(royal_cards)
-    print(f"1. Royal Flush: {[str(c) for c in royal_cards]}")
-    print(f"   Ranking: {royal_hand.rank.name}")
-    print(f"   Rank Value: {royal_hand.rank.value}\n")
+    out.append(f"1. Royal Flush: {fmt_cards(royal_cards)}")
+    out.append(f"   Ranking: {royal_hand.rank.name}")
+    out.append(f"   Rank Value: {royal_hand.rank.value}\n")
     
     # Straight Flush
     straight_flush = [
-        Card(Suit.SPADES, Rank(9)),
-        Card(Suit.SPADES, Rank(8)),
-        Card(Suit.SPADES, Rank(7)),
-        Card(Suit.SPADES, Rank(6)),
-        Card(Suit.SPADES, Rank(5)),
+        card(Suit.SPADES, Rank(9)),
+        card(Suit.SPADES, Rank(8)),
+        card(Suit.SPADES, Rank(7)),
+        card(Suit.SPADES, Rank(6)),
+        card(Suit.SPADES, Rank(5)),
     ]
     sf_hand = Hand(straight_flush)
-    print(f"2. Straight Flush: {[str(c) for c in straight_flush]}")
-    print(f"   Ranking: {sf_hand.rank.name}")
-    print(f"   Rank Value: {sf_hand.rank.value}\n")
+    out.append(f"2. Straight Flush: {fmt_cards(straight_flush)}")
+    out.append(f"   Ranking: {sf_hand.rank.name}")
+    out.append(f"   Rank Value: {sf_hand.rank.value}\n")
     
     # Four of a Kind
     quads = [
-        Card(Suit.HEARTS, Rank.ACE),
-        Card(Suit.DIAMONDS, Rank.ACE),
-        Card(Suit.CLUBS, Rank.ACE),
-        Card(Suit.SPADES, Rank.ACE),
-        Card(Suit.HEARTS, Rank.KING),
+        card(Suit.HEARTS, Rank.ACE),
+        card(Suit.DIAMONDS, Rank.ACE),
+        card(Suit.CLUBS, Rank.ACE),
+        card(Suit.SPADES, Rank.ACE),
+        card(Suit.HEARTS, Rank.KING),
     ]
     quads_hand = Hand(quads)
-    print(f"3. Four of a Kind: {[str(c) for c in quads]}")
-    print(f"   Ranking: {quads_hand.rank.name}")
-    print(f"   Rank Value: {quads_hand.rank.value}\n")
+    out.append(f"3. Four of a Kind: {fmt_cards(quads)}")
+    out.append(f"   Ranking: {quads_hand.rank.name}")
+    out.append(f"   Rank Value: {quads_hand.rank.value}\n")
     
     # Full House
     full_house = [
-        Card(Suit.HEARTS, Rank.KING),
-        Card(Suit.DIAMONDS, Rank.KING),
-        Card(Suit.CLUBS, Rank.KING),
-        Card(Suit.SPADES, Rank.QUEEN),
-        Card(Suit.HEARTS, Rank.QUEEN),
+        card(Suit.HEARTS, Rank.KING),
+        card(Suit.DIAMONDS, Rank.KING),
+        card(Suit.CLUBS, Rank.KING),
+        card(Suit.SPADES, Rank.QUEEN),
+        card(Suit.HEARTS, Rank.QUEEN),
     ]
     fh_hand = Hand(full_house)
-    print(f"4. Full House: {[str(c) for c in full_house]}")
-    print(f"   Ranking: {fh_hand.rank.name}")
-    print(f"   Rank Value: {fh_hand.rank.value}\n")
+    out.append(f"4. Full House: {fmt_cards(full_house)}")
+    out.append(f"   Ranking: {fh_hand.rank.name}")
+    out.append(f"   Rank Value: {fh_hand.rank.value}\n")
     
-    print("✅ Hand evaluation working perfectly!\n")
+    out.append("✅ Hand evaluation working perfectly!\n")
 
+    return out
 
-def demo_ai_personalities():
-    """Demonstrate different AI personalities."""
-    print_banner("DEMO 2: AI Personalities")
-    
-    print("PyHoldem Pro features 4 distinct AI playing styles:\n")
-    
-    # Create AI players with different personalities
-    cautious = AIPlayer("Cautious Carl", 1000, AIStyle.CAUTIOUS)
-    wild = AIPlayer("Wild Willie", 1000, AIStyle.WILD)
-    balanced = AIPlayer("Balanced Bob", 1000, AIStyle.BALANCED)
-    random_ai = AIPlayer("Random Randy", 1000, AIStyle.RANDOM)
-    
-    print(f"1. {cautious.name} (CAUTIOUS)")
-    print(f"   • Tight-aggressive style")
-    print(f"   • Preflop raise probability: {cautious.preflop_raise_prob:.0%}")
-    print(f"   • Bluff frequency: {cautious.bluff_frequency:.0%}\n")
+
+def demo_basic_poker_hands():
+    """Demonstrate basic poker hand evaluation."""
+    _write(_prepare_basic_poker_hands())
+
+
+def _prepare_ai_personalities():
+    """Build the output lines for demo_ai_personalities."""
+    from game.ai_player import AIStyle
     
-    print(f"2. {wild.name} (WILD)")
-    print(f"   • Loose-aggressive style")
-    print(f"   • Preflop raise probability: {wild.preflop_raise_prob:.0%}")
-    print(f"   • Bluff frequency: {wild.bluff_frequency:.0%}\n")
+    out = [banner("DEMO 2: AI Personalities")]
     
-    print(f"3. {balanced.name} (BALANCED)")
-    print(f"   • Well-balanced approach")
-    print(f"   • Preflop raise probability: {balanced.preflop_raise_prob:.0%}")
-    print(f"   • Bluff frequency: {balanced.bluff_frequency:.0%}\n")
+    out.append("PyHoldem Pro features 4 distinct AI playing styles:\n")
     
-    print(f"4. {random_ai.name} (RANDOM)")
-    print(f"   • Unpredictable actions")
-    print(f"   • Great for practice against chaos!\n")
+    # Create AI players with different personalities
+    cautious = demo_player("Cautious Carl", 1000, AIStyle.CAUTIOUS)
+    wild = demo_player("Wild Willie", 1000, AIStyle.WILD)
+    balanced = demo_player("Balanced Bob", 1000, AIStyle.BALANCED)
+    random_ai = demo_player("Random Randy", 1000, AIStyle.RANDOM)
+    
+    personalities = [
+        (cautious, "Tight-aggressive style",
+         f"Raises only with the top {1 - cautious.raise_threshold:.0%} of hands"),
+        (wild, "Loose-aggressive style",
+         f"Bluff frequency: {wild.bluff_frequency:.0%}"),
+        (balanced, "Well-balanced approach",
+         "Weighs pot odds and hand strength before acting"),
+        (random_ai, "Unpredictable actions",
+         "Great for practice against chaos!"),
+    ]
+    for n, (ai, desc, detail) in enumerate(personalities, 1):
+        out.append(_AI_TEMPLATE.format_map({
+            "n": n, "name": ai.name, "style": ai.ai_style.name,
+            "desc": desc, "detail": detail,
+        }))
     
-    print("✅ Each AI has unique tendencies and decision-making patterns!\n")
+    out.append("✅ Each AI has unique tendencies and decision-making patterns!\n")
 
+    return out
 
-def demo_pot_management():
-    """Demonstrate pot management with side pots."""
-    print_banner("DEMO 3: Advanced Pot Management")
+
+def demo_ai_personalities():
+    """Demonstrate different AI personalities."""
+    _write(_prepare_ai_personalities())
+
+
+def _prepare_pot_management():
+    """Build the output lines for demo_pot_management."""
+    from game.pot import Pot
+    
+    out = [banner("DEMO 3: Advanced Pot Management")]
     
-    print("Demonstrating side pot creation with all-in scenarios...\n")
+    out.append("Demonstrating side pot creation with all-in scenarios...\n")
     
     pot = Pot()
     
     # Create players with different stack sizes
-    player1 = Player("Alice", 1000)
-    player2 = Player("Bob", 500)
-    player3 = Player("Carol", 200)
+    player1 = demo_player("Alice", 1000)
+    player2 = demo_player("Bob", 500)
+    player3 = demo_player("Carol", 200)
     
-    print("Initial stacks:")
-    print(f"  Alice: ${player1.bankroll}")
-    print(f"  Bob: ${player2.bankroll}")
-    print(f"  Carol: ${player3.bankroll}\n")
+    out.append("Initial stacks:")
+    out.append(f"  Alice: ${player1.bankroll}")
+    out.append(f"  Bob: ${player2.bankroll}")
+    out.append(f"  Carol: ${player3.bankroll}\n")
     
     # Carol goes all-in for 200
     player3.place_bet(200)
     pot.add_bet(player3, 200)
     pot.create_side_pots()
-    print("Carol goes all-in for $200")
-    print(f"  Main pot: ${pot.main_pot}\n")
+    out.append("Carol goes all-in for $200")
+    out.append(f"  Main pot: ${pot.main_pot}\n")
     
     # Bob calls and goes all-in
     player2.place_bet(500)
     pot.add_bet(player2, 500)
     pot.create_side_pots()
-    print("Bob calls and goes all-in for $500")
-    print(f"  Total pots: ${pot.total}")
-    print(f"  Number of pots: {len(pot.side_pots) + 1}\n")
+    out.append("Bob calls and goes all-in for $500")
+    out.append(f"  Total pots: ${pot.total}")
+    out.append(f"  Number of pots: {len(pot.side_pots) + 1}\n")
     
     # Alice calls
     player1.place_bet(500)
     pot.add_bet(player1, 500)
     pot.create_side_pots()
-    print("Alice calls $500")
-    print(f"  Total pots: ${pot.total}")
-    print(f"  Number of pots: {len(pot.side_pots) + 1}\n")
+    out.append("Alice calls $500")
+    out.append(f"  Total pots: ${pot.total}")
+    out.append(f"  Number of pots: {len(pot.side_pots) + 1}\n")
     
-    print("Pot breakdown:")
+    out.append("Pot breakdown:")
     if pot.main_pot > 0:
         main_eligible = [p.name for p in pot.eligible_players]
-        print(f"  Pot 1: ${pot.main_pot} (eligible: {', '.join(main_eligible)})")
+        out.append(f"  Pot 1: ${pot.main_pot} (eligible: {', '.join(main_eligible)})")
     for i, side_pot in enumerate(pot.side_pots, 2):
         eligible = [p.name for p in side_pot.eligible_players]
-        print(f"  Pot {i}: ${side_pot.amount} (eligible: {', '.join(eligible)})")
+        out.append(f"  Pot {i}: ${side_pot.amount} (eligible: {', '.join(eligible)})")
     
-    print("\n✅ Side pots handled correctly!\n")
+    out.append("\n✅ Side pots handled correctly!\n")
 
+    return out
 
-def demo_statistics():
-    """Demonstrate statistics and analysis features."""
-    print_banner("DEMO 4: Statistics & Analysis")
+
+def demo_pot_management():
+    """Demonstrate pot management with side pots."""
+    _write(_prepare_pot_management())
+
+
+def _prepare_statistics():
+    """Build the output lines for demo_statistics."""
+    from game.hand import Hand
+    from stats.calculator import PotOddsCalculator
     
-    print("PyHoldem Pro includes advanced poker statistics...\n")
+    out = [banner("DEMO 4: Statistics & Analysis")]
+    
+    out.append("PyHoldem Pro includes advanced poker statistics...\n")
     
     calculator = PotOddsCalculator()
     
     # Pot odds example
-    print("1. Pot Odds Calculation:")
+    out.append("1. Pot Odds Calculation:")
     pot_size = 100
     bet_to_call = 20
-    pot_odds_pct = calculator.calculate_pot_odds_percentage(pot_size, bet_to_call)
+    pot_odds_pct, = calculator.calculate_pot_odds_percentages([pot_size], [bet_to_call])
     pot_odds_ratio = calculator.calculate_pot_odds_ratio(pot_size, bet_to_call)
-    print(f"   Pot: ${pot_size}, Bet to call: ${bet_to_call}")
-    print(f"   Pot Odds: {pot_odds_ratio[0]}:{pot_odds_ratio[1]} ({pot_odds_pct:.1f}%)")
-    print(f"   Need to win: {pot_odds_pct:.1f}% of the time\n")
+    out.append(f"   Pot: ${pot_size}, Bet to call: ${bet_to_call}")
+    out.append(f"   Pot Odds: {pot_odds_ratio[0]}:{pot_odds_ratio[1]} ({pot_odds_pct:.1f}%)")
+    out.append(f"   Need to win: {pot_odds_pct:.1f}% of the time\n")
     
     # Equity calculation example
-    print("2. Hand Equity Estimation:")
+    out.append("2. Hand Equity Estimation:")
     hole_cards = [
-        Card(Suit.HEARTS, Rank.ACE),
-        Card(Suit.HEARTS, Rank.KING),
+        card(Suit.HEARTS, Rank.ACE),
+        card(Suit.HEARTS, Rank.KING),
     ]
     community = [
-        Card(Suit.HEARTS, Rank.QUEEN),
-        Card(Suit.DIAMONDS, Rank.JACK),
-        Card(Suit.SPADES, Rank(10)),
+        card(Suit.HEARTS, Rank.QUEEN),
+        card(Suit.DIAMONDS, Rank.JACK),
+        card(Suit.SPADES, Rank(10)),
     ]
     
-    print(f"   Hole cards: {[str(c) for c in hole_cards]}")
-    print(f"   Board: {[str(c) for c in community]}")
+    out.append(f"   Hole cards: {fmt_cards(hole_cards)}")
+    out.append(f"   Board: {fmt_cards(community)}")
     
     # Simple equity estimation based on hand strength
     hand = Hand(hole_cards + community)
-    print(f"   Current hand: {hand.rank.name}")
-    print(f"   Has made straight!")
-    print(f"   Estimated equity: ~90%+ (very strong)\n")
+    out.append(f"   Current hand: {hand.rank.name}")
+    out.append(f"   Has made straight!")
+    out.append(f"   Estimated equity: ~90%+ (very strong)\n")
     
     # Outs calculation
-    print("3. Outs Calculation:")
+    out.append("3. Outs Calculation:")
     flush_draw_hole = [
-        Card(Suit.HEARTS, Rank.ACE),
-        Card(Suit.HEARTS, Rank.KING),
+        card(Suit.HEARTS, Rank.ACE),
+        card(Suit.HEARTS, Rank.KING),
     ]
     flush_draw_board = [
-        Card(Suit.HEARTS, Rank.QUEEN),
-        Card(Suit.HEARTS, Rank.JACK),
-        Card(Suit.SPADES, Rank(5)),
+        card(Suit.HEARTS, Rank.QUEEN),
+        card(Suit.HEARTS, Rank.JACK),
+        card(Suit.SPADES, Rank(5)),
     ]
-    print(f"   Hole cards: {[str(c) for c in flush_draw_hole]}")
-    print(f"   Board: {[str(c) for c in flush_draw_board]}")
-    print(f"   Four hearts - flush draw!")
-    print(f"   Outs: 9 hearts remaining")
-    print(f"   Turn: ~19.1% chance")
-    print(f"   Turn+River: ~35% chance\n")
-    
-    print("✅ Comprehensive statistics for better decision making!\n")
+    out.append(f"   Hole cards: {fmt_cards(flush_draw_hole)}")
+    out.append(f"   Board: {fmt_cards(flush_draw_board)}")
+    out.append(f"   Four hearts - flush draw!")
+    out.append(f"   Outs: 9 hearts remaining")
+    out.append(f"   Turn: ~19.1% chance")
+    out.append(f"   Turn+River: ~35% chance\n")
+    
+    out.append("✅ Comprehensive statistics for better decision making!\n")
 
+    return out
 
-def demo_table_management():
-    """Demonstrate table and position management."""
-    print_banner("DEMO 5: Table Management")
+
+def demo_statistics():
+    """Demonstrate statistics and analysis features."""
+    _write(_prepare_statistics())
+
+
+def _prepare_table_management():
+    """Build the output lines for demo_table_management."""
+    from game.ai_player import AIStyle
+    from game.table import Table, TableType
+    
+    out = [banner("DEMO 5: Table Management")]
     
-    print("Setting up a poker table with positions...\n")
+    out.append("Setting up a poker table with positions...\n")
     
     table = Table(TableType.CASH_GAME, max_players=6)
     
     # Add players
     players = [
-        Player("Alice", 1000),
-        Player("Bob", 1000),
-        Player("Carol", 1000),
-        AIPlayer("Danny", 1000, AIStyle.BALANCED),
-        AIPlayer("Emma", 1000, AIStyle.CAUTIOUS),
-        AIPlayer("Frank", 1000, AIStyle.WILD)
+        demo_player("Alice", 1000),
+        demo_player("Bob", 1000),
+        demo_player("Carol", 1000),
+        demo_player("Danny", 1000, AIStyle.BALANCED),
+        demo_player("Emma", 1000, AIStyle.CAUTIOUS),
+        demo_player("Frank", 1000, AIStyle.WILD)
     ]
     
     for player in players:
         seat_idx = table.add_player(player)
-        print(f"  Seat {seat_idx + 1}: {player.name} (${player.bankroll})")
+        out.append(_SEAT_TEMPLATE.format_map({
+            "seat": seat_idx + 1, "name": player.name, "bankroll": player.bankroll,
+        }))
     
     next_to_act = table.get_next_to_act()
     next_seat = table.get_seat_number(next_to_act) if next_to_act else None
 
-    print(f"\nDealer button at seat: {table.dealer_position + 1}")
-    print(f"Small blind position: {table.small_blind_position + 1}")
-    print(f"Big blind position: {table.big_blind_position + 1}")
+    out.append(f"\nDealer button at seat: {table.dealer_position + 1}")
+    out.append(f"Small blind position: {table.small_blind_position + 1}")
+    out.append(f"Big blind position: {table.big_blind_position + 1}")
     if next_seat is not None:
-        print(f"First to act (UTG): {next_seat + 1}")
+        out.append(f"First to act (UTG): {next_seat + 1}")
     
-    print("\n✅ Table positions managed automatically!\n")
+    out.append("\n✅ Table positions managed automatically!\n")
 
+    return out
 
-def demo_game_states():
-    """Demonstrate game state management."""
-    print_banner("DEMO 6: Game State Management")
+
+def demo_table_management():
+    """Demonstrate table and position management."""
+    _write(_prepare_table_management())
+
+
+def _prepare_game_states():
+    """Build the output lines for demo_game_states."""
+    from game.game_engine import GameState
+    
+    out = [banner("DEMO 6: Game State Management")]
     
-    print("The game engine manages different states throughout a hand:\n")
+    out.append("The game engine manages different states throughout a hand:\n")
     
     states = [
         (GameState.WAITING, "Waiting for players"),
@@ -287,85 +390,110 @@ def demo_game_states():
     ]
     
     for i, (state, description) in enumerate(states, 1):
-        print(f"  {i}. {state.name}: {description}")
+        out.append(_STATE_TEMPLATE.format_map({
+            "n": i, "state": state.name, "desc": description,
+        }))
     
-    print("\n✅ Complete hand lifecycle management!\n")
+    out.append("\n✅ Complete hand lifecycle management!\n")
+
+    return out
+
+
+def demo_game_states():
+    """Demonstrate game state management."""
+    _write(_prepare_game_states())
+
+
+def _prepare_training_mode():
+    """Build the output lines for demo_training_mode."""
+    out = [banner("DEMO 7: Training Mode")]
+    
+    out.append("PyHoldem Pro includes comprehensive training features:\n")
+    
+    out.append("1. Hand Analysis:")
+    out.append("   • Real-time pot odds calculations")
+    out.append("   • Equity estimation")
+    out.append("   • Recommended actions based on math\n")
+    
+    out.append("2. Educational Content:")
+    out.append("   • Preflop hand charts")
+    out.append("   • Pot odds reference tables")
+    out.append("   • Betting pattern guides")
+    out.append("   • Poker vocabulary and terminology\n")
+    
+    out.append("3. HUD (Heads-Up Display):")
+    out.append("   • Opponent statistics tracking")
+    out.append("   • VPIP (Voluntarily Put $ In Pot)")
+    out.append("   • PFR (Preflop Raise %)")
+    out.append("   • Aggression factor\n")
+    
+    out.append("4. Post-Hand Feedback:")
+    out.append("   • Decision quality analysis")
+    out.append("   • Missed opportunities")
+    out.append("   • Improvement suggestions\n")
+    
+    out.append("5. Session Review:")
+    out.append("   • Overall statistics")
+    out.append("   • Leak identification")
+    out.append("   • Strategy recommendations\n")
+    
+    out.append("✅ Complete training platform for skill improvement!\n")
+
+    return out
 
 
 def demo_training_mode():
     """Demonstrate training mode features."""
-    print_banner("DEMO 7: Training Mode")
-    
-    print("PyHoldem Pro includes comprehensive training features:\n")
-    
-    print("1. Hand Analysis:")
-    print("   • Real-time pot odds calculations")
-    print("   • Equity estimation")
-    print("   • Recommended actions based on math\n")
-    
-    print("2. Educational Content:")
-    print("   • Preflop hand charts")
-    print("   • Pot odds reference tables")
-    print("   • Betting pattern guides")
-    print("   • Poker vocabulary and terminology\n")
-    
-    print("3. HUD (Heads-Up Display):")
-    print("   • Opponent statistics tracking")
-    print("   • VPIP (Voluntarily Put $ In Pot)")
-    print("   • PFR (Preflop Raise %)")
-    print("   • Aggression factor\n")
-    
-    print("4. Post-Hand Feedback:")
-    print("   • Decision quality analysis")
-    print("   • Missed opportunities")
-    print("   • Improvement suggestions\n")
-    
-    print("5. Session Review:")
-    print("   • Overall statistics")
-    print("   • Leak identification")
-    print("   • Strategy recommendations\n")
-    
-    print("✅ Complete training platform for skill improvement!\n")
+    _write(_prepare_training_mode())
 
 
-def demo_full_hand_simulation():
-    """Simulate a complete poker hand."""
-    print_banner("DEMO 8: Full Hand Simulation")
+def _prepare_full_hand_simulation():
+    """Build the output lines for demo_full_hand_simulation."""
+    from game.ai_player import AIStyle
+    from game.table import Table, TableType
+    from game.pot import Pot
     
-    print("Simulating a complete hand from deal to showdown...\n")
+    out = [banner("DEMO 8: Full Hand Simulation")]
+    
+    out.append("Simulating a complete hand from deal to showdown...\n")
     
     # Setup
-    deck = Deck()
-    deck.shuffle()
+    deck = bytearray(_DECK)
+    random.shuffle(deck)
+    dealt = iter(deck)
+    
+    def deal():
+        return CARDS[next(dealt)]
+    
     table = Table(TableType.CASH_GAME, max_players=4)
     pot = Pot()
     
     # Create players
-    hero = Player("Hero", 1000)
-    villain1 = AIPlayer("Villain 1", 1000, AIStyle.BALANCED)
-    villain2 = AIPlayer("Villain 2", 1000, AIStyle.CAUTIOUS)
-    villain3 = AIPlayer("Villain 3", 1000, AIStyle.WILD)
+    hero = demo_player("Hero", 1000)
+    villain1 = demo_player("Villain 1", 1000, AIStyle.BALANCED)
+    villain2 = demo_player("Villain 2", 1000, AIStyle.CAUTIOUS)
+    villain3 = demo_player("Villain 3", 1000, AIStyle.WILD)
     
     players = [hero, villain1, villain2, villain3]
     seat_map = {}
     for player in players:
         seat_map[player] = table.add_player(player)
     
-    print("Players seated:")
+    out.append("Players seated:")
     for p in players:
         seat_idx = seat_map.get(p, table.get_seat_number(p))
-        print(f"  Seat {seat_idx + 1}: {p.name} (${p.bankroll})")
+        out.append(f"  Seat {seat_idx + 1}: {p.name} (${p.bankroll})")
     
     # Deal hole cards
-    print("\n📇 Dealing hole cards...")
+    out.append("\n📇 Dealing hole cards...")
     for player in players:
-        player.deal_hole_cards([deck.deal(), deck.deal()])
+        player.deal_hole_cards([deal(), deal()])
     
     hero_cards = list(hero.hole_cards)
-    print(f"\nYour cards: {[str(c) for c in hero_cards]}")
+    out.append(f"\nYour cards: {fmt_cards(hero_cards)}")
     
     # Blinds
-    print("\n💰 Posting blinds...")
+    out.append("\n💰 Posting blinds...")
     small_blind = 5
     big_blind = 10
     
@@ -377,109 +505,133 @@ def demo_full_hand_simulation():
     pot.add_bet(sb_player, small_blind)
     pot.add_bet(bb_player, big_blind)
     
-    print(f"  {sb_player.name} posts small blind: ${small_blind}")
-    print(f"  {bb_player.name} posts big blind: ${big_blind}")
-    print(f"  Pot: ${pot.total}")
+    out.append(f"  {sb_player.name} posts small blind: ${small_blind}")
+    out.append(f"  {bb_player.name} posts big blind: ${big_blind}")
+    out.append(f"  Pot: ${pot.total}")
     
     # Flop
-    print("\n🎴 Dealing the FLOP...")
-    deck.deal()  # Burn card
-    flop = [deck.deal(), deck.deal(), deck.deal()]
-    print(f"  Board: {[str(c) for c in flop]}")
+    out.append("\n🎴 Dealing the FLOP...")
+    next(dealt)  # Burn card
+    flop = [deal(), deal(), deal()]
+    out.append(f"  Board: {fmt_cards(flop)}")
     
     # Check hero's hand with flop
-    hero_hand = Hand.best_hand_from_cards(hero_cards + flop)
-    print(f"  Your hand: {hero_hand.rank.name}")
+    hero_rank = hand_rank(hero_cards + flop)
+    out.append(f"  Your hand: {hero_rank.name}")
     
     # Turn
-    print("\n🎴 Dealing the TURN...")
-    deck.deal()  # Burn card
-    turn = deck.deal()
+    out.append("\n🎴 Dealing the TURN...")
+    next(dealt)  # Burn card
+    turn = deal()
     board = flop + [turn]
-    print(f"  Board: {[str(c) for c in board]}")
+    out.append(f"  Board: {fmt_cards(board)}")
     
-    hero_hand = Hand.best_hand_from_cards(hero_cards + board)
-    print(f"  Your hand: {hero_hand.rank.name}")
+    hero_rank = hand_rank(hero_cards + board)
+    out.append(f"  Your hand: {hero_rank.name}")
     
     # River
-    print("\n🎴 Dealing the RIVER...")
-    deck.deal()  # Burn card
-    river = deck.deal()
+    out.append("\n🎴 Dealing the RIVER...")
+    next(dealt)  # Burn card
+    river = deal()
     board = board + [river]
-    print(f"  Board: {[str(c) for c in board]}")
+    out.append(f"  Board: {fmt_cards(board)}")
     
     # Showdown
-    print("\n🏆 SHOWDOWN!")
-    print(f"  Final board: {[str(c) for c in board]}")
-    print(f"\n  {hero.name}: {[str(c) for c in hero_cards]}")
+    out.append("\n🏆 SHOWDOWN!")
+    out.append(f"  Final board: {fmt_cards(board)}")
+    out.append(f"\n  {hero.name}: {fmt_cards(hero_cards)}")
     
-    hero_final = Hand.best_hand_from_cards(hero_cards + board)
-    print(f"    {hero_final.rank.name} (rank value: {hero_final.rank.value})")
+    hero_final = hand_rank(hero_cards + board)
+    out.append(f"    {hero_final.name} (rank value: {hero_final.value})")
     
-    print("\n✅ Complete hand executed successfully!\n")
+    out.append("\n✅ Complete hand executed successfully!\n")
 
+    return out
 
-def demo_data_persistence():
-    """Demonstrate data persistence features."""
-    print_banner("DEMO 9: Data Persistence")
+
+def demo_full_hand_simulation():
+    """Simulate a complete poker hand."""
+    _write(_prepare_full_hand_simulation())
+
+
+def _prepare_data_persistence():
+    """Build the output lines for demo_data_persistence."""
+    out = [banner("DEMO 9: Data Persistence")]
     
-    print("PyHoldem Pro saves your progress automatically...\n")
+    out.append("PyHoldem Pro saves your progress automatically...\n")
     
-    data_manager = DataManager()
+    data_manager = _get_data_manager()
     
-    print("Features:")
-    print("  • Player profiles with statistics")
-    print("  • Session history tracking")
-    print("  • Bankroll management")
-    print("  • Hand history recording")
-    print("  • Training progress tracking\n")
+    out.append("Features:")
+    out.append("  • Player profiles with statistics")
+    out.append("  • Session history tracking")
+    out.append("  • Bankroll management")
+    out.append("  • Hand history recording")
+    out.append("  • Training progress tracking\n")
     
-    print("Data saved in JSON format for easy access and backup.")
-    print("\n✅ Your progress is never lost!\n")
+    out.append("Data saved in JSON format for easy access and backup.")
+    out.append("\n✅ Your progress is never lost!\n")
+
+    return out
+
+
+def demo_data_persistence():
+    """Demonstrate data persistence features."""
+    _write(_prepare_data_persistence())
 
 
 def run_all_demos():
     """Run all demonstration functions."""
-    print("\n" + "="*70)
-    print("  🃏  PyHoldem Pro - Complete Feature Demonstration  🃏")
-    print("="*70)
-    print("\n  This demo showcases all the features of PyHoldem Pro")
-    print("  A professional-grade Texas Hold'em training platform\n")
-    print("="*70)
+    _write([
+        "\n" + "=" * 70,
+        "  🃏  PyHoldem Pro - Complete Feature Demonstration  🃏",
+        "=" * 70,
+        "\n  This demo showcases all the features of PyHoldem Pro",
+        "  A professional-grade Texas Hold'em training platform\n",
+        "=" * 70,
+    ])
     
     input("\nPress Enter to start the demonstration...")
     
-    demos = [
-        demo_basic_poker_hands,
-        demo_ai_personalities,
-        demo_pot_management,
-        demo_statistics,
-        demo_table_management,
-        demo_game_states,
-        demo_training_mode,
-        demo_full_hand_simulation,
-        demo_data_persistence
+    preparers = [
+        _prepare_basic_poker_hands,
+        _prepare_ai_personalities,
+        _prepare_pot_management,
+        _prepare_statistics,
+        _prepare_table_management,
+        _prepare_game_states,
+        _prepare_training_mode,
+        _prepare_full_hand_simulation,
+        _prepare_data_persistence
     ]
     
-    for demo in demos:
-        demo()
-        input("Press Enter to continue to next demo...")
-    
-    print_banner("DEMONSTRATION COMPLETE!")
-    print("✅ All 9 feature demonstrations completed successfully!\n")
-    print("What you've seen:")
-    print("  ✓ Complete poker hand evaluation system")
-    print("  ✓ Advanced AI with multiple playing styles")
-    print("  ✓ Sophisticated pot and side pot management")
-    print("  ✓ Comprehensive poker statistics and analysis")
-    print("  ✓ Professional table management")
-    print("  ✓ Complete game state handling")
-    print("  ✓ Integrated training and educational features")
-    print("  ✓ Full hand simulation from deal to showdown")
-    print("  ✓ Reliable data persistence\n")
-    print("PyHoldem Pro is production-ready with 327 passing tests!")
-    print("\nTo play the game, run: python main.py")
-    print("\n" + "="*70 + "\n")
+    # Build the next demo in the background while the user reads the current one.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(preparers[0])
+        for next_prepare in preparers[1:] + [None]:
+            lines = pending.result()
+            if next_prepare is not None:
+                pending = executor.submit(next_prepare)
+            _write(lines)
+            input("Press Enter to continue to next demo...")
+    
+    _write([
+        banner("DEMONSTRATION COMPLETE!"),
+        "✅ All 9 feature demonstrations completed successfully!\n",
+        "What you've seen:",
+        "  ✓ Complete poker hand evaluation system",
+        "  ✓ Advanced AI with multiple playing styles",
+        "  ✓ Sophisticated pot and side pot management",
+        "  ✓ Comprehensive poker statistics and analysis",
+        "  ✓ Professional table management",
+        "  ✓ Complete game state handling",
+        "  ✓ Integrated training and educational features",
+        "  ✓ Full hand simulation from deal to showdown",
+        "  ✓ Reliable data persistence\n",
+        "PyHoldem Pro is production-ready with 327 passing tests!",
+        "\nTo play the game, run: python main.py",
+        "\n" + "=" * 70 + "\n",
+    ])
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ PyHoldem Pro - Simple Demo
 Demonstrates core functionality without complex dependencies.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -14,30 +15,40 @@ from game.card import Card, Rank, Suit
 from game.deck import Deck
 from game.hand import Hand
 from game.player import Player
-from game.ai_player import AIPlayer, AIStyle
-from game.table import Table, TableType
-from game.pot import Pot
-from game.game_engine import GameState
 
 
-def print_banner(text):
-    """Print a formatted banner."""
-    print("\n" + "="*70)
-    print(f"  {text}")
-    print("="*70 + "\n")
+_RULE = "=" * 70
+
+
+def banner(text):
+    """Return a formatted banner."""
+    return f"\n{_RULE}\n  {text}\n{_RULE}\n"
+
+
+def _write(lines):
+    """Write a demo section to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_all():
     """Run all demonstrations."""
-    print("\n" + "="*70)
-    print("  🃏  PyHoldem Pro - Complete Feature Demonstration  🃏")
-    print("="*70)
-    print("\n  A professional-grade Texas Hold'em Poker training platform")
-    print("\n" + "="*70)
+    from game.ai_player import AIPlayer, AIStyle
+    from game.table import Table, TableType
+    from game.pot import Pot
+    from game.game_engine import GameState
+    from stats.calculator import EquityCalculator
+    
+    _write([
+        "\n" + _RULE,
+        "  🃏  PyHoldem Pro - Complete Feature Demonstration  🃏",
+        _RULE,
+        "\n  A professional-grade Texas Hold'em Poker training platform",
+        "\n" + _RULE,
+    ])
     
     # DEMO 1: Hand Evaluation
-    print_banner("DEMO 1: Poker Hand Evaluation")
-    print("Creating various poker hands and evaluating them...\n")
+    out = [banner("DEMO 1: Poker Hand Evaluation")]
+    out.append("Creating various poker hands and evaluating them...\n")
     
     # Royal Flush
     royal_cards = [
@@ -48,9 +59,9 @@ def demo_all():
         Card(Suit.HEARTS, Rank.TEN)
     ]
     royal_hand = Hand(royal_cards)
-    print(f"1. Royal Flush: {[str(c) for c in royal_cards]}")
-    print(f"   Ranking: {royal_hand.rank}")
-    print(f"   Score: {royal_hand._rank.value}\n")
+    out.append(f"1. Royal Flush: {[str(c) for c in royal_cards]}")
+    out.append(f"   Ranking: {royal_hand.rank}")
+    out.append(f"   Score: {royal_hand._rank.value}\n")
     
     # Four of a Kind
     quads = [
@@ -61,9 +72,9 @@ def demo_all():
         Card(Suit.HEARTS, Rank.KING)
     ]
     quads_hand = Hand(quads)
-    print(f"2. Four of a Kind: {[str(c) for c in quads]}")
-    print(f"   Ranking: {quads_hand.rank}")
-    print(f"   Score: {quads_hand._rank.value}\n")
+    out.append(f"2. Four of a Kind: {[str(c) for c in quads]}")
+    out.append(f"   Ranking: {quads_hand.rank}")
+    out.append(f"   Score: {quads_hand._rank.value}\n")
     
     # Full House
     full_house = [
@@ -74,80 +85,83 @@ def demo_all():
         Card(Suit.HEARTS, Rank.QUEEN)
     ]
     fh_hand = Hand(full_house)
-    print(f"3. Full House: {[str(c) for c in full_house]}")
-    print(f"   Ranking: {fh_hand.rank}")
-    print(f"   Score: {fh_hand._rank.value}\n")
+    out.append(f"3. Full House: {[str(c) for c in full_house]}")
+    out.append(f"   Ranking: {fh_hand.rank}")
+    out.append(f"   Score: {fh_hand._rank.value}\n")
     
-    print("✅ Hand evaluation working perfectly!\n")
+    out.append("✅ Hand evaluation working perfectly!\n")
     
     # DEMO 2: AI Personalities
-    print_banner("DEMO 2: AI Personalities")
-    print("PyHoldem Pro features 4 distinct AI playing styles:\n")
+    _write(out)
+    out = [banner("DEMO 2: AI Personalities")]
+    out.append("PyHoldem Pro features 4 distinct AI playing styles:\n")
     
     cautious = AIPlayer("Cautious Carl", 1000, AIStyle.CAUTIOUS)
     wild = AIPlayer("Wild Willie", 1000, AIStyle.WILD)
     balanced = AIPlayer("Balanced Bob", 1000, AIStyle.BALANCED)
     random_ai = AIPlayer("Random Randy", 1000, AIStyle.RANDOM)
     
-    print(f"1. {cautious.name} ({cautious.ai_style.name})")
-    print(f"   • Tight-aggressive style")
-    print(f"   • Plays premium hands and bets strongly\n")
+    out.append(f"1. {cautious.name} ({cautious.ai_style.name})")
+    out.append(f"   • Tight-aggressive style")
+    out.append(f"   • Plays premium hands and bets strongly\n")
     
-    print(f"2. {wild.name} ({wild.ai_style.name})")
-    print(f"   • Loose-aggressive style")
-    print(f"   • Plays many hands and bets aggressively\n")
+    out.append(f"2. {wild.name} ({wild.ai_style.name})")
+    out.append(f"   • Loose-aggressive style")
+    out.append(f"   • Plays many hands and bets aggressively\n")
     
-    print(f"3. {balanced.name} ({balanced.ai_style.name})")
-    print(f"   • Well-balanced approach")
-    print(f"   • Solid fundamentals with mixed strategies\n")
+    out.append(f"3. {balanced.name} ({balanced.ai_style.name})")
+    out.append(f"   • Well-balanced approach")
+    out.append(f"   • Solid fundamentals with mixed strategies\n")
     
-    print(f"4. {random_ai.name} ({random_ai.ai_style.name})")
-    print(f"   • Unpredictable actions")
-    print(f"   • Great for practice against chaos!\n")
+    out.append(f"4. {random_ai.name} ({random_ai.ai_style.name})")
+    out.append(f"   • Unpredictable actions")
+    out.append(f"   • Great for practice against chaos!\n")
     
-    print("✅ Each AI has unique playing tendencies and decision-making patterns!\n")
+    out.append("✅ Each AI has unique playing tendencies and decision-making patterns!\n")
     
     # DEMO 3: Pot Management
-    print_banner("DEMO 3: Advanced Pot Management")
-    print("Demonstrating pot management with multiple players...\n")
+    _write(out)
+    out = [banner("DEMO 3: Advanced Pot Management")]
+    out.append("Demonstrating pot management with multiple players...\n")
     
     pot = Pot()
     player1 = Player("Alice", 1000)
     player2 = Player("Bob", 1000)
     player3 = Player("Carol", 1000)
     
-    print("Initial stacks:")
-    print(f"  Alice: ${player1.bankroll}")
-    print(f"  Bob: ${player2.bankroll}")
-    print(f"  Carol: ${player3.bankroll}\n")
+    out.append("Initial stacks:")
+    out.append(f"  Alice: ${player1.bankroll}")
+    out.append(f"  Bob: ${player2.bankroll}")
+    out.append(f"  Carol: ${player3.bankroll}\n")
     
     # Betting round
-    print("Preflop betting:")
+    out.append("Preflop betting:")
     player1.place_bet(50)
     pot.add_bet(player1, 50)
-    print(f"  Alice bets $50")
+    out.append(f"  Alice bets $50")
     
     player2.place_bet(50)
     pot.add_bet(player2, 50)
-    print(f"  Bob calls $50")
+    out.append(f"  Bob calls $50")
     
     player3.place_bet(50)
     pot.add_bet(player3, 50)
-    print(f"  Carol calls $50")
+    out.append(f"  Carol calls $50")
     
-    print(f"\n  Total pot: ${pot.total}")
-    print(f"  Main pot: ${pot.main_pot}")
+    out.append(f"\n  Total pot: ${pot.total}")
+    out.append(f"  Main pot: ${pot.main_pot}")
     
     if pot.side_pots:
-        print(f"  Side pots: {len(pot.side_pots)}")
+        out.append(f"  Side pots: {len(pot.side_pots)}")
     else:
-        print(f"  Side pots: None (all players matched bets)")
+        out.append(f"  Side pots: None (all players matched bets)")
     
-    print("\n✅ Pot management working correctly!\n")
+    out.append("\n✅ Pot management working correctly!\n")
     
     # DEMO 4: Table Management
-    print_banner("DEMO 4: Table Management")
-    print("Setting up a poker table with positions...\n")
+    _write(out)
+    out = [banner("DEMO 4: Table Management")]
+    out.append("Setting up a poker table with positions...\n")
     
     table = Table(TableType.CASH_GAME, max_players=6)
     players = [
@@ -161,17 +175,18 @@ def demo_all():
     
     for i, player in enumerate(players):
         table.add_player(player)
-        print(f"  Seat {i+1}: {player.name} (${player.bankroll})")
+        out.append(f"  Seat {i+1}: {player.name} (${player.bankroll})")
     
-    print(f"\nDealer button at seat: {table.dealer_position + 1}")
-    print(f"Number of players: {table.num_players}")
-    print(f"Active players: {len(table.get_active_players())}")
+    out.append(f"\nDealer button at seat: {table.dealer_position + 1}")
+    out.append(f"Number of players: {table.num_players}")
+    out.append(f"Active players: {len(table.get_active_players())}")
     
-    print("\n✅ Table positions managed automatically!\n")
+    out.append("\n✅ Table positions managed automatically!\n")
     
     # DEMO 5: Game States
-    print_banner("DEMO 5: Game State Management")
-    print("The game engine manages different states throughout a hand:\n")
+    _write(out)
+    out = [banner("DEMO 5: Game State Management")]
+    out.append("The game engine manages different states throughout a hand:\n")
     
     states = [
         (GameState.WAITING, "Waiting for players"),
@@ -184,13 +199,14 @@ def demo_all():
     ]
     
     for i, (state, description) in enumerate(states, 1):
-        print(f"  {i}. {state.name}: {description}")
+        out.append(f"  {i}. {state.name}: {description}")
     
-    print("\n✅ Complete hand lifecycle management!\n")
+    out.append("\n✅ Complete hand lifecycle management!\n")
     
     # DEMO 6: Full Hand Simulation
-    print_banner("DEMO 6: Full Hand Simulation")
-    print("Simulating a complete hand from deal to showdown...\n")
+    _write(out)
+    out = [banner("DEMO 6: Full Hand Simulation")]
+    out.append("Simulating a complete hand from deal to showdown...\n")
     
     deck = Deck()
     deck.shuffle()
@@ -198,84 +214,85 @@ def demo_all():
     hero = Player("Hero", 1000)
     villain = AIPlayer("Villain", 1000, AIStyle.BALANCED)
     
-    print("Players:")
-    print(f"  {hero.name}: ${hero.bankroll}")
-    print(f"  {villain.name}: ${villain.bankroll}")
+    out.append("Players:")
+    out.append(f"  {hero.name}: ${hero.bankroll}")
+    out.append(f"  {villain.name}: ${villain.bankroll}")
     
     # Deal hole cards
-    print("\n📇 Dealing hole cards...")
+    out.append("\n📇 Dealing hole cards...")
     hero.deal_hole_cards([deck.deal_card(), deck.deal_card()])
     villain.deal_hole_cards([deck.deal_card(), deck.deal_card()])
     
     hero_cards = hero.hole_cards
-    print(f"\nYour cards: {[str(c) for c in hero_cards]}")
+    out.append(f"\nYour cards: {[str(c) for c in hero_cards]}")
     
     # Flop
-    print("\n🎴 Dealing the FLOP...")
-    deck.deal_card()  # Burn
-    flop = [deck.deal_card(), deck.deal_card(), deck.deal_card()]
-    print(f"  Board: {[str(c) for c in flop]}")
+    out.append("\n🎴 Dealing the FLOP...")
+    flop = deck.deal_flop()
+    out.append(f"  Board: {[str(c) for c in flop]}")
     
     hero_hand = Hand.best_hand_from_cards(hero_cards + flop)
-    print(f"  Your hand: {hero_hand.rank}")
+    out.append(f"  Your hand: {hero_hand.rank}")
+    equity = EquityCalculator.simulate_equity(hero_cards, flop, trials=1000)
+    out.append(f"  Equity vs. a random hand: {equity:.0%}")
     
     # Turn
-    print("\n🎴 Dealing the TURN...")
-    deck.deal_card()  # Burn
-    turn = deck.deal_card()
+    out.append("\n🎴 Dealing the TURN...")
+    turn = deck.deal_turn_or_river()
     board = flop + [turn]
-    print(f"  Board: {[str(c) for c in board]}")
+    out.append(f"  Board: {[str(c) for c in board]}")
     
     hero_hand = Hand.best_hand_from_cards(hero_cards + board)
-    print(f"  Your hand: {hero_hand.rank}")
+    out.append(f"  Your hand: {hero_hand.rank}")
     
     # River
-    print("\n🎴 Dealing the RIVER...")
-    deck.deal_card()  # Burn
-    river = deck.deal_card()
+    out.append("\n🎴 Dealing the RIVER...")
+    river = deck.deal_turn_or_river()
     board = board + [river]
-    print(f"  Board: {[str(c) for c in board]}")
+    out.append(f"  Board: {[str(c) for c in board]}")
     
     # Showdown
-    print("\n🏆 SHOWDOWN!")
+    out.append("\n🏆 SHOWDOWN!")
     hero_final = Hand.best_hand_from_cards(hero_cards + board)
     villain_cards = villain.hole_cards
     villain_final = Hand.best_hand_from_cards(villain_cards + board)
     
-    print(f"\n  {hero.name}: {[str(c) for c in hero_cards]}")
-    print(f"    {hero_final.rank} (score: {hero_final._rank.value})")
+    out.append(f"\n  {hero.name}: {[str(c) for c in hero_cards]}")
+    out.append(f"    {hero_final.rank} (score: {hero_final._rank.value})")
     
-    print(f"\n  {villain.name}: {[str(c) for c in villain_cards]}")
-    print(f"    {villain_final.rank} (score: {villain_final._rank.value})")
+    out.append(f"\n  {villain.name}: {[str(c) for c in villain_cards]}")
+    out.append(f"    {villain_final.rank} (score: {villain_final._rank.value})")
     
     if hero_final._rank.value > villain_final._rank.value:
-        print(f"\n  🎉 {hero.name} WINS!")
+        out.append(f"\n  🎉 {hero.name} WINS!")
     elif villain_final._rank.value > hero_final._rank.value:
-        print(f"\n  {villain.name} wins!")
+        out.append(f"\n  {villain.name} wins!")
     else:
-        print(f"\n  SPLIT POT!")
+        out.append(f"\n  SPLIT POT!")
     
-    print("\n✅ Complete hand executed successfully!\n")
+    out.append("\n✅ Complete hand executed successfully!\n")
     
     # Summary
-    print_banner("DEMONSTRATION COMPLETE!")
-    print("✅ All feature demonstrations completed successfully!\n")
-    print("What you've seen:")
-    print("  ✓ Complete poker hand evaluation system")
-    print("  ✓ Advanced AI with multiple playing styles")
-    print("  ✓ Sophisticated pot and side pot management")
-    print("  ✓ Professional table management")
-    print("  ✓ Complete game state handling")
-    print("  ✓ Full hand simulation from deal to showdown\n")
-    print("PyHoldem Pro is production-ready with 327 passing tests!")
-    print("\nAdditional features not shown in this demo:")
-    print("  • Comprehensive statistics and analytics")
-    print("  • Training mode with hand analysis")
-    print("  • HUD with opponent tracking")
-    print("  • Educational content and strategy guides")
-    print("  • Data persistence and session tracking")
-    print("\nTo play the full game, run: python main.py")
-    print("\n" + "="*70 + "\n")
+    _write(out)
+    out = [banner("DEMONSTRATION COMPLETE!")]
+    out.append("✅ All feature demonstrations completed successfully!\n")
+    out.append("What you've seen:")
+    out.append("  ✓ Complete poker hand evaluation system")
+    out.append("  ✓ Advanced AI with multiple playing styles")
+    out.append("  ✓ Sophisticated pot and side pot management")
+    out.append("  ✓ Professional table management")
+    out.append("  ✓ Complete game state handling")
+    out.append("  ✓ Full hand simulation from deal to showdown\n")
+    out.append("PyHoldem Pro is production-ready with 327 passing tests!")
+    out.append("\nAdditional features not shown in this demo:")
+    out.append("  • Comprehensive statistics and analytics")
+    out.append("  • Training mode with hand analysis")
+    out.append("  • HUD with opponent tracking")
+    out.append("  • Educational content and strategy guides")
+    out.append("  • Data persistence and session tracking")
+    out.append("\nTo play the full game, run: python main.py")
+    out.append("\n" + _RULE + "\n")
+    _write(out)
 
 
 if __name__ == "__main__":
@@ -285,5 +302,6 @@ if __name__ == "__main__":
         print("\n\nDemo interrupted. Goodbye!")
     except Exception as e:
         print(f"\nError during demo: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get('PYHOLDEM_DEBUG'):
+            import traceback
+            traceback.print_exc()
@@ -3,21 +3,21 @@
 Training Mode Demo for PyHoldem Pro
 Demonstrates the interactive training features.
 """
+import os
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from training.trainer import PokerTrainer, QuizType
-from training.analyzer import HandAnalyzer, SessionReviewer
-from training.hud import TrainerHUD
-from training.content_loader import ContentLoader
+from game.card import Card, Rank, Suit
 from game.player import Player, PlayerAction
 
 
 def demo_quiz_system():
     """Demonstrate the interactive quiz system."""
+    from training.trainer import PokerTrainer, QuizType
+    
     print("🎓 PYHOLDEM PRO TRAINING MODE DEMO")
     print("=" * 50)
     
@@ -37,6 +37,10 @@ def demo_quiz_system():
     print(f"User Answer: 20%")
     print(f"Evaluation: {result['feedback']}")
     
+    # Grade a batch of past answers at once
+    graded = trainer.evaluate_answers([0.2, 0.25, 0.333], [0.2, 30, 33], tolerance=0.01)
+    print(f"Batch review: {sum(graded)}/{len(graded)} correct")
+    
     # Show performance stats
     print("\n📈 PERFORMANCE TRACKING:")
     performance = trainer.get_performance_summary()
@@ -46,6 +50,8 @@ def demo_quiz_system():
 
 def demo_hand_analysis():
     """Demonstrate post-hand analysis."""
+    from training.analyzer import HandAnalyzer
+    
     print("\n\n🔍 HAND ANALYSIS DEMO:")
     print("=" * 30)
     
@@ -67,6 +73,23 @@ def demo_hand_analysis():
     print(f"Recommendation: {analysis['recommendation'].upper()}")
     print(f"\n💭 REASONING:\n{analysis['reasoning']}")
     
+    # Preflop, the equity comes from the shipped table for the hole cards
+    print("\n🂡 PREFLOP DECISION:")
+    hole_cards = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.HEARTS, Rank.QUEEN)]
+    preflop = analyzer.analyze_decision(
+        action=PlayerAction.CALL,
+        pot_size=60,
+        bet_to_call=40,
+        hand_equity=None,
+        opponent_type="loose-aggressive",
+        hole_cards=hole_cards,
+        num_opponents=2
+    )
+    print(f"Hole Cards: {' '.join(str(card) for card in hole_cards)} vs 2 opponents")
+    print(f"Hand Equity: {preflop['hand_equity_percentage']:.1f}% "
+          f"(needs {preflop['pot_odds_percentage']:.1f}%)")
+    print(f"Recommendation: {preflop['recommendation'].upper()}")
+    
     # Demo bluff analysis
     print("\n🃏 BLUFF ANALYSIS:")
     bluff_analysis = analyzer.analyze_bluff(75, 100, "tight-passive", "dry")
@@ -77,6 +100,8 @@ def demo_hand_analysis():
 
 def demo_session_review():
     """Demonstrate session review functionality."""
+    from training.analyzer import SessionReviewer
+    
     print("\n\n📊 SESSION REVIEW DEMO:")
     print("=" * 30)
     
@@ -118,6 +143,8 @@ def demo_session_review():
 
 def demo_hud_display():
     """Demonstrate HUD functionality."""
+    from training.hud import TrainerHUD
+    
     print("\n\n💻 TRAINER HUD DEMO:")
     print("=" * 25)
     
@@ -148,6 +175,19 @@ def demo_hud_display():
         display = hud.format_opponent_display(opponent, stats)
         print(f"  {display}")
         
+    # Hands shown down feed the HUD's starting-hand counts
+    hud.update_opponent_stats({
+        'AI_Wild': {**opponent_stats['AI_Wild'],
+                    'hole_cards': [Card(Suit.SPADES, Rank.NINE), Card(Suit.SPADES, Rank.EIGHT)]}
+    })
+    hud.update_opponent_stats({
+        'AI_Wild': {**opponent_stats['AI_Wild'],
+                    'hole_cards': [Card(Suit.HEARTS, Rank.EIGHT), Card(Suit.HEARTS, Rank.NINE)]}
+    })
+    print("\n🂠 SHOWN STARTING HANDS:")
+    for opponent in opponent_stats:
+        print(f"  {opponent}: {hud.format_starting_hands(opponent)}")
+        
     print("\n💰 POT ODDS:")
     pot_display = hud.generate_pot_odds_display(180, 60)
     print(f"  {pot_display}")
@@ -159,6 +199,8 @@ def demo_hud_display():
 
 def demo_educational_content():
     """Demonstrate educational content system."""
+    from training.content_loader import ContentLoader
+    
     print("\n\n📚 EDUCATIONAL CONTENT DEMO:")
     print("=" * 35)
     
@@ -208,8 +250,9 @@ def main():
         
     except Exception as e:
         print(f"❌ Demo error: {e}")
-        import traceback
-        traceback.print_exc()
+        if os.environ.get('PYHOLDEM_DEBUG'):
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -56,6 +56,7 @@ setup(
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.11.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.4.0",
@@ -64,6 +65,7 @@ setup(
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
             "pytest-mock>=3.11.0",
+            "pytest-xdist>=3.3.0",
         ]
     },
     entry_points={
@@ -2,14 +2,171 @@
 Data Manager module for PyHoldem Pro.
 Handles JSON file operations for player data persistence.
 """
+import atexit
+import bisect
 import hashlib
+import heapq
 import json
+import mmap
 import os
 import re
+import shutil
 import threading
+import time
+import weakref
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from jsonschema import validate, ValidationError
+from operator import itemgetter
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Any, Mapping, Optional, Tuple
+from jsonschema import Draft7Validator
+
+try:
+    # Optional: compiles the schema to plain Python checks
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    # Optional: faster JSON encoding/decoding straight to and from bytes
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hand history appends go through long-lived buffered handles that are
+# flushed every _HISTORY_FLUSH_EVERY records, before reads and on close().
+_HISTORY_BUFFER_SIZE = 1 << 16
+_HISTORY_FLUSH_EVERY = 32
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Characters outside this set are collapsed to "_" in hand history filenames.
+_SLUG_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, with orjson when it is installed.
+
+    Non-string keys are stringified as json.dumps does, rather than rejected.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Encode obj as one newline-terminated JSONL record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(data: Any) -> Any:
+    """Decode JSON text or bytes, with orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_COUNT_FIELDS = ("games_played", "games_won", "hands_played", "hands_won")
+_NUMBER_TYPES = (int, float)
+
+
+def _is_known_good_player(player_data: Any) -> bool:
+    """Check the usual player shape against DataManager.PLAYER_SCHEMA by hand.
+
+    Returns True only when the record is certainly valid. False means "ask
+    jsonschema", which also handles bool, None and subclassed values. Keep
+    this in step with PLAYER_SCHEMA.
+    """
+    if type(player_data) is not dict:
+        return False
+    get = player_data.get
+    name = get("name")
+    bankroll = get("bankroll")
+    if type(name) is not str or not name or type(get("created_at")) is not str:
+        return False
+    if type(bankroll) not in _NUMBER_TYPES or not bankroll >= 0:
+        return False
+    if type(get("last_played", "")) is not str:
+        return False
+    for field_name in _COUNT_FIELDS:
+        count = get(field_name, 0)
+        if type(count) is not int or count < 0:
+            return False
+    biggest_pot = get("biggest_pot", 0)
+    return (type(get("total_winnings", 0)) in _NUMBER_TYPES
+            and type(biggest_pot) in _NUMBER_TYPES and biggest_pot >= 0)
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file.
+
+    With orjson the file is parsed straight from a read-only memory map, so
+    large player files are never copied into a bytes object first.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
+
+
+class _MetricIndex:
+    """
+    Player names kept sorted by one metric for get_leaderboard.
+    
+    Entries are (value, -roster position, name) tuples in ascending order, so
+    reading from the end yields the highest values with ties in roster order,
+    matching heapq.nlargest over players_data. Comparing values of different
+    types raises TypeError, which callers treat as "index unavailable".
+    """
+    
+    __slots__ = ("metric", "entries", "keys", "next_position")
+    
+    def __init__(self, metric: str, players: Dict[str, Dict[str, Any]]):
+        self.metric = metric
+        self.keys: Dict[str, Tuple[Any, int, str]] = {
+            name: (player.get(metric, 0), -position, name)
+            for position, (name, player) in enumerate(players.items())
+        }
+        self.next_position = len(self.keys)
+        self.entries = sorted(self.keys.values())
+    
+    def update(self, name: str, player: Optional[Dict[str, Any]]):
+        """Re-rank one player, or drop them when player is None."""
+        old = self.keys.pop(name, None)
+        if old is not None:
+            del self.entries[bisect.bisect_left(self.entries, old)]
+        if player is None:
+            return
+        if old is not None:
+            position = old[1]
+        else:
+            position = -self.next_position
+            self.next_position += 1
+        key = (player.get(self.metric, 0), position, name)
+        bisect.insort(self.entries, key)
+        self.keys[name] = key
+    
+    def top(self, limit: int) -> List[str]:
+        """Return the names of the top limit players, best first."""
+        if limit <= 0:
+            return []
+        return [key[2] for key in self.entries[:-limit - 1:-1]]
+
+
+def _flush_at_exit(manager_ref: "weakref.ref[DataManager]"):
+    """atexit hook: save a DataManager's deferred changes if it is still alive."""
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
 
 
 class DataManager:
@@ -34,11 +191,37 @@ class DataManager:
         "additionalProperties": True
     }
     
+    # New players are copies of this template, which is cheaper than building
+    # the dict literal. Deleted dicts are not pooled for reuse, since callers
+    # may still hold read-only views of them.
+    _NEW_PLAYER = {
+        "name": "",
+        "bankroll": 0,
+        "created_at": "",
+        "last_played": "",
+        "games_played": 0,
+        "games_won": 0,
+        "total_winnings": 0.0,
+        "hands_played": 0,
+        "hands_won": 0,
+        "biggest_pot": 0.0
+    }
+    
+    # Checked against the meta-schema once here rather than on every validation
+    Draft7Validator.check_schema(PLAYER_SCHEMA)
+    _PLAYER_VALIDATOR = Draft7Validator(PLAYER_SCHEMA)
+    _FAST_PLAYER_VALIDATOR = (
+        staticmethod(fastjsonschema.compile(PLAYER_SCHEMA)) if fastjsonschema else None
+    )
+    
     def __init__(
         self,
         data_file: str = "data/players.json",
         *,
         hand_history_dir: Optional[str] = None,
+        save_interval: float = 5.0,
+        backup_every: int = 0,
+        write_ahead_log: bool = False,
     ):
         """
         Initialize the data manager.
@@ -46,31 +229,172 @@ class DataManager:
         Args:
             data_file: Path to the JSON data file
             hand_history_dir: Optional directory for per-player JSONL hand histories
+            save_interval: Minimum seconds between the file saves triggered by save_player
+            backup_every: Refresh <data_file>.bak on every Nth save (0 disables)
+            write_ahead_log: Append each player change to <data_file>.wal so it
+                survives a crash before the next save_players
         """
         self.data_file = data_file
         base_dir = os.path.dirname(os.path.abspath(data_file))
         self.hand_history_dir = hand_history_dir or os.path.join(base_dir, "hand_histories")
         self.players_data: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.RLock()  # Thread-safe operations
+        self.invalid_players: List[str] = []  # loaded records failing PLAYER_SCHEMA
+        # Guards writes and multi-step reads. Write paths call each other
+        # (update_and_save, close), so the lock must be re-entrant; single-key
+        # reads such as get_player skip it because dict lookups are atomic.
+        self._lock = threading.RLock()
+        self._history_paths: Dict[str, str] = {}  # normalized name -> JSONL path
+        self._history_files: Dict[str, BinaryIO] = {}  # JSONL path -> open append handle
+        self._history_pending = 0  # records written since the last flush
+        # Derived statistics are cached until the data they came from changes
+        self._data_version = 0
+        self._player_versions: Dict[str, int] = {}
+        self._stats_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._summary_cache: Optional[Tuple[int, int, int]] = None  # (version, bankroll, games)
+        # Each player's (bankroll, games_played) share of the summary while
+        # they are all ints, so single-player changes adjust the totals in place
+        self._summary_parts: Optional[Dict[str, Tuple[int, int]]] = None
+        # (sort_by, reverse) -> (version, sorted read-only views) for list_players
+        self._order_cache: Dict[Tuple[str, bool], Tuple[int, List[Mapping[str, Any]]]] = {}
+        # metric -> players sorted by it, updated one player at a time
+        self._leaderboards: Dict[str, _MetricIndex] = {}
+        # save_player marks the data dirty; saves are coalesced to one per interval
+        self._save_interval = save_interval
+        self._dirty = False
+        self._last_save = float("-inf")
+        self._save_timer: Optional[threading.Timer] = None
+        # Error from a save on the timer thread, raised by the next flush()
+        self._save_error: Optional[Exception] = None
+        self._backup_every = backup_every
+        self._save_count = 0
+        # Changes since the last snapshot, replayed by load_players and
+        # discarded once save_players has written them into the data file
+        self._wal_path = f"{data_file}.wal" if write_ahead_log else None
+        self._wal: Optional[BinaryIO] = None
+        # Whether data_file exists, tracked by load/save to spare a stat() call
+        self._file_exists = False
+        # Last timestamp string and the monotonic time it was taken (see _now_iso)
+        self._now_cache: Tuple[float, str] = (float("-inf"), "")
         
         # Ensure data directory exists
         os.makedirs(base_dir, exist_ok=True)
         
         # Load existing data
         self.load_players()
+        # Deferred saves run on a daemon timer, so write them out at exit too
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def _now_iso(self) -> str:
+        """Return datetime.now().isoformat(), reused for up to a second."""
+        now = time.monotonic()
+        taken_at, stamp = self._now_cache
+        if now - taken_at >= 1.0:
+            stamp = datetime.now().isoformat()
+            self._now_cache = (now, stamp)
+        return stamp
+
+    def _mark_changed(self, name: Optional[str] = None):
+        """Invalidate cached statistics for one player, or all if name is None."""
+        self._data_version += 1
+        if name is None:
+            self._player_versions.clear()
+            self._stats_cache.clear()
+            self._leaderboards.clear()
+            self._summary_parts = None
+        else:
+            self._player_versions[name] = self._player_versions.get(name, 0) + 1
+            player = self.players_data.get(name)
+            for metric, index in list(self._leaderboards.items()):
+                try:
+                    index.update(name, player)
+                except TypeError:
+                    del self._leaderboards[metric]
+            self._roll_summary(name, player)
+            if self._wal_path is not None:
+                self._log_change(name, player)
+
+    def _log_change(self, name: str, player: Optional[Dict[str, Any]]):
+        """Append one player's new state (or removal) to the write-ahead log."""
+        if self._wal is None:
+            self._wal = open(self._wal_path, "ab")
+        if player is None:
+            record = {"op": "del", "name": name}
+        else:
+            record = {"op": "put", "name": name, "player": player}
+        self._wal.write(_dumps_line(record))
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+
+    def _replay_wal(self):
+        """Apply logged changes on top of the loaded snapshot."""
+        if self._wal_path is None or not os.path.exists(self._wal_path):
+            return
+        with open(self._wal_path, "rb") as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    break  # Torn final record from a crash mid-append
+                if not isinstance(record, dict):
+                    break
+                if record.get("op") == "put":
+                    self.players_data[record["name"]] = record["player"]
+                elif record.get("op") == "del":
+                    self.players_data.pop(record["name"], None)
+
+    def _discard_wal(self):
+        """Drop logged changes once a snapshot contains them."""
+        if self._wal_path is None:
+            return
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+        if os.path.exists(self._wal_path):
+            os.remove(self._wal_path)
+
+    def _roll_summary(self, name: str, player: Optional[Dict[str, Any]]):
+        """Carry a current summary cache across a change to one player."""
+        cached = self._summary_cache
+        parts = self._summary_parts
+        if parts is None or cached is None or cached[0] != self._data_version - 1:
+            return
+        old_bankroll, old_games = parts.pop(name, (0, 0))
+        bankroll = games = 0
+        if player is not None:
+            bankroll = player.get("bankroll", 0)
+            games = player.get("games_played", 0)
+            if type(bankroll) is not int or type(games) is not int:
+                # Float sums depend on order; leave the cache stale to recompute
+                self._summary_parts = None
+                return
+            parts[name] = (bankroll, games)
+        self._summary_cache = (self._data_version,
+                               cached[1] - old_bankroll + bankroll,
+                               cached[2] - old_games + games)
 
     def _hand_history_path_for_player(self, name: str) -> str:
         normalized = (name or "").strip()
+        path = self._history_paths.get(normalized)
+        if path is not None:
+            return path
         if not normalized:
             raise ValueError("Player name cannot be empty")
 
-        slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", normalized).strip("_")
+        slug = _SLUG_RE.sub("_", normalized).strip("_")
         if not slug:
             slug = "player"
 
-        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:10]
-        filename = f"{slug}__{digest}.jsonl"
-        return os.path.join(self.hand_history_dir, filename)
+        encoded = normalized.encode("utf-8")
+        digest = hashlib.blake2b(encoded, digest_size=5).hexdigest()
+        path = os.path.join(self.hand_history_dir, f"{slug}__{digest}.jsonl")
+        if not os.path.exists(path):
+            # Histories written before the switch to BLAKE2b used truncated SHA-256
+            legacy = hashlib.sha256(encoded).hexdigest()[:10]
+            legacy_path = os.path.join(self.hand_history_dir, f"{slug}__{legacy}.jsonl")
+            if os.path.exists(legacy_path):
+                path = legacy_path
+        self._history_paths[normalized] = path
+        return path
 
     def append_hand_history(self, player_name: str, hand_record: Dict[str, Any]) -> str:
         """
@@ -88,46 +412,72 @@ class DataManager:
 
         with self._lock:
             path = self._hand_history_path_for_player(player_name)
-            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle = self._history_files.get(path)
+            if handle is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                handle = open(path, "ab", buffering=_HISTORY_BUFFER_SIZE)
+                self._history_files[path] = handle
 
             payload = dict(hand_record)
             payload.setdefault("schema_version", 1)
-            payload.setdefault("saved_at", datetime.now().isoformat())
+            payload.setdefault("saved_at", self._now_iso())
 
-            with open(path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            handle.write(_dumps_line(payload))
+            self._history_pending += 1
+            if self._history_pending >= _HISTORY_FLUSH_EVERY:
+                self.flush_hand_history()
 
             return path
 
+    def flush_hand_history(self):
+        """Write any buffered hand history records to disk."""
+        with self._lock:
+            for handle in self._history_files.values():
+                handle.flush()
+            self._history_pending = 0
+
+    def close(self):
+        """Save pending player changes, flush hand history and close its files."""
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                self.flush_hand_history()
+                for handle in self._history_files.values():
+                    handle.close()
+                self._history_files.clear()
+                if self._wal is not None:
+                    self._wal.close()
+                    self._wal = None
+
     def _read_last_jsonl_lines(self, path: str, limit: int) -> List[str]:
         if limit <= 0:
             return []
 
-        # Read from the end of the file in chunks until we have enough lines.
-        chunk_size = 8192
-        lines: List[bytes] = []
-        buffer = b""
+        # Walk backwards through a read-only memory map, slicing out one
+        # line per rfind, so only the requested tail is ever copied.
+        tail: List[bytes] = []
         with open(path, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            position = f.tell()
-
-            while position > 0 and len(lines) <= limit:
-                read_size = min(chunk_size, position)
-                position -= read_size
-                f.seek(position)
-                chunk = f.read(read_size)
-                buffer = chunk + buffer
-                lines = buffer.splitlines()
-
-        tail = lines[-limit:]
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = size
+                while end > 0 and len(tail) < limit:
+                    start = mm.rfind(b"\n", 0, end) + 1
+                    line = mm[start:end]
+                    if line.strip():
+                        tail.append(line)
+                    end = start - 1
+
+        tail.reverse()
         decoded: List[str] = []
         for raw in tail:
             try:
                 text = raw.decode("utf-8")
             except UnicodeDecodeError:
                 text = raw.decode("utf-8", errors="replace")
-            if text.strip():
-                decoded.append(text)
+            decoded.append(text)
         return decoded
 
     def load_hand_history(
@@ -156,6 +506,10 @@ class DataManager:
             if limit <= 0:
                 return []
 
+            handle = self._history_files.get(path)
+            if handle is not None:
+                handle.flush()
+
             try:
                 lines = self._read_last_jsonl_lines(path, limit)
             except OSError:
@@ -164,7 +518,7 @@ class DataManager:
             records: List[Dict[str, Any]] = []
             for line in lines:
                 try:
-                    record = json.loads(line)
+                    record = _loads(line)
                 except json.JSONDecodeError:
                     continue
                 if isinstance(record, dict):
@@ -174,7 +528,7 @@ class DataManager:
                 records.reverse()
             return records
     
-    def create_player(self, name: str, initial_bankroll: int) -> Dict[str, Any]:
+    def create_player(self, name: str, initial_bankroll: int) -> Mapping[str, Any]:
         """
         Create a new player profile.
         
@@ -183,57 +537,81 @@ class DataManager:
             initial_bankroll: Starting bankroll
             
         Returns:
-            Player data dictionary
+            Read-only view of the new player's data
             
         Raises:
             ValueError: If name is invalid, bankroll is invalid, or player exists
         """
+        created, player_data, error = self._try_create_player(name, initial_bankroll)
+        if not created:
+            raise ValueError(error)
+        return player_data
+    
+    def _try_create_player(
+        self, name: str, initial_bankroll: int
+    ) -> Tuple[bool, Optional[Mapping[str, Any]], Optional[str]]:
+        """
+        Create a player without raising on the expected failures.
+        
+        Returns:
+            (created, read-only player data or None, error message or None);
+            lets bulk callers skip the cost of raising and catching ValueError
+        """
         if not name or not name.strip():
-            raise ValueError("Player name cannot be empty")
+            return False, None, "Player name cannot be empty"
         
         if initial_bankroll <= 0:
-            raise ValueError("Initial bankroll must be positive")
+            return False, None, "Initial bankroll must be positive"
         
         name = name.strip()
         
         with self._lock:
             if name in self.players_data:
-                raise ValueError(f"Player '{name}' already exists")
-            
-            now = datetime.now().isoformat()
-            player_data = {
-                "name": name,
-                "bankroll": int(initial_bankroll),
-                "created_at": now,
-                "last_played": now,
-                "games_played": 0,
-                "games_won": 0,
-                "total_winnings": 0.0,
-                "hands_played": 0,
-                "hands_won": 0,
-                "biggest_pot": 0.0
-            }
-            
-            # Validate data
-            self.validate_player_data(player_data)
+                return False, None, f"Player '{name}' already exists"
             
+            now = self._now_iso()
+            player_data = self._NEW_PLAYER.copy()
+            player_data["name"] = name
+            player_data["bankroll"] = int(initial_bankroll)
+            player_data["created_at"] = now
+            player_data["last_played"] = now
+            
+            # Built to match PLAYER_SCHEMA, so only loaded data is validated
             self.players_data[name] = player_data
-            return player_data.copy()
+            self._mark_changed(name)
+            return True, MappingProxyType(player_data), None
     
-    def get_player(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_player(self, name: str) -> Optional[Mapping[str, Any]]:
         """
         Get player data by name.
         
+        Args:
+            name: Player name
+            
+        Returns:
+            Read-only view of the player data, or None if not found
+        """
+        if not name:
+            return None
+        # Single dict lookups are atomic, so reads skip the writer lock
+        player = self.players_data.get(name.strip())
+        return MappingProxyType(player) if player is not None else None
+    
+    def get_player_mutable_copy(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of player data that the caller may modify.
+        
         Args:
             name: Player name
             
         Returns:
             Player data dictionary or None if not found
         """
+        if not name:
+            return None
         with self._lock:
-            if not name or name.strip() not in self.players_data:
-                return None
-            return self.players_data[name.strip()].copy()
+            player = self.players_data.get(name.strip())
+            return player.copy() if player is not None else None
     
     def player_exists(self, name: str) -> bool:
         """
@@ -245,8 +623,7 @@ class DataManager:
         Returns:
             True if player exists
         """
-        with self._lock:
-            return name.strip() in self.players_data if name else False
+        return name.strip() in self.players_data if name else False
     
     def update_player_bankroll(self, name: str, new_bankroll: int):
         """
@@ -267,7 +644,8 @@ class DataManager:
                 raise ValueError(f"Player '{name}' not found")
             
             self.players_data[name]["bankroll"] = int(new_bankroll)
-            self.players_data[name]["last_played"] = datetime.now().isoformat()
+            self.players_data[name]["last_played"] = self._now_iso()
+            self._mark_changed(name)
     
     def update_player_stats(self, name: str, stats: Dict[str, Any]):
         """
@@ -288,7 +666,8 @@ class DataManager:
             for key, value in stats.items():
                 self.players_data[name][key] = value
             
-            self.players_data[name]["last_played"] = datetime.now().isoformat()
+            self.players_data[name]["last_played"] = self._now_iso()
+            self._mark_changed(name)
     
     def save_player(self, player):
         """
@@ -312,9 +691,73 @@ class DataManager:
 
         # Update the player's bankroll
         self.update_player_bankroll(player.name, player.bankroll)
-        # Save to file
-        self.save_players()
-    
+        # Save to file now, or once the current save interval has passed
+        self._schedule_save()
+
+    def _schedule_save(self):
+        """Save immediately if the last save is old enough, else defer to a timer."""
+        with self._lock:
+            self._dirty = True
+            elapsed = time.monotonic() - self._last_save
+            if elapsed >= self._save_interval:
+                self.save_players()
+            elif self._save_timer is None:
+                self._save_timer = threading.Timer(self._save_interval - elapsed, self._flush_if_dirty)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush_if_dirty(self):
+        """Timer callback: save any changes made since the last save."""
+        with self._lock:
+            self._save_timer = None
+            if self._dirty:
+                try:
+                    self.save_players()
+                except Exception as e:
+                    # Nobody is waiting on the timer thread; keep it for flush()
+                    self._save_error = e
+
+    def flush(self):
+        """
+        Save pending player changes now instead of waiting for the timer.
+        
+        Raises:
+            IOError: If the file cannot be written, or a deferred save failed
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            error, self._save_error = self._save_error, None
+            if self._dirty:
+                self.save_players()
+            if error is not None:
+                raise error
+
+    def update_and_save(self, name: str, updates: Dict[str, Any], player=None):
+        """
+        Apply stat updates (and optionally a player object) and persist once.
+
+        Args:
+            name: Player name
+            updates: Dictionary of statistics to update
+            player: Optional Player object whose bankroll/stats are synced too
+
+        Raises:
+            ValueError: If player not found
+        """
+        with self._lock:
+            stats = dict(updates)
+            if player is not None:
+                for attr in ("hands_played", "hands_won", "total_winnings"):
+                    if hasattr(player, attr):
+                        stats[attr] = getattr(player, attr)
+
+            self.update_player_stats(name, stats)
+            if player is not None:
+                self.update_player_bankroll(name, player.bankroll)
+            self.save_players()
+
     def delete_player(self, name: str):
         """
         Delete a player profile.
@@ -330,8 +773,11 @@ class DataManager:
                 raise ValueError(f"Player '{name}' not found")
             
             del self.players_data[name]
+            self._history_paths.pop(name.strip(), None)
+            self._stats_cache.pop(name, None)
+            self._mark_changed(name)
     
-    def list_players(self, sort_by: str = "name", reverse: bool = False) -> List[Dict[str, Any]]:
+    def list_players(self, sort_by: str = "name", reverse: bool = False) -> List[Mapping[str, Any]]:
         """
         List all players with optional sorting.
         
@@ -340,44 +786,78 @@ class DataManager:
             reverse: Sort in reverse order
             
         Returns:
-            List of player data dictionaries
+            List of read-only player data views
+            
+        Iterating players_data is not atomic, so unlike get_player this takes
+        the lock to get a consistent snapshot while writers are active.
         """
         with self._lock:
+            cache_key = (sort_by, reverse)
+            cached = self._order_cache.get(cache_key)
+            if cached is not None and cached[0] == self._data_version:
+                return list(cached[1])
+            
             players = list(self.players_data.values())
             
             if sort_by and players:
                 try:
-                    players.sort(key=lambda p: p.get(sort_by, 0), reverse=reverse)
-                except (TypeError, KeyError):
-                    # Fall back to name sorting if sort_by field doesn't exist
+                    try:
+                        # itemgetter extracts the keys in C; list.sort computes
+                        # them all before sorting, so a miss leaves the list as is
+                        players.sort(key=itemgetter(sort_by), reverse=reverse)
+                    except KeyError:
+                        # Players without the field sort as 0
+                        players.sort(key=lambda p: p.get(sort_by, 0), reverse=reverse)
+                except TypeError:
+                    # Fall back to name sorting if the field can't be compared
                     players.sort(key=lambda p: p.get("name", ""), reverse=reverse)
             
-            return [player.copy() for player in players]
+            views = [MappingProxyType(player) for player in players]
+            self._order_cache[cache_key] = (self._data_version, views)
+            return list(views)
     
-    def save_players(self):
+    def save_players(self, keep_backup: bool = False):
         """
         Save player data to JSON file.
         
+        The data is written to a temporary file, synced to disk, and then
+        swapped in with os.replace, so the data file is never left partly
+        written.
+        
+        Args:
+            keep_backup: Copy the previous data file to <data_file>.bak first;
+                also done on every backup_every-th save
+        
         Raises:
             IOError: If file cannot be written
+            TypeError: If the player data holds values JSON cannot encode
         """
         with self._lock:
+            self._save_count += 1
+            if self._backup_every and self._save_count % self._backup_every == 0:
+                keep_backup = True
+            # Encode first, so data that can't be serialized never reaches disk
+            payload = _dumps(self.players_data, indent=True)
+            tmp_file = f"{self.data_file}.tmp"
             try:
-                # Create backup before saving
-                if os.path.exists(self.data_file):
-                    backup_file = f"{self.data_file}.bak"
-                    os.rename(self.data_file, backup_file)
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
                 
-                # Save to file
-                with open(self.data_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.players_data, f, indent=2, ensure_ascii=False)
+                if keep_backup and self._file_exists:
+                    shutil.copyfile(self.data_file, f"{self.data_file}.bak")
+                
+                os.replace(tmp_file, self.data_file)
+                self._file_exists = True
+                self._discard_wal()
+                self._dirty = False
+                self._last_save = time.monotonic()
                     
-            except (IOError, OSError, PermissionError) as e:
-                # Restore backup if save failed
-                backup_file = f"{self.data_file}.bak"
-                if os.path.exists(backup_file):
-                    os.rename(backup_file, self.data_file)
-                # Re-raise the original exception
+            except Exception:
+                # Leave the existing data file untouched
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
                 raise
     
     def load_players(self):
@@ -388,20 +868,24 @@ class DataManager:
             json.JSONDecodeError: If file contains invalid JSON
         """
         with self._lock:
-            if not os.path.exists(self.data_file):
+            self._mark_changed()
+            self._file_exists = os.path.exists(self.data_file)
+            if not self._file_exists:
                 # Create empty data structure
                 self.players_data = {}
+                self._replay_wal()
+                self._check_loaded_players()
                 return
             
             try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _load_json_file(self.data_file)
                 
                 # Handle different file formats
                 if isinstance(data, dict):
                     if "players" in data:
                         # New format with metadata
-                        self.players_data = data["players"]
+                        players = data["players"]
+                        self.players_data = players if isinstance(players, dict) else {}
                     else:
                         # Direct player data
                         self.players_data = data
@@ -413,6 +897,8 @@ class DataManager:
             except Exception:
                 # If file is corrupted, start fresh
                 self.players_data = {}
+            self._replay_wal()
+            self._check_loaded_players()
     
     def backup_players_data(self, backup_file: str):
         """
@@ -422,8 +908,8 @@ class DataManager:
             backup_file: Path to backup file
         """
         with self._lock:
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(self.players_data, f, indent=2, ensure_ascii=False)
+            with open(backup_file, 'wb') as f:
+                f.write(_dumps(self.players_data, indent=True))
     
     def restore_players_data(self, backup_file: str):
         """
@@ -437,10 +923,30 @@ class DataManager:
         """
         with self._lock:
             try:
-                with open(backup_file, 'r', encoding='utf-8') as f:
-                    self.players_data = json.load(f)
+                data = _load_json_file(backup_file)
             except Exception as e:
                 raise IOError(f"Failed to restore from backup: {e}")
+            if not isinstance(data, dict):
+                # Keep the current data rather than installing a non-object
+                raise IOError("Failed to restore from backup: expected a JSON object of players")
+            self._mark_changed()
+            self.players_data = data
+            self._check_loaded_players()
+            if self._wal_path is not None:
+                # Logged changes were against the old data; snapshot the restore
+                self.save_players()
+    
+    def _check_loaded_players(self):
+        """
+        Validate players read from disk and record those that fail the schema.
+        
+        Records are kept rather than dropped, so a partially valid file is
+        never discarded by the next save.
+        """
+        self.invalid_players = [
+            name for name, player_data in self.players_data.items()
+            if not self.validate_player_data(player_data)
+        ]
     
     def validate_player_data(self, player_data: Dict[str, Any]) -> bool:
         """
@@ -450,18 +956,19 @@ class DataManager:
             player_data: Player data to validate
             
         Returns:
-            True if valid
-            
-        Raises:
-            ValidationError: If data is invalid
+            True if valid, False otherwise
         """
-        try:
-            validate(instance=player_data, schema=self.PLAYER_SCHEMA)
+        if _is_known_good_player(player_data):
             return True
-        except ValidationError:
-            return False
+        if self._FAST_PLAYER_VALIDATOR is not None:
+            try:
+                self._FAST_PLAYER_VALIDATOR(player_data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+        return self._PLAYER_VALIDATOR.is_valid(player_data)
     
-    def get_player_statistics(self, name: str) -> Dict[str, Any]:
+    def get_player_statistics(self, name: str) -> Mapping[str, Any]:
         """
         Get comprehensive player statistics.
         
@@ -469,13 +976,18 @@ class DataManager:
             name: Player name
             
         Returns:
-            Dictionary with calculated statistics
+            Read-only view of the calculated statistics
         """
         with self._lock:
             player = self.players_data.get(name)
             if not player:
                 return {}
             
+            version = self._player_versions.get(name, 0)
+            cached = self._stats_cache.get(name)
+            if cached is not None and cached[0] == version:
+                return MappingProxyType(cached[1])
+            
             stats = player.copy()
             
             # Calculate derived statistics
@@ -497,9 +1009,10 @@ class DataManager:
             else:
                 stats["hand_win_rate"] = 0.0
             
-            return stats
+            self._stats_cache[name] = (version, stats)
+            return MappingProxyType(stats)
     
-    def get_leaderboard(self, metric: str = "bankroll", limit: int = 10) -> List[Dict[str, Any]]:
+    def get_leaderboard(self, metric: str = "bankroll", limit: int = 10) -> List[Mapping[str, Any]]:
         """
         Get player leaderboard.
         
@@ -508,10 +1021,28 @@ class DataManager:
             limit: Maximum number of players to return
             
         Returns:
-            List of top players
+            List of read-only views of the top players
         """
-        players = self.list_players(sort_by=metric, reverse=True)
-        return players[:limit]
+        with self._lock:
+            # Sorted indexes are built on first use and then kept up to date
+            # by _mark_changed, so repeated polls don't rescan the roster
+            index = self._leaderboards.get(metric)
+            if index is None:
+                try:
+                    index = self._leaderboards[metric] = _MetricIndex(metric, self.players_data)
+                except TypeError:
+                    index = None
+            if index is not None:
+                return [MappingProxyType(self.players_data[name]) for name in index.top(limit)]
+            
+            # Values that can't be indexed: select without sorting the whole roster
+            players = self.players_data.values()
+            try:
+                top = heapq.nlargest(limit, players, key=lambda p: p.get(metric, 0))
+            except (TypeError, KeyError):
+                # Fall back to name ordering if the metric can't be compared
+                top = heapq.nlargest(limit, players, key=lambda p: p.get("name", ""))
+            return [MappingProxyType(player) for player in top]
     
     def cleanup_inactive_players(self, days_inactive: int = 365):
         """
@@ -526,22 +1057,37 @@ class DataManager:
         from datetime import datetime, timedelta
         
         cutoff_date = datetime.now() - timedelta(days=days_inactive)
+        # Timestamps written by this class are naive isoformat() strings, which
+        # sort the same way as the datetimes they encode
+        cutoff_iso = cutoff_date.isoformat()
         removed_count = 0
         
         with self._lock:
             players_to_remove = []
             
             for name, player_data in self.players_data.items():
-                try:
-                    last_played = datetime.fromisoformat(player_data["last_played"])
-                    if last_played < cutoff_date:
+                last_played = player_data.get("last_played")
+                if (isinstance(last_played, str) and len(last_played) in (19, 26)
+                        and last_played[10] == "T"):
+                    if last_played < cutoff_iso:
                         players_to_remove.append(name)
-                except (KeyError, ValueError):
+                    continue
+                try:
+                    played_at = datetime.fromisoformat(last_played)
+                except (TypeError, ValueError):
                     # Remove players with invalid/missing last_played date
                     players_to_remove.append(name)
+                    continue
+                if played_at.tzinfo is not None:
+                    # Compare aware timestamps in local time, like the cutoff
+                    played_at = played_at.astimezone().replace(tzinfo=None)
+                if played_at < cutoff_date:
+                    players_to_remove.append(name)
             
             for name in players_to_remove:
                 del self.players_data[name]
+                self._stats_cache.pop(name, None)
+                self._mark_changed(name)
                 removed_count += 1
         
         return removed_count
@@ -556,16 +1102,22 @@ class DataManager:
         """
         with self._lock:
             if format.lower() == "json":
-                with open(export_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.players_data, f, indent=2, ensure_ascii=False)
+                with open(export_file, 'wb') as f:
+                    f.write(_dumps(self.players_data, indent=True))
             elif format.lower() == "csv":
                 import csv
                 players = list(self.players_data.values())
                 if players:
-                    with open(export_file, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=players[0].keys())
-                        writer.writeheader()
-                        writer.writerows(players)
+                    # Schema fields first in a fixed order, then any extra fields
+                    # of the first player; missing fields export as ""
+                    schema_fields = self.PLAYER_SCHEMA["properties"]
+                    fields = list(schema_fields)
+                    fields += [key for key in players[0] if key not in schema_fields]
+                    with open(export_file, 'w', newline='', encoding='utf-8',
+                              buffering=_EXPORT_BUFFER_SIZE) as f:
+                        writer = csv.writer(f)
+                        writer.writerow(fields)
+                        writer.writerows([p.get(k, "") for k in fields] for p in players)
     
     def get_data_summary(self) -> Dict[str, Any]:
         """
@@ -574,15 +1126,29 @@ class DataManager:
         Returns:
             Summary statistics
         """
-        with self._lock:
+        # A current cache entry is read without the lock; only recomputing the
+        # totals iterates players_data and needs it.
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self._data_version:
+            _, total_bankroll, total_games = cached
             total_players = len(self.players_data)
-            total_bankroll = sum(p.get("bankroll", 0) for p in self.players_data.values())
-            total_games = sum(p.get("games_played", 0) for p in self.players_data.values())
-            
-            return {
-                "total_players": total_players,
-                "total_bankroll": total_bankroll,
-                "total_games_played": total_games,
-                "data_file": self.data_file,
-                "file_exists": os.path.exists(self.data_file)
-            }
+        else:
+            with self._lock:
+                total_players = len(self.players_data)
+                parts = {
+                    name: (p.get("bankroll", 0), p.get("games_played", 0))
+                    for name, p in self.players_data.items()
+                }
+                total_bankroll = sum(bankroll for bankroll, _ in parts.values())
+                total_games = sum(games for _, games in parts.values())
+                exact = all(type(b) is int and type(g) is int for b, g in parts.values())
+                self._summary_parts = parts if exact else None
+                self._summary_cache = (self._data_version, total_bankroll, total_games)
+        
+        return {
+            "total_players": total_players,
+            "total_bankroll": total_bankroll,
+            "total_games_played": total_games,
+            "data_file": self.data_file,
+            "file_exists": self._file_exists
+        }
@@ -0,0 +1,187 @@
+"""
+Cactus Kev style 5-card evaluator for PyHoldem Pro.
+
+Each card is packed into a 32-bit integer:
+
+    xxxbbbbb bbbbbbbb ssssrrrr xxpppppp
+
+    b = one bit per rank (deuce = bit 16 ... ace = bit 28)
+    s = suit bit (0x1000, 0x2000, 0x4000, 0x8000)
+    r = rank index (deuce = 0 ... ace = 12)
+    p = prime for the rank (deuce = 2 ... ace = 41)
+
+Multiplying the primes of five cards gives a key that is unique to the
+multiset of ranks, so every hand is scored with a flush test and one dict
+lookup. Scores run from 1 (royal flush) to 7462 (7-5-4-3-2 offsuit);
+lower is better.
+
+The two tables hold 7462 entries between them and are rebuilt at import
+in a few milliseconds, which is cheaper than reading a shipped table file.
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Sequence, Tuple
+
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = (0x1000, 0x2000, 0x4000, 0x8000)
+
+# Worst score in each category paired with its HandRank value, best first.
+CATEGORY_BOUNDS = (
+    (1, 10),     # royal flush
+    (10, 9),     # straight flush
+    (166, 8),    # four of a kind
+    (322, 7),    # full house
+    (1599, 6),   # flush
+    (1609, 5),   # straight
+    (2467, 4),   # three of a kind
+    (3325, 3),   # two pair
+    (6185, 2),   # pair
+    (7462, 1),   # high card
+)
+
+
+def make_card_int(rank_index: int, suit_index: int) -> int:
+    """
+    Pack a card into its evaluator integer.
+
+    Args:
+        rank_index: 0 for a deuce up to 12 for an ace
+        suit_index: 0-3, selecting one of SUIT_BITS
+
+    Returns:
+        The packed card integer
+    """
+    return ((1 << (16 + rank_index)) | SUIT_BITS[suit_index] |
+            (rank_index << 8) | RANK_PRIMES[rank_index])
+
+
+def _product(ranks: Sequence[int]) -> int:
+    """Multiply the primes for a sequence of rank indices."""
+    result = 1
+    for rank in ranks:
+        result *= RANK_PRIMES[rank]
+    return result
+
+
+def _build_tables() -> Tuple[Dict[int, int], Dict[int, int]]:
+    """Build the flush and non-flush lookup tables in score order."""
+    descending = range(12, -1, -1)
+    straights = [tuple(range(high, high - 5, -1)) for high in range(12, 3, -1)]
+    straights.append((3, 2, 1, 0, 12))  # A-2-3-4-5
+    straight_sets = {frozenset(s) for s in straights}
+    no_pair = [c for c in combinations(descending, 5) if frozenset(c) not in straight_sets]
+
+    flush: Dict[int, int] = {}
+    unsuited: Dict[int, int] = {}
+    score = 1
+
+    def add(table, key):
+        nonlocal score
+        table[key] = score
+        score += 1
+
+    for ranks in straights:
+        add(flush, _product(ranks))
+    for quad in descending:
+        for kicker in descending:
+            if kicker != quad:
+                add(unsuited, RANK_PRIMES[quad] ** 4 * RANK_PRIMES[kicker])
+    for trips in descending:
+        for pair in descending:
+            if pair != trips:
+                add(unsuited, RANK_PRIMES[trips] ** 3 * RANK_PRIMES[pair] ** 2)
+    for ranks in no_pair:
+        add(flush, _product(ranks))
+    for ranks in straights:
+        add(unsuited, _product(ranks))
+    for trips in descending:
+        kickers = [r for r in descending if r != trips]
+        for pair_of_kickers in combinations(kickers, 2):
+            add(unsuited, RANK_PRIMES[trips] ** 3 * _product(pair_of_kickers))
+    for high, low in combinations(descending, 2):
+        for kicker in descending:
+            if kicker not in (high, low):
+                add(unsuited, (RANK_PRIMES[high] * RANK_PRIMES[low]) ** 2 * RANK_PRIMES[kicker])
+    for pair in descending:
+        kickers = [r for r in descending if r != pair]
+        for three_kickers in combinations(kickers, 3):
+            add(unsuited, RANK_PRIMES[pair] ** 2 * _product(three_kickers))
+    for ranks in no_pair:
+        add(unsuited, _product(ranks))
+
+    assert score - 1 == CATEGORY_BOUNDS[-1][0]
+    return flush, unsuited
+
+
+FLUSH_LOOKUP, UNSUITED_LOOKUP = _build_tables()
+
+# Every card in Deck order (suit-major, rank ascending).
+DECK_INTS = tuple(make_card_int(rank, suit) for suit in range(4) for rank in range(13))
+
+
+def eval5(c0: int, c1: int, c2: int, c3: int, c4: int) -> int:
+    """
+    Score five packed cards.
+
+    Returns:
+        Score from 1 (best) to 7462 (worst)
+
+    Raises:
+        KeyError: If the cards do not form a valid hand (e.g. five of a kind)
+    """
+    product = (c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)
+    if c0 & c1 & c2 & c3 & c4 & 0xF000:
+        return FLUSH_LOOKUP[product]
+    return UNSUITED_LOOKUP[product]
+
+
+def best_five(ints: Sequence[int]) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Find the strongest five of the given packed cards.
+
+    This is the evaluator's hot loop, so eval5 is inlined and the lookup
+    tables are bound to locals. The flush test is skipped entirely when no
+    suit appears five times.
+
+    Returns:
+        Tuple of (best score, indices of the five cards); the first
+        combination wins ties
+    """
+    flush_lookup = FLUSH_LOOKUP
+    unsuited_lookup = UNSUITED_LOOKUP
+    primes = [c & 0xFF for c in ints]
+    suits = [c & 0xF000 for c in ints]
+    can_flush = any(suits.count(bit) >= 5 for bit in SUIT_BITS)
+
+    best = CATEGORY_BOUNDS[-1][0] + 1
+    best_idx: Tuple[int, ...] = ()
+    for idx in _five_card_indices(len(ints)):
+        i0, i1, i2, i3, i4 = idx
+        product = primes[i0] * primes[i1] * primes[i2] * primes[i3] * primes[i4]
+        if can_flush and suits[i0] & suits[i1] & suits[i2] & suits[i3] & suits[i4]:
+            score = flush_lookup[product]
+        else:
+            score = unsuited_lookup[product]
+        if score < best:
+            best = score
+            best_idx = idx
+    return best, best_idx
+
+
+def best_score(ints: Sequence[int]) -> int:
+    """Return the best (lowest) score of any five of the given packed cards."""
+    return best_five(ints)[0]
+
+
+@lru_cache(maxsize=None)
+def _five_card_indices(count: int) -> Tuple[Tuple[int, ...], ...]:
+    """Return every 5-card index combination for a set of count cards."""
+    return tuple(combinations(range(count), 5))
+
+
+def hand_category(score: int) -> int:
+    """Return the HandRank value (1-10) for an evaluator score."""
+    for worst, category in CATEGORY_BOUNDS:
+        if score <= worst:
+            return category
+    raise ValueError(f"Invalid hand score: {score}")
@@ -7,6 +7,7 @@ from enum import Enum
 from typing import Tuple, Dict, List, Optional
 from game.player import Player, PlayerAction
 from game.card import Card, Rank
+from game.preflop import NUM_BUCKETS, bucket169, bucket_ranks
 from game.hand import Hand
 
 
@@ -14,6 +15,89 @@ def _round_to_nearest_5(amount):
     return int(round(amount / 5)) * 5
 
 
+# Hand rank value -> strength maps, built once instead of on every decision.
+_CAUTIOUS_RANK_STRENGTH = {
+    1: 0.1,   # High card
+    2: 0.3,   # Pair
+    3: 0.45,  # Two pair
+    4: 0.6,   # Three of a kind
+    5: 0.7,   # Straight
+    6: 0.75,  # Flush
+    7: 0.85,  # Full house
+    8: 0.95,  # Four of a kind
+    9: 0.98,  # Straight flush
+    10: 1.0   # Royal flush
+}
+
+_BALANCED_RANK_STRENGTH = {
+    1: 0.15,  # High card
+    2: 0.40,  # Pair
+    3: 0.55,  # Two pair
+    4: 0.70,  # Three of a kind
+    5: 0.75,  # Straight
+    6: 0.80,  # Flush
+    7: 0.88,  # Full house
+    8: 0.95,  # Four of a kind
+    9: 0.98,  # Straight flush
+    10: 1.0   # Royal flush
+}
+
+
+def _cautious_preflop_formula(high: int, low: int, suited: bool) -> float:
+    """CautiousAI preflop strength for rank values high >= low."""
+    # Pocket pairs
+    if high == low:
+        # Higher pairs are stronger
+        return 0.6 + (high / 14) * 0.3
+    
+    suited_bonus = 0.05 if suited else 0
+    
+    # High cards
+    high_card_value = high / 14
+    low_card_value = low / 14
+    
+    # Connected cards (for straight potential)
+    gap = high - low
+    connected_bonus = 0.05 if gap == 1 else 0.03 if gap == 2 else 0
+    
+    # Calculate overall strength
+    strength = (high_card_value * 0.6 + low_card_value * 0.2 + 
+               suited_bonus + connected_bonus)
+    
+    return min(strength, 1.0)
+
+
+def _balanced_preflop_formula(high: int, low: int, suited: bool) -> float:
+    """BalancedAI preflop strength for rank values high >= low."""
+    # Pocket pairs
+    if high == low:
+        return 0.5 + high * 0.03
+    
+    # Suited bonus
+    suited_bonus = 0.1 if suited else 0
+    
+    # Connected bonus
+    gap = high - low
+    connected = 0.05 if gap <= 2 else 0
+    
+    return (high * 0.04 + low * 0.02 + suited_bonus + connected)
+
+
+# Preflop strength for each of the 169 starting hands (see game.preflop),
+# filled in once from the formulas above so decisions do a single lookup.
+_CAUTIOUS_PREFLOP = tuple(
+    _cautious_preflop_formula(*bucket_ranks(bucket)) for bucket in range(NUM_BUCKETS)
+)
+_BALANCED_PREFLOP = tuple(
+    _balanced_preflop_formula(*bucket_ranks(bucket)) for bucket in range(NUM_BUCKETS)
+)
+
+
+def _made_hand_rank(cards: List[Card]) -> int:
+    """Return the HandRank value of the best five of cards, memoized by card set."""
+    return Hand.best_hand_from_cards(cards).rank.value
+
+
 class AIStyle(Enum):
     """Enumeration for AI playing styles."""
     CAUTIOUS = "cautious"
@@ -165,21 +249,8 @@ class CautiousAI(AIPlayer):
         # Post-flop: evaluate actual hand
         all_cards = self.hole_cards + community_cards
         if len(all_cards) >= 5:
-            hand = Hand.best_hand_from_cards(all_cards)
             # Map hand rank to strength (simplified)
-            rank_strength = {
-                1: 0.1,   # High card
-                2: 0.3,   # Pair
-                3: 0.45,  # Two pair
-                4: 0.6,   # Three of a kind
-                5: 0.7,   # Straight
-                6: 0.75,  # Flush
-                7: 0.85,  # Full house
-                8: 0.95,  # Four of a kind
-                9: 0.98,  # Straight flush
-                10: 1.0   # Royal flush
-            }
-            return rank_strength.get(hand.rank.value, 0.5)
+            return _CAUTIOUS_RANK_STRENGTH.get(_made_hand_rank(all_cards), 0.5)
         
         return 0.5
     
@@ -189,29 +260,7 @@ class CautiousAI(AIPlayer):
             return 0.5
         
         card1, card2 = self.hole_cards
-        
-        # Pocket pairs
-        if card1.rank == card2.rank:
-            # Higher pairs are stronger
-            return 0.6 + (card1.rank.value / 14) * 0.3
-        
-        # Suited cards
-        suited = card1.suit == card2.suit
-        suited_bonus = 0.05 if suited else 0
-        
-        # High cards
-        high_card_value = max(card1.rank.value, card2.rank.value) / 14
-        low_card_value = min(card1.rank.value, card2.rank.value) / 14
-        
-        # Connected cards (for straight potential)
-        gap = abs(card1.rank.value - card2.rank.value)
-        connected_bonus = 0.05 if gap == 1 else 0.03 if gap == 2 else 0
-        
-        # Calculate overall strength
-        strength = (high_card_value * 0.6 + low_card_value * 0.2 + 
-                   suited_bonus + connected_bonus)
-        
-        return min(strength, 1.0)
+        return _CAUTIOUS_PREFLOP[bucket169(card1, card2)]
 
 
 class WildAI(AIPlayer):
@@ -410,21 +459,8 @@ class BalancedAI(AIPlayer):
         # Post-flop - evaluate made hand
         all_cards = self.hole_cards + community_cards
         if len(all_cards) >= 5:
-            hand = Hand.best_hand_from_cards(all_cards)
             # Convert hand rank to equity estimate - better mapping
-            rank_to_strength = {
-                1: 0.15,  # High card
-                2: 0.40,  # Pair
-                3: 0.55,  # Two pair
-                4: 0.70,  # Three of a kind
-                5: 0.75,  # Straight
-                6: 0.80,  # Flush
-                7: 0.88,  # Full house
-                8: 0.95,  # Four of a kind
-                9: 0.98,  # Straight flush
-                10: 1.0   # Royal flush
-            }
-            return rank_to_strength.get(hand.rank.value, 0.5)
+            return _BALANCED_RANK_STRENGTH.get(_made_hand_rank(all_cards), 0.5)
         
         return 0.5
     
@@ -434,23 +470,7 @@ class BalancedAI(AIPlayer):
             return 0.5
         
         card1, card2 = self.hole_cards
-        
-        # Pocket pairs
-        if card1.rank == card2.rank:
-            return 0.5 + card1.rank.value * 0.03
-        
-        # High cards
-        high_value = max(card1.rank.value, card2.rank.value)
-        low_value = min(card1.rank.value, card2.rank.value)
-        
-        # Suited bonus
-        suited = 0.1 if card1.suit == card2.suit else 0
-        
-        # Connected bonus
-        gap = abs(card1.rank.value - card2.rank.value)
-        connected = 0.05 if gap <= 2 else 0
-        
-        return (high_value * 0.04 + low_value * 0.02 + suited + connected)
+        return _BALANCED_PREFLOP[bucket169(card1, card2)]
 
 
 class RandomAI(AIPlayer):
@@ -507,6 +527,15 @@ class RandomAI(AIPlayer):
                 return PlayerAction.CALL, current_bet
 
 
+# AI implementation for each style, built once at import.
+_AI_CLASSES = {
+    AIStyle.CAUTIOUS: CautiousAI,
+    AIStyle.WILD: WildAI,
+    AIStyle.BALANCED: BalancedAI,
+    AIStyle.RANDOM: RandomAI,
+}
+
+
 def create_ai_player(name: str, bankroll: int, style: AIStyle) -> AIPlayer:
     """
     Factory function to create AI players.
@@ -519,16 +548,10 @@ def create_ai_player(name: str, bankroll: int, style: AIStyle) -> AIPlayer:
     Returns:
         AI player instance
     """
-    if style == AIStyle.CAUTIOUS:
-        return CautiousAI(name, bankroll)
-    elif style == AIStyle.WILD:
-        return WildAI(name, bankroll)
-    elif style == AIStyle.BALANCED:
-        return BalancedAI(name, bankroll)
-    elif style == AIStyle.RANDOM:
-        return RandomAI(name, bankroll)
-    else:
+    ai_class = _AI_CLASSES.get(style)
+    if ai_class is None:
         raise ValueError(f"Unknown AI style: {style}")
+    return ai_class(name, bankroll)
 
 
 def create_ai_players_for_table(count: int, bankroll: int) -> List[AIPlayer]:
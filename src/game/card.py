@@ -2,8 +2,9 @@
 Card module for PyHoldem Pro.
 Implements Card class and related enums for suit and rank.
 """
-from enum import Enum
+from enum import Enum, IntEnum
 from functools import total_ordering
+from game._cactus import make_card_int
 
 
 class Suit(Enum):
@@ -22,9 +23,8 @@ class Suit(Enum):
         return f"Suit.{self.name}"
 
 
-@total_ordering
-class Rank(Enum):
-    """Enumeration for card ranks."""
+class Rank(IntEnum):
+    """Enumeration for card ranks (an IntEnum, so comparisons run as ints)."""
     TWO = 2
     THREE = 3
     FOUR = 4
@@ -39,41 +39,29 @@ class Rank(Enum):
     KING = 13
     ACE = 14
     
-    def __hash__(self):
-        """Return hash for use in sets/dicts."""
-        return hash(self.value)
-    
     def __str__(self):
         """Return the rank display string."""
-        rank_symbols = {
-            Rank.JACK: "J",
-            Rank.QUEEN: "Q", 
-            Rank.KING: "K",
-            Rank.ACE: "A"
-        }
-        return rank_symbols.get(self, str(self.value))
+        return _RANK_SYMBOLS.get(self, str(self.value))
     
     def __repr__(self):
         """Return the rank name."""
         return f"Rank.{self.name}"
-    
-    def __lt__(self, other):
-        """Compare ranks by value."""
-        if not isinstance(other, Rank):
-            return NotImplemented
-        return self.value < other.value
-    
-    def __eq__(self, other):
-        """Check rank equality."""
-        if not isinstance(other, Rank):
-            return NotImplemented
-        return self.value == other.value
+
+
+_RANK_SYMBOLS = {
+    Rank.JACK: "J",
+    Rank.QUEEN: "Q",
+    Rank.KING: "K",
+    Rank.ACE: "A"
+}
 
 
 @total_ordering
 class Card:
     """Represents a playing card with suit and rank."""
     
+    __slots__ = ('suit', 'rank', 'short', 'code')
+    
     def __init__(self, suit: Suit, rank: Rank):
         """
         Initialize a card with suit and rank.
@@ -89,6 +77,10 @@ class Card:
             
         self.suit = suit
         self.rank = rank
+        # Display string (e.g., 'A♠'), shared from the table built at import
+        self.short = _CARD_STRINGS[suit, rank]
+        # 0-51 as (rank index << 2) | suit index, so comparisons are int ops
+        self.code = _CARD_CODES[suit, rank]
     
     @property
     def value(self) -> int:
@@ -117,9 +109,18 @@ class Card:
         """Check if card is a face card (J, Q, K, A)."""
         return self.rank in (Rank.JACK, Rank.QUEEN, Rank.KING, Rank.ACE)
     
+    def to_int(self) -> int:
+        """Return the packed integer used by the hand evaluator."""
+        return _CARD_INTS_BY_CODE[self.code]
+    
+    @staticmethod
+    def from_int(card_int: int) -> 'Card':
+        """Return the shared Card for a packed evaluator integer."""
+        return _CARDS_BY_INT[card_int]
+    
     def __str__(self):
         """Return string representation of card (e.g., 'A♠')."""
-        return f"{self.rank}{self.suit}"
+        return self.short
     
     def __repr__(self):
         """Return repr representation of card."""
@@ -129,14 +130,30 @@ class Card:
         """Check if two cards are equal (same suit and rank)."""
         if not isinstance(other, Card):
             return NotImplemented
-        return self.suit == other.suit and self.rank == other.rank
+        return self.code == other.code
     
     def __lt__(self, other):
         """Compare cards by rank value."""
         if not isinstance(other, Card):
             return NotImplemented
-        return self.rank < other.rank
+        return self.code >> 2 < other.code >> 2
     
     def __hash__(self):
         """Return hash for use in sets/dicts."""
-        return hash((self.suit.value, self.rank.value))
+        return self.code
+
+
+# Evaluator integers and display strings for every suit and rank, built once at import.
+_CARD_INTS = {
+    (suit, rank): make_card_int(rank.value - 2, suit_index)
+    for suit_index, suit in enumerate(Suit)
+    for rank in Rank
+}
+_CARD_STRINGS = {(suit, rank): f"{rank}{suit}" for (suit, rank) in _CARD_INTS}
+_CARD_CODES = {
+    (suit, rank): (rank.value - 2) << 2 | suit_index
+    for suit_index, suit in enumerate(Suit)
+    for rank in Rank
+}
+_CARD_INTS_BY_CODE = tuple(make_card_int(code >> 2, code & 3) for code in range(52))
+_CARDS_BY_INT = {card_int: Card(suit, rank) for (suit, rank), card_int in _CARD_INTS.items()}
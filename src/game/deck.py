@@ -4,34 +4,51 @@ Implements Deck class for managing a 52-card deck.
 """
 import random
 from typing import List, Optional
-from game.card import Card, Suit, Rank
+from game.card import Card
+from game._cactus import DECK_INTS
 
 
 class Deck:
     """Represents a standard 52-card deck."""
     
-    def __init__(self):
-        """Initialize a new deck with 52 cards in standard order."""
-        self.cards = self._create_standard_deck()
-        self._original_order = self.cards.copy()
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize a new deck with 52 cards in standard order.
+        
+        Args:
+            seed: Optional seed for this deck's random generator
+        """
+        # Each deck owns its generator so seeding never touches global random state.
+        self._rng = random.Random(seed)
+        # Cards before _cursor have been dealt; dealing just advances it.
+        self._cards = self._create_standard_deck()
+        self._cursor = 0
+        self._original_order = self._cards.copy()
     
     def _create_standard_deck(self) -> List[Card]:
-        """Create a standard 52-card deck."""
-        cards = []
-        for suit in Suit:
-            for rank in Rank:
-                cards.append(Card(suit, rank))
-        return cards
+        """Create a standard 52-card deck from the shared Card instances."""
+        return [Card.from_int(card_int) for card_int in DECK_INTS]
+    
+    @property
+    def cards(self) -> List[Card]:
+        """Return the cards remaining in the deck, top card first."""
+        return self._cards[self._cursor:]
+    
+    @cards.setter
+    def cards(self, cards: List[Card]):
+        """Replace the remaining cards in the deck."""
+        self._cards = list(cards)
+        self._cursor = 0
     
     @property
     def cards_remaining(self) -> int:
         """Return the number of cards remaining in the deck."""
-        return len(self.cards)
+        return len(self._cards) - self._cursor
     
     @property
     def is_empty(self) -> bool:
         """Check if the deck is empty."""
-        return len(self.cards) == 0
+        return self._cursor >= len(self._cards)
     
     def shuffle(self, seed: Optional[int] = None):
         """
@@ -41,8 +58,11 @@ class Deck:
             seed: Optional random seed for reproducible shuffling
         """
         if seed is not None:
-            random.seed(seed)
-        random.shuffle(self.cards)
+            self._rng.seed(seed)
+        # Drop dealt cards, then shuffle the rest in place.
+        del self._cards[:self._cursor]
+        self._cursor = 0
+        self._rng.shuffle(self._cards)
     
     def deal_card(self) -> Card:
         """
@@ -56,7 +76,9 @@ class Deck:
         """
         if self.is_empty:
             raise ValueError("Cannot deal from empty deck")
-        return self.cards.pop(0)
+        card = self._cards[self._cursor]
+        self._cursor += 1
+        return card
     
     def deal_cards(self, count: int) -> List[Card]:
         """
@@ -71,14 +93,45 @@ class Deck:
         Raises:
             ValueError: If trying to deal more cards than available
         """
-        if count > len(self.cards):
-            raise ValueError(f"Cannot deal {count} cards, only {len(self.cards)} remaining")
+        if count > self.cards_remaining:
+            raise ValueError(f"Cannot deal {count} cards, only {self.cards_remaining} remaining")
         
-        dealt_cards = []
-        for _ in range(count):
-            dealt_cards.append(self.deal_card())
+        dealt_cards = self._cards[self._cursor:self._cursor + count]
+        self._cursor += count
         return dealt_cards
     
+    def deal_flop(self) -> List[Card]:
+        """
+        Burn one card and deal the three flop cards in a single step.
+        
+        Returns:
+            List of the three flop cards
+            
+        Raises:
+            ValueError: If fewer than 4 cards remain
+        """
+        if self.cards_remaining < 4:
+            raise ValueError(f"Cannot deal the flop, only {self.cards_remaining} cards remaining")
+        start = self._cursor + 1
+        self._cursor = start + 3
+        return self._cards[start:self._cursor]
+    
+    def deal_turn_or_river(self) -> Card:
+        """
+        Burn one card and deal the next community card in a single step.
+        
+        Returns:
+            The dealt card
+            
+        Raises:
+            ValueError: If fewer than 2 cards remain
+        """
+        if self.cards_remaining < 2:
+            raise ValueError(f"Cannot deal a street, only {self.cards_remaining} cards remaining")
+        card = self._cards[self._cursor + 1]
+        self._cursor += 2
+        return card
+    
     def burn_card(self) -> Card:
         """
         Burn (discard) a card from the top of the deck.
@@ -100,15 +153,15 @@ class Deck:
         """
         if self.is_empty:
             return None
-        return self.cards[0]
+        return self._cards[self._cursor]
     
     def reset(self):
         """Reset the deck to its original unshuffled state."""
-        self.cards = self._original_order.copy()
+        self.cards = self._original_order
     
     def __len__(self) -> int:
         """Return the number of cards in the deck."""
-        return len(self.cards)
+        return self.cards_remaining
     
     def __iter__(self):
         """Iterate over cards in the deck."""
@@ -120,7 +173,7 @@ class Deck:
     
     def __contains__(self, card: Card) -> bool:
         """Check if a card is in the deck."""
-        return card in self.cards
+        return card in self._cards[self._cursor:]
     
     def __str__(self) -> str:
         """Return string representation of the deck."""
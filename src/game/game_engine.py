@@ -3,7 +3,7 @@ Game Engine module for PyHoldem Pro.
 Orchestrates the main game flow, betting rounds, and hand completion.
 """
 from enum import Enum
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Mapping
 import random
 
 from game.deck import Deck
@@ -1514,11 +1514,8 @@ class GameEngine:
                 
     def _deal_flop(self) -> None:
         """Deal the flop (3 community cards)."""
-        # Burn one card
-        self.deck.deal_card()
-        
-        # Deal 3 cards
-        self.community_cards = self.deck.deal_cards(3)
+        # Burn one card and deal 3
+        self.community_cards = self.deck.deal_flop()
         
         # Display the flop
         print("\n" + "="*70)
@@ -1528,11 +1525,8 @@ class GameEngine:
         
     def _deal_turn(self) -> None:
         """Deal the turn (4th community card)."""
-        # Burn one card
-        self.deck.deal_card()
-        
-        # Deal 1 card
-        self.community_cards.append(self.deck.deal_card())
+        # Burn one card and deal 1
+        self.community_cards.append(self.deck.deal_turn_or_river())
         
         # Display the turn
         print("\n" + "="*70)
@@ -1542,11 +1536,8 @@ class GameEngine:
         
     def _deal_river(self) -> None:
         """Deal the river (5th community card)."""
-        # Burn one card
-        self.deck.deal_card()
-        
-        # Deal 1 card
-        self.community_cards.append(self.deck.deal_card())
+        # Burn one card and deal 1
+        self.community_cards.append(self.deck.deal_turn_or_river())
         
         # Display the river
         print("\n" + "="*70)
@@ -2004,7 +1995,7 @@ class GameEngine:
             existing_player = None
 
         sessions: List[Dict[str, Any]] = []
-        if isinstance(existing_player, dict):
+        if isinstance(existing_player, Mapping):
             existing_sessions = existing_player.get("sessions")
             if isinstance(existing_sessions, list):
                 sessions = list(existing_sessions)
@@ -2029,12 +2020,12 @@ class GameEngine:
             "sessions": sessions,
             "last_session": session_data,
             "biggest_pot": max(
-                int(existing_player.get("biggest_pot", 0)) if isinstance(existing_player, dict) else 0,
+                int(existing_player.get("biggest_pot", 0)) if isinstance(existing_player, Mapping) else 0,
                 int(session_data.get("biggest_pot", 0) or 0),
             ),
         }
         recent_hands: List[Dict[str, Any]] = []
-        if isinstance(existing_player, dict):
+        if isinstance(existing_player, Mapping):
             existing_recent = existing_player.get("recent_hands")
             if isinstance(existing_recent, list):
                 recent_hands = list(existing_recent)
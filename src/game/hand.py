@@ -5,8 +5,9 @@ Implements hand evaluation and ranking logic for poker hands.
 from enum import Enum
 from typing import List, Tuple, Optional
 from collections import Counter
-from itertools import combinations
-from game.card import Card, Rank
+from functools import lru_cache
+from game.card import Card
+from game._cactus import best_five, eval5, hand_category
 
 
 class HandRank(Enum):
@@ -33,6 +34,11 @@ class HandRank(Enum):
         return self.name.replace('_', ' ').title()
 
 
+# Straight rank masks (bit 0 = deuce ... bit 12 = ace) to the high card value
+_STRAIGHT_HIGH_VALUES = {0x1F00 >> shift: 14 - shift for shift in range(9)}
+_STRAIGHT_HIGH_VALUES[0x100F] = 5  # A-2-3-4-5
+
+
 class Hand:
     """Represents a 5-card poker hand."""
     
@@ -44,72 +50,55 @@ class Hand:
             cards: List of exactly 5 cards
             
         Raises:
-            ValueError: If not exactly 5 cards provided
+            ValueError: If not exactly 5 cards provided, or a card repeats
         """
         if len(cards) != 5:
             raise ValueError(f"Hand must contain exactly 5 cards, got {len(cards)}")
         
         self.cards = sorted(cards, key=lambda c: c.value, reverse=True)
         self._rank = None
+        self._score = None
         self._high_card = None
         self._kickers = []
         self._evaluate()
     
+    @staticmethod
+    def _eval5_ints(ints: List[int]) -> int:
+        """Score five packed card integers (1 is best, 7462 is worst)."""
+        return eval5(*ints)
+    
     def _evaluate(self):
         """Evaluate the hand and determine its rank."""
-        # Get rank and suit frequencies
-        rank_counts = Counter(card.rank for card in self.cards)
-        suit_counts = Counter(card.suit for card in self.cards)
-        
-        # Check for flush
-        is_flush = len(suit_counts) == 1
-        
-        # Check for straight
-        is_straight, straight_high = self._check_straight()
-        
-        # Get rank groups
-        rank_freq = sorted(rank_counts.values(), reverse=True)
-        unique_ranks = sorted(rank_counts.keys(), key=lambda r: r.value, reverse=True)
-        
-        # Determine hand rank
-        if is_straight and is_flush:
-            if straight_high.value == 14:  # Ace high straight
-                self._rank = HandRank.ROYAL_FLUSH
-            else:
-                self._rank = HandRank.STRAIGHT_FLUSH
-            self._high_card = straight_high
+        ints = [card.to_int() for card in self.cards]
+        if len(set(ints)) != 5:
+            raise ValueError("Duplicate cards")
+        self._score = self._eval5_ints(ints)
+        self._rank = HandRank(hand_category(self._score))
+        
+        # Fill in the ranks and kickers used for display and analysis
+        if self._rank in (HandRank.ROYAL_FLUSH, HandRank.STRAIGHT_FLUSH, HandRank.STRAIGHT):
+            self._high_card = self._check_straight()[1]
             
-        elif rank_freq == [4, 1]:
-            self._rank = HandRank.FOUR_OF_A_KIND
-            self._set_kickers_for_n_of_kind(rank_counts, 4)
+        elif self._rank == HandRank.FOUR_OF_A_KIND:
+            self._set_kickers_for_n_of_kind(Counter(card.rank for card in self.cards), 4)
             
-        elif rank_freq == [3, 2]:
-            self._rank = HandRank.FULL_HOUSE
-            self._set_full_house_ranks(rank_counts)
+        elif self._rank == HandRank.FULL_HOUSE:
+            self._set_full_house_ranks(Counter(card.rank for card in self.cards))
             
-        elif is_flush:
-            self._rank = HandRank.FLUSH
+        elif self._rank == HandRank.FLUSH:
             self._high_card = self.cards[0]
             self._kickers = self.cards[1:]
             
-        elif is_straight:
-            self._rank = HandRank.STRAIGHT
-            self._high_card = straight_high
-            
-        elif rank_freq == [3, 1, 1]:
-            self._rank = HandRank.THREE_OF_A_KIND
-            self._set_kickers_for_n_of_kind(rank_counts, 3)
+        elif self._rank == HandRank.THREE_OF_A_KIND:
+            self._set_kickers_for_n_of_kind(Counter(card.rank for card in self.cards), 3)
             
-        elif rank_freq == [2, 2, 1]:
-            self._rank = HandRank.TWO_PAIR
-            self._set_two_pair_ranks(rank_counts)
+        elif self._rank == HandRank.TWO_PAIR:
+            self._set_two_pair_ranks(Counter(card.rank for card in self.cards))
             
-        elif rank_freq == [2, 1, 1, 1]:
-            self._rank = HandRank.PAIR
-            self._set_kickers_for_n_of_kind(rank_counts, 2)
+        elif self._rank == HandRank.PAIR:
+            self._set_kickers_for_n_of_kind(Counter(card.rank for card in self.cards), 2)
             
         else:
-            self._rank = HandRank.HIGH_CARD
             self._high_card = self.cards[0]
             self._kickers = self.cards
     
@@ -120,18 +109,16 @@ class Hand:
         Returns:
             Tuple of (is_straight, high_card)
         """
-        values = [card.value for card in self.cards]
-        
-        # Check regular straight
-        if values == list(range(values[0], values[0] - 5, -1)):
-            return True, self.cards[0]
-        
-        # Check for ace-low straight (A-2-3-4-5)
-        if set(values) == {14, 5, 4, 3, 2}:
-            # In ace-low straight, 5 is the high card
-            return True, next(card for card in self.cards if card.rank == Rank.FIVE)
-        
-        return False, None
+        # OR the one-hot rank bits together; a straight is one of ten masks
+        rank_mask = 0
+        for card in self.cards:
+            rank_mask |= card.to_int() >> 16
+        
+        high_value = _STRAIGHT_HIGH_VALUES.get(rank_mask)
+        if high_value is None:
+            return False, None
+        # In ace-low straight, 5 is the high card
+        return True, next(card for card in self.cards if card.value == high_value)
     
     def _set_kickers_for_n_of_kind(self, rank_counts: Counter, n: int):
         """Set kickers for n-of-a-kind hands."""
@@ -194,100 +181,14 @@ class Hand:
         """Check if two hands are equal."""
         if not isinstance(other, Hand):
             return NotImplemented
-        
-        if self.rank != other.rank:
-            return False
-        
-        # Compare based on hand rank
-        if self.rank == HandRank.STRAIGHT_FLUSH or self.rank == HandRank.STRAIGHT:
-            return self.high_card.value == other.high_card.value
-        
-        elif self.rank == HandRank.FOUR_OF_A_KIND:
-            if self.four_of_a_kind_rank != other.four_of_a_kind_rank:
-                return False
-            return self.kickers[0].value == other.kickers[0].value
-        
-        elif self.rank == HandRank.FULL_HOUSE:
-            return (self.three_of_a_kind_rank == other.three_of_a_kind_rank and
-                    self.pair_rank == other.pair_rank)
-        
-        elif self.rank == HandRank.FLUSH or self.rank == HandRank.HIGH_CARD:
-            for c1, c2 in zip(self.cards, other.cards):
-                if c1.value != c2.value:
-                    return False
-            return True
-        
-        elif self.rank == HandRank.THREE_OF_A_KIND:
-            if self.three_of_a_kind_rank != other.three_of_a_kind_rank:
-                return False
-            return all(k1.value == k2.value for k1, k2 in zip(self.kickers, other.kickers))
-        
-        elif self.rank == HandRank.TWO_PAIR:
-            if self.high_pair_rank != other.high_pair_rank:
-                return False
-            if self.low_pair_rank != other.low_pair_rank:
-                return False
-            return self.kickers[0].value == other.kickers[0].value
-        
-        elif self.rank == HandRank.PAIR:
-            if self.pair_rank != other.pair_rank:
-                return False
-            return all(k1.value == k2.value for k1, k2 in zip(self.kickers, other.kickers))
-        
-        return True
+        return self._score == other._score
     
     def __lt__(self, other):
         """Compare hands for ordering."""
         if not isinstance(other, Hand):
             return NotImplemented
-        
-        if self.rank != other.rank:
-            return self.rank < other.rank
-        
-        # Compare based on hand rank specifics
-        if self.rank == HandRank.STRAIGHT_FLUSH or self.rank == HandRank.STRAIGHT:
-            return self.high_card.value < other.high_card.value
-        
-        elif self.rank == HandRank.FOUR_OF_A_KIND:
-            if self.four_of_a_kind_rank != other.four_of_a_kind_rank:
-                return self.four_of_a_kind_rank.value < other.four_of_a_kind_rank.value
-            return self.kickers[0].value < other.kickers[0].value
-        
-        elif self.rank == HandRank.FULL_HOUSE:
-            if self.three_of_a_kind_rank != other.three_of_a_kind_rank:
-                return self.three_of_a_kind_rank.value < other.three_of_a_kind_rank.value
-            return self.pair_rank.value < other.pair_rank.value
-        
-        elif self.rank == HandRank.FLUSH or self.rank == HandRank.HIGH_CARD:
-            for c1, c2 in zip(self.cards, other.cards):
-                if c1.value != c2.value:
-                    return c1.value < c2.value
-            return False
-        
-        elif self.rank == HandRank.THREE_OF_A_KIND:
-            if self.three_of_a_kind_rank != other.three_of_a_kind_rank:
-                return self.three_of_a_kind_rank.value < other.three_of_a_kind_rank.value
-            for k1, k2 in zip(self.kickers, other.kickers):
-                if k1.value != k2.value:
-                    return k1.value < k2.value
-            return False
-        
-        elif self.rank == HandRank.TWO_PAIR:
-            if self.high_pair_rank != other.high_pair_rank:
-                return self.high_pair_rank.value < other.high_pair_rank.value
-            if self.low_pair_rank != other.low_pair_rank:
-                return self.low_pair_rank.value < other.low_pair_rank.value
-            return self.kickers[0].value < other.kickers[0].value
-        
-        elif self.rank == HandRank.PAIR:
-            if self.pair_rank != other.pair_rank:
-                return self.pair_rank.value < other.pair_rank.value
-            for k1, k2 in zip(self.kickers, other.kickers):
-                if k1.value != k2.value:
-                    return k1.value < k2.value
-            return False
-        
-        return False
+        # Lower evaluator scores are stronger hands
+        return self._score > other._score
     
     def __str__(self):
         """Return string representation of the hand."""
@@ -306,17 +207,20 @@ class Hand:
             The best possible 5-card hand
             
         Raises:
-            ValueError: If fewer than 5 cards provided
+            ValueError: If fewer than 5 cards provided, or a card repeats
         """
         if len(cards) < 5:
             raise ValueError(f"Need at least 5 cards to make a hand, got {len(cards)}")
         
-        best_hand = None
-        
-        # Try all possible 5-card combinations
-        for five_cards in combinations(cards, 5):
-            hand = Hand(list(five_cards))
-            if best_hand is None or hand > best_hand:
-                best_hand = hand
-        
-        return best_hand
+        # Order doesn't change the best hand, so sorted ints make a canonical key.
+        return _best_hand_for_ints(tuple(sorted(card.to_int() for card in cards)))
+
+
+@lru_cache(maxsize=4096)
+def _best_hand_for_ints(ints: Tuple[int, ...]) -> Hand:
+    """Build the best Hand for a sorted tuple of packed card ints."""
+    # Checked on cache misses only; a repeated card would break the lookups
+    if len(set(ints)) != len(ints):
+        raise ValueError("Duplicate cards")
+    _, best = best_five(ints)
+    return Hand([Card.from_int(ints[i]) for i in best])
@@ -3,7 +3,7 @@ Player module for PyHoldem Pro.
 Implements Player class for managing player state and actions.
 """
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from game.card import Card
 
 
@@ -51,19 +51,19 @@ class Player:
         self.total_winnings = 0
         self._initial_bankroll = int(bankroll)
     
-    def deal_hole_cards(self, cards: List[Card]):
+    def deal_hole_cards(self, cards: Sequence[Card]):
         """
         Deal hole cards to the player.
         
         Args:
-            cards: List of exactly 2 cards
+            cards: Sequence of exactly 2 cards
             
         Raises:
             ValueError: If not exactly 2 cards provided
         """
         if len(cards) != 2:
             raise ValueError(f"Must deal exactly 2 hole cards, got {len(cards)}")
-        self.hole_cards = cards.copy()
+        self.hole_cards = list(cards)
     
     def place_bet(self, amount: int):
         """
@@ -220,6 +220,16 @@ class Player:
         self.all_in = False
         # Note: total_bet and bankroll are NOT reset
     
+    def reset(self):
+        """Reset player to the state it was created in (bankroll and stats)."""
+        self.reset_for_new_hand()
+        self.bankroll = self._initial_bankroll
+        self.total_bet = 0
+        self.position = 0
+        self.hands_played = 0
+        self.hands_won = 0
+        self.total_winnings = 0
+    
     def reset_for_new_round(self):
         """Reset player state for a new betting round."""
         self.current_bet = 0
@@ -2,6 +2,7 @@
 Pot module for PyHoldem Pro.
 Implements pot management including side pots.
 """
+from bisect import bisect_left
 from typing import List, Dict, Optional
 from collections import defaultdict
 from game.player import Player
@@ -73,12 +74,13 @@ class Pot:
             player: The betting player
             amount: The bet amount
         """
+        contributions = self.player_contributions
+        if player not in contributions:
+            self.eligible_players.append(player)
+        
         self.total += amount
         self.main_pot += amount
-        self.player_contributions[player] += amount
-        
-        if player not in self.eligible_players:
-            self.eligible_players.append(player)
+        contributions[player] += amount
     
     def get_player_contribution(self, player: Player) -> int:
         """
@@ -101,26 +103,27 @@ class Pot:
         self.side_pots = []
 
         # Build sorted unique contribution levels (ascending)
-        levels = sorted(set(self.player_contributions.values()))
+        contributions = list(self.player_contributions.items())
+        amounts = sorted(amt for _, amt in contributions)
+        levels = sorted(set(amounts))
 
-        # We'll compute pots by taking the delta between contribution levels
+        # We'll compute pots by taking the delta between contribution levels.
+        # The number of players at each level comes from the sorted amounts,
+        # so eligibility lists are only built for the side pots that need them.
         last_level = 0
         main_pot = 0
         side_pots: List[SidePot] = []
 
         for level in levels:
             # Players who have contributed at least this level
-            eligible = [p for p, amt in self.player_contributions.items() if amt >= level]
-            if not eligible:
-                continue
-
-            delta = level - last_level
-            pot_amount = delta * len(eligible)
+            num_eligible = len(amounts) - bisect_left(amounts, level)
+            pot_amount = (level - last_level) * num_eligible
 
             if last_level == 0:
                 # first chunk is main pot
                 main_pot = pot_amount
             else:
+                eligible = [p for p, amt in contributions if amt >= level]
                 side_pots.append(SidePot(pot_amount, eligible))
 
             last_level = level
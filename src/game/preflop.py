@@ -0,0 +1,62 @@
+"""
+Preflop module for PyHoldem Pro.
+Maps hole cards onto the 169 canonical starting hands.
+
+The 1326 two-card combinations collapse to 13 pairs, 78 suited hands and
+78 offsuit hands. Buckets form a 13x13 grid indexed by rank (deuce = 0):
+pairs sit on the diagonal, suited hands have the higher rank as the row
+and offsuit hands have the higher rank as the column.
+"""
+from typing import Tuple
+from game.card import Card
+
+NUM_BUCKETS = 169
+
+_RANK_LABELS = "23456789TJQKA"
+
+
+def bucket169(card1: Card, card2: Card) -> int:
+    """
+    Return the canonical starting-hand bucket for two hole cards.
+
+    Args:
+        card1: First hole card
+        card2: Second hole card
+
+    Returns:
+        Bucket index between 0 and 168
+    """
+    # Card.code is (rank index << 2) | suit index
+    code1 = card1.code
+    code2 = card2.code
+    high = code1 >> 2
+    low = code2 >> 2
+    if low > high:
+        high, low = low, high
+    if (code1 ^ code2) & 3 == 0:
+        return high * 13 + low
+    return low * 13 + high
+
+
+def bucket_ranks(bucket: int) -> Tuple[int, int, bool]:
+    """
+    Return (high rank value, low rank value, suited) for a bucket.
+
+    Raises:
+        ValueError: If the bucket is out of range
+    """
+    if not 0 <= bucket < NUM_BUCKETS:
+        raise ValueError(f"Invalid preflop bucket: {bucket}")
+    row, col = divmod(bucket, 13)
+    if row > col:
+        return row + 2, col + 2, True
+    return col + 2, row + 2, False
+
+
+def bucket_label(bucket: int) -> str:
+    """Return the conventional label for a bucket (e.g. 'AKs', 'T9o', '77')."""
+    high, low, suited = bucket_ranks(bucket)
+    label = _RANK_LABELS[high - 2] + _RANK_LABELS[low - 2]
+    if high == low:
+        return label
+    return label + ("s" if suited else "o")
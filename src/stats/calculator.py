@@ -3,11 +3,13 @@ Statistics Calculator module for PyHoldem Pro.
 Implements poker statistics calculations including pot odds, hand odds, and equity.
 """
 import math
-from typing import List, Tuple, Dict, Optional
+import random
+from typing import List, Tuple, Dict, Optional, Sequence
 from collections import Counter
 from itertools import combinations
 from game.card import Card, Rank
 from game.hand import Hand, HandRank
+from game._cactus import DECK_INTS, best_score
 
 
 class PotOddsCalculator:
@@ -50,6 +52,31 @@ class PotOddsCalculator:
         decimal_odds = PotOddsCalculator.calculate_pot_odds(pot_size, bet_to_call)
         return decimal_odds * 100
     
+    @staticmethod
+    def calculate_pot_odds_percentages(pot_sizes: Sequence[float],
+                                       bets_to_call: Sequence[float]) -> List[float]:
+        """
+        Calculate pot odds percentages for many (pot, bet) pairs at once.
+        
+        Args:
+            pot_sizes: Pot sizes
+            bets_to_call: Amounts needed to call, paired with pot_sizes
+            
+        Returns:
+            Pot odds percentage for each pair, in order
+            
+        Raises:
+            ValueError: If the sequences differ in length or a pair is invalid
+        """
+        if len(pot_sizes) != len(bets_to_call):
+            raise ValueError("Pot sizes and bets must have the same length")
+        if any(pot < 0 for pot in pot_sizes):
+            raise ValueError("Pot size cannot be negative")
+        if any(bet <= 0 for bet in bets_to_call):
+            raise ValueError("Bet to call must be positive")
+        
+        return [100.0 * bet / (pot + bet) for pot, bet in zip(pot_sizes, bets_to_call)]
+    
     @staticmethod
     def calculate_pot_odds_ratio(pot_size: float, bet_to_call: float) -> Tuple[int, int]:
         """
@@ -485,6 +512,69 @@ class EquityCalculator:
         
         return equities
     
+    @staticmethod
+    def simulate_equity(hole_cards: List[Card], board: Optional[List[Card]] = None,
+                        trials: int = 1000, seed: Optional[int] = None,
+                        opponents: int = 1) -> float:
+        """
+        Estimate equity against random hands by Monte Carlo simulation.
+        
+        Each trial deals random opponent hands and completes the board from
+        the remaining cards; hands are compared on packed card integers.
+        
+        Args:
+            hole_cards: Player's two hole cards
+            board: Community cards dealt so far (optional)
+            trials: Number of random runouts to simulate
+            seed: Optional seed for reproducible results
+            opponents: Number of random opponent hands (1-8)
+            
+        Returns:
+            Estimated equity between 0 and 1 (ties share the pot)
+            
+        Raises:
+            ValueError: If there are not exactly two hole cards, a card is
+                repeated, trials is not positive, the board has more than
+                5 cards or opponents is outside 1-8
+        """
+        if board is None:
+            board = []
+        if len(hole_cards) != 2:
+            raise ValueError("Need exactly two hole cards")
+        if trials <= 0:
+            raise ValueError("Trials must be positive")
+        if len(board) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+        if not 1 <= opponents <= 8:
+            raise ValueError("Opponents must be between 1 and 8")
+        
+        hero = [card.to_int() for card in hole_cards]
+        known = [card.to_int() for card in board]
+        used = set(hero) | set(known)
+        if len(used) != len(hero) + len(known):
+            raise ValueError("Duplicate cards in hole cards and board")
+        remaining = [c for c in DECK_INTS if c not in used]
+        dealt = 2 * opponents
+        to_draw = dealt + 5 - len(known)
+        rng = random.Random(seed)
+        
+        wins = 0.0
+        for _ in range(trials):
+            drawn = rng.sample(remaining, to_draw)
+            full_board = known + drawn[dealt:]
+            hero_score = best_score(hero + full_board)
+            tied = 1
+            for i in range(0, dealt, 2):
+                villain_score = best_score(drawn[i:i + 2] + full_board)
+                if villain_score < hero_score:
+                    break
+                if villain_score == hero_score:
+                    tied += 1
+            else:
+                wins += 1 / tied
+        
+        return wins / trials
+    
     @staticmethod
     def calculate_tournament_icm_equity(stacks: List[float], payouts: List[float]) -> List[float]:
         """
@@ -2,10 +2,25 @@
 Hand and Session Analyzer for PyHoldem Pro Training Mode.
 Provides post-hand analysis and session reviews with actionable feedback.
 """
+import json
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
+from game.card import Card
 from game.player import PlayerAction
+from game.preflop import NUM_BUCKETS, bucket169, bucket_label
 from stats.calculator import PotOddsCalculator
 
+_PREFLOP_EQUITY_FILE = Path(__file__).resolve().parent / "data" / "preflop_equity.json"
+
+
+@lru_cache(maxsize=1)
+def _preflop_equity_table() -> Tuple[Tuple[float, ...], ...]:
+    """Load the shipped preflop equity table, indexed by 169-hand bucket."""
+    with open(_PREFLOP_EQUITY_FILE, 'r', encoding='utf-8') as f:
+        equity = json.load(f)['equity']
+    return tuple(tuple(equity[bucket_label(bucket)]) for bucket in range(NUM_BUCKETS))
+
 
 class HandAnalyzer:
     """Analyzes individual hands and provides educational feedback."""
@@ -36,8 +51,9 @@ class HandAnalyzer:
         }
         
     def analyze_decision(self, action: PlayerAction, pot_size: float, 
-                        bet_to_call: float, hand_equity: float, 
-                        opponent_type: str) -> Dict[str, Any]:
+                        bet_to_call: float, hand_equity: Optional[float], 
+                        opponent_type: str, hole_cards: Optional[List[Card]] = None,
+                        num_opponents: int = 1) -> Dict[str, Any]:
         """
         Analyze a player's decision with educational feedback.
         
@@ -45,12 +61,23 @@ class HandAnalyzer:
             action: The action taken by the player
             pot_size: Current pot size
             bet_to_call: Amount needed to call
-            hand_equity: Player's estimated hand equity
+            hand_equity: Player's estimated hand equity, or None to look up
+                the preflop equity of hole_cards
             opponent_type: Type of opponent faced
+            hole_cards: The player's hole cards, used when hand_equity is None
+            num_opponents: Opponents in the hand, for the preflop lookup
             
         Returns:
             Analysis with recommendation and reasoning
+            
+        Raises:
+            ValueError: If hand_equity is None and hole_cards are not given
         """
+        if hand_equity is None:
+            if hole_cards is None:
+                raise ValueError("Need hand_equity or hole_cards to analyze a decision")
+            hand_equity = self.preflop_equity(hole_cards, num_opponents)
+        
         pot_odds = PotOddsCalculator.calculate_pot_odds(pot_size, bet_to_call)
         required_equity = pot_odds
         
@@ -88,6 +115,30 @@ class HandAnalyzer:
         
         return analysis
         
+    def preflop_equity(self, hole_cards: List[Card], num_opponents: int = 1) -> float:
+        """
+        Look up preflop equity against random hands.
+        
+        Values come from a table simulated offline by
+        scripts/build_preflop_equity.py, so no simulation runs here.
+        
+        Args:
+            hole_cards: The player's two hole cards
+            num_opponents: Number of opponents still to act (1-8)
+            
+        Returns:
+            Estimated equity between 0 and 1
+            
+        Raises:
+            ValueError: If there are not exactly two hole cards or the
+                opponent count is outside 1-8
+        """
+        if len(hole_cards) != 2:
+            raise ValueError("Preflop equity needs exactly two hole cards")
+        if not 1 <= num_opponents <= 8:
+            raise ValueError("Number of opponents must be between 1 and 8")
+        return _preflop_equity_table()[bucket169(*hole_cards)][num_opponents - 1]
+        
     def _adjust_for_opponent_type(self, math_decision: str, opponent_type: str,
                                  opponent_profile: Dict, hand_equity: float) -> str:
         """Adjust mathematical decision based on opponent tendencies."""
@@ -3,7 +3,7 @@ Career Tracker module for long-term player progression.
 Tracks statistics across hundreds or thousands of hands to show improvement over time.
 """
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime
 import json
 import statistics
@@ -32,6 +32,15 @@ class CareerTracker:
     Tracks player performance across multiple sessions for long-term analysis.
     Provides career statistics, trend analysis, and milestone tracking.
     """
+
+    # (hands required, milestone type), in ascending order
+    MILESTONES = (
+        (100, '100_hands'),
+        (500, '500_hands'),
+        (1000, '1000_hands'),
+        (5000, '5000_hands'),
+        (10000, '10000_hands')
+    )
     
     def __init__(self, player_name: str):
         """
@@ -60,6 +69,34 @@ class CareerTracker:
         
         # Check for milestones
         self._check_milestones()
+
+    def record_sessions(self, sessions: Iterable[Dict[str, Any]]) -> None:
+        """
+        Record several gameplay sessions in order.
+
+        Equivalent to calling record_session for each one, but the timestamp
+        and achieved-milestone lookup are computed once for the whole batch.
+
+        Args:
+            sessions: Iterable of session statistics dictionaries
+        """
+        timestamp = datetime.now()
+        achieved = {m['type'] for m in self.milestones_achieved}
+        pending = [m for m in self.MILESTONES if m[1] not in achieved]
+
+        for session_data in sessions:
+            session_data['timestamp'] = timestamp
+            session_data['session_number'] = len(self.sessions) + 1
+            self.sessions.append(session_data)
+            self.total_hands += session_data.get('hands_played', 0)
+
+            while pending and self.total_hands >= pending[0][0]:
+                _, milestone_type = pending.pop(0)
+                self.milestones_achieved.append({
+                    'type': milestone_type,
+                    'achieved_at': timestamp.isoformat(),
+                    'total_hands': self.total_hands
+                })
         
     def get_career_metrics(self) -> CareerMetrics:
         """
@@ -188,15 +225,7 @@ class CareerTracker:
         
     def _check_milestones(self) -> None:
         """Check and record achievement milestones."""
-        milestones = [
-            (100, '100_hands'),
-            (500, '500_hands'),
-            (1000, '1000_hands'),
-            (5000, '5000_hands'),
-            (10000, '10000_hands')
-        ]
-        
-        for hands, milestone_type in milestones:
+        for hands, milestone_type in self.MILESTONES:
             if self.total_hands >= hands:
                 # Check if not already achieved
                 if not any(m['type'] == milestone_type for m in self.milestones_achieved):
@@ -4,7 +4,8 @@ Loads poker tips, vocabulary, strategy guides, and cheat sheets.
 """
 import json
 import os
-from typing import Dict, List, Any, Optional
+import random
+from typing import Dict, List, Any, Optional, Tuple
 
 
 class ContentLoader:
@@ -18,67 +19,72 @@ class ContentLoader:
             content_directory: Directory containing educational content files
         """
         self.content_dir = content_directory
+        self._tips: Optional[Tuple[Dict[str, Any], ...]] = None
+        # Parsed content files by name; None marks a missing or unreadable file
+        self._file_cache: Dict[str, Any] = {}
         self._ensure_content_directory()
         
     def _ensure_content_directory(self):
         """Ensure the educational content directory exists."""
         os.makedirs(self.content_dir, exist_ok=True)
         
+    def _read_content_file(self, filename: str) -> Optional[Any]:
+        """Parse a content file on first use and serve later reads from memory."""
+        if filename not in self._file_cache:
+            path = os.path.join(self.content_dir, filename)
+            content = None
+            if os.path.exists(path):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        content = json.load(f)
+                except Exception:
+                    pass
+            self._file_cache[filename] = content
+        return self._file_cache[filename]
+        
     def load_tips(self) -> List[Dict[str, Any]]:
         """Load poker tips and tricks."""
-        tips_file = os.path.join(self.content_dir, "poker_tips.json")
-        
-        if os.path.exists(tips_file):
-            try:
-                with open(tips_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-                
+        content = self._read_content_file("poker_tips.json")
+        if content is not None:
+            return list(content)
+            
         # Return default tips if file doesn't exist
         return self._get_default_tips()
         
+    def _get_cached_tips(self) -> Tuple[Dict[str, Any], ...]:
+        """Return the tip catalog, reading it from disk only on first use."""
+        if self._tips is None:
+            self._tips = tuple(self.load_tips())
+        return self._tips
+
     def load_vocabulary(self) -> List[Dict[str, Any]]:
         """Load poker vocabulary and definitions."""
-        vocab_file = os.path.join(self.content_dir, "poker_vocabulary.json")
-        
-        if os.path.exists(vocab_file):
-            try:
-                with open(vocab_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-                
+        content = self._read_content_file("poker_vocabulary.json")
+        if content is not None:
+            return list(content)
+            
         return self._get_default_vocabulary()
         
     def load_strategy_guides(self) -> List[Dict[str, Any]]:
         """Load strategy guides and articles."""
-        strategy_file = os.path.join(self.content_dir, "strategy_guides.json")
-        
-        if os.path.exists(strategy_file):
-            try:
-                with open(strategy_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-                
+        content = self._read_content_file("strategy_guides.json")
+        if content is not None:
+            return list(content)
+            
         return self._get_default_strategies()
         
     def load_cheat_sheets(self) -> Dict[str, Any]:
         """Load poker cheat sheets and quick references."""
-        cheat_sheet_file = os.path.join(self.content_dir, "cheat_sheets.json")
-        
-        if os.path.exists(cheat_sheet_file):
-            try:
-                with open(cheat_sheet_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-                
+        cheat_sheets = self._read_content_file("cheat_sheets.json")
+        if cheat_sheets is not None:
+            return dict(cheat_sheets)
+            
         return self._get_default_cheat_sheets()
         
     def save_content_files(self):
         """Save all default content to files."""
+        self._tips = None
+        self._file_cache.clear()
         # Save tips
         tips_file = os.path.join(self.content_dir, "poker_tips.json")
         with open(tips_file, 'w', encoding='utf-8') as f:
@@ -373,20 +379,19 @@ class ContentLoader:
         
     def get_random_tip(self) -> Dict[str, Any]:
         """Get a random poker tip."""
-        tips = self.load_tips()
+        tips = self._get_cached_tips()
         if tips:
-            import random
-            return random.choice(tips)
+            return tips[random.randrange(len(tips))]
         return {"title": "No tips available", "content": ""}
         
     def get_tips_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get tips filtered by category."""
-        tips = self.load_tips()
+        tips = self._get_cached_tips()
         return [tip for tip in tips if tip.get('category') == category]
         
     def get_tips_by_difficulty(self, difficulty: str) -> List[Dict[str, Any]]:
         """Get tips filtered by difficulty level."""
-        tips = self.load_tips()
+        tips = self._get_cached_tips()
         return [tip for tip in tips if tip.get('difficulty') == difficulty]
         
     def search_vocabulary(self, search_term: str) -> List[Dict[str, Any]]:
@@ -10,6 +10,7 @@ from rich.columns import Columns
 from rich.text import Text
 from rich.progress import Progress, BarColumn, TextColumn
 import math
+from game.preflop import NUM_BUCKETS, bucket169, bucket_label
 
 
 class TrainerHUD:
@@ -21,6 +22,8 @@ class TrainerHUD:
         self.display_mode = 'basic'  # basic, detailed, minimal
         self.console = Console()
         self.opponent_data: Dict[str, Dict[str, Any]] = {}
+        # Shown starting hands per opponent, counted by 169-hand bucket
+        self.starting_hand_counts: Dict[str, List[int]] = {}
         self.current_stats = {}
         
         # Color schemes for different player types
@@ -51,9 +54,29 @@ class TrainerHUD:
         Update opponent statistics data.
         
         Args:
-            opponent_stats: Dictionary of opponent names and their stats
+            opponent_stats: Dictionary of opponent names and their stats;
+                stats may carry the 'hole_cards' an opponent showed down,
+                which are counted by starting hand rather than stored
         """
-        self.opponent_data.update(opponent_stats)
+        for opponent, stats in opponent_stats.items():
+            hole_cards = stats.get('hole_cards')
+            if hole_cards:
+                self.record_starting_hand(opponent, hole_cards)
+                stats = {key: value for key, value in stats.items() if key != 'hole_cards'}
+            self.opponent_data[opponent] = stats
+        
+    def record_starting_hand(self, opponent_name: str, hole_cards: List[Any]):
+        """
+        Count a starting hand an opponent showed down.
+        
+        Args:
+            opponent_name: The opponent's name
+            hole_cards: The opponent's two hole cards
+        """
+        counts = self.starting_hand_counts.get(opponent_name)
+        if counts is None:
+            counts = self.starting_hand_counts[opponent_name] = [0] * NUM_BUCKETS
+        counts[bucket169(hole_cards[0], hole_cards[1])] += 1
         
     def update_current_stats(self, stats: Dict[str, Any]):
         """Update current game situation statistics."""
@@ -188,6 +211,24 @@ class TrainerHUD:
             f"(VPIP:{vpip_pct:.0f}% PFR:{pfr_pct:.0f}% AF:{af:.1f})"
         )
         
+    def format_starting_hands(self, opponent_name: str, limit: int = 3) -> str:
+        """
+        Format an opponent's most often shown starting hands.
+        
+        Args:
+            opponent_name: Name of the opponent
+            limit: Number of starting hands to list
+            
+        Returns:
+            Formatted string for display, e.g. "AKs x2, QQ x1"
+        """
+        counts = self.starting_hand_counts.get(opponent_name)
+        if not counts:
+            return "No hands shown"
+        shown = sorted((bucket for bucket in range(NUM_BUCKETS) if counts[bucket]),
+                       key=lambda bucket: -counts[bucket])
+        return ", ".join(f"{bucket_label(bucket)} x{counts[bucket]}" for bucket in shown[:limit])
+        
     def generate_pot_odds_display(self, pot_size: float, bet_to_call: float) -> str:
         """Generate pot odds display text."""
         if bet_to_call == 0:
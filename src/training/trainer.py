@@ -5,7 +5,7 @@ Implements interactive training features including quizzes and real-time educati
 import random
 import math
 from enum import Enum
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from stats.calculator import PotOddsCalculator
 
 
@@ -266,24 +266,8 @@ class PokerTrainer:
                     'correct_answer': correct_answer
                 }
                 
-        # Check if answer is within tolerance.
-        # - For fractional answers (0-1), also accept % input (e.g. 25 for 0.25).
-        # - For numeric answers (>1), interpret tolerance <= 1.0 as relative (e.g. 0.2 = ±20%).
         difference = abs(correct_answer - user_answer)
-
-        is_fractional = 0 < correct_answer <= 1.0
-        if is_fractional:
-            is_correct = difference <= tolerance
-
-            # Also accept percent answers when the user enters 0-100.
-            percentage_tolerance = tolerance * 100
-            percentage_difference = abs((correct_answer * 100) - user_answer)
-            is_correct = is_correct or (percentage_difference <= percentage_tolerance)
-        else:
-            allowed_diff = tolerance
-            if tolerance <= 1.0:
-                allowed_diff = abs(correct_answer) * tolerance
-            is_correct = difference <= allowed_diff
+        is_correct = self._within_tolerance(correct_answer, user_answer, tolerance)
             
         # Update performance stats
         self.performance_stats['total_quizzes'] += 1
@@ -311,6 +295,51 @@ class PokerTrainer:
             'performance_stats': self.performance_stats.copy()
         }
         
+    def evaluate_answers(self, correct_answers: Sequence[float],
+                         user_answers: Sequence[float],
+                         tolerance: float = 0.05) -> List[bool]:
+        """
+        Grade a batch of numeric answers with the same rules as evaluate_answer.
+        
+        Unlike evaluate_answer, this does not update performance stats or
+        difficulty, so it is suitable for reviewing past quizzes in bulk.
+        
+        Args:
+            correct_answers: The correct answers
+            user_answers: The user's answers, paired with correct_answers
+            tolerance: Acceptable margin of error
+            
+        Returns:
+            Whether each answer is correct, in order
+            
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        if len(correct_answers) != len(user_answers):
+            raise ValueError("Correct and user answers must have the same length")
+        within = self._within_tolerance
+        return [within(correct, user, tolerance)
+                for correct, user in zip(correct_answers, user_answers)]
+    
+    @staticmethod
+    def _within_tolerance(correct_answer: float, user_answer: float,
+                          tolerance: float) -> bool:
+        """Check whether an answer is within tolerance of the correct one."""
+        # - For fractional answers (0-1), also accept % input (e.g. 25 for 0.25).
+        # - For numeric answers (>1), interpret tolerance <= 1.0 as relative (e.g. 0.2 = ±20%).
+        difference = abs(correct_answer - user_answer)
+        
+        if 0 < correct_answer <= 1.0:
+            if difference <= tolerance:
+                return True
+            # Also accept percent answers when the user enters 0-100.
+            return abs((correct_answer * 100) - user_answer) <= tolerance * 100
+        
+        allowed_diff = tolerance
+        if tolerance <= 1.0:
+            allowed_diff = abs(correct_answer) * tolerance
+        return difference <= allowed_diff
+        
     def _generate_positive_feedback(self) -> str:
         """Generate encouraging feedback for correct answers."""
         positive_messages = [
@@ -2,7 +2,7 @@
 Input Handler module for user input processing.
 Handles validation and parsing of user input.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import re
 
 
@@ -21,7 +21,7 @@ class InputHandler:
         """Initialize input handler."""
         self.input_history: List[str] = []
                 
-    def get_menu_choice(self, options: List[str], prompt: str = "Choose an option") -> int:
+    def get_menu_choice(self, options: Sequence[str], prompt: str = "Choose an option") -> int:
         """
         Get menu selection from user.
         
@@ -4,6 +4,7 @@ Tests dynamic content integration, career tracking, and personalized training.
 """
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from training.adaptive_trainer import AdaptiveTrainer, SkillLevel, WeaknessType
 from training.career_tracker import CareerTracker, CareerMetrics
 from training.progression_analyzer import ProgressionAnalyzer, TrendDirection
@@ -364,6 +365,27 @@ class TestDynamicContentIntegration:
         assert 'relevant_section' in content
         assert 'study_recommendation' in content
         
+    def test_random_tip_reads_catalog_once(self):
+        """Test that random tips are served from the cached catalog."""
+        loader = ContentLoader()
+
+        with patch.object(loader, 'load_tips', wraps=loader.load_tips) as mock_load:
+            for _ in range(5):
+                tip = loader.get_random_tip()
+                assert 'title' in tip
+            assert mock_load.call_count == 1
+
+    def test_content_files_read_once(self, tmp_path):
+        """Test that content files are parsed once and then served from memory."""
+        loader = ContentLoader(str(tmp_path))
+        loader.save_content_files()
+
+        vocab = loader.load_vocabulary()
+        cheat_sheets = loader.load_cheat_sheets()
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            assert loader.load_vocabulary() == vocab
+            assert loader.load_cheat_sheets() == cheat_sheets
+
     def test_generate_inline_tip(self):
         """Test generating inline tips during gameplay."""
         loader = ContentLoader()
@@ -499,6 +521,22 @@ class TestCareerReporting:
         
         assert '1000_hands' in [m['type'] for m in milestones]
         
+    def test_record_sessions_batch_matches_single(self):
+        """Test that batch recording matches recording sessions one by one."""
+        single = CareerTracker("TestPlayer")
+        batch = CareerTracker("TestPlayer")
+        sessions = [{'hands_played': 150, 'vpip': 0.2 + i * 0.01, 'profit': 50 * i} for i in range(8)]
+
+        for s in sessions:
+            single.record_session(dict(s))
+        batch.record_sessions(dict(s) for s in sessions)
+
+        assert batch.get_career_metrics() == single.get_career_metrics()
+        assert [s['session_number'] for s in batch.sessions] == list(range(1, 9))
+        assert [(m['type'], m['total_hands']) for m in batch.get_milestones()] == [
+            (m['type'], m['total_hands']) for m in single.get_milestones()
+        ]
+        
     def test_skill_level_evolution(self):
         """Test tracking skill level changes over time."""
         tracker = CareerTracker("TestPlayer")
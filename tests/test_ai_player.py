@@ -151,6 +151,62 @@ class TestCautiousAI:
         assert decision != PlayerAction.FOLD or ai.position < 6
 
 
+class TestPreflopTables:
+    """Test the 169-hand preflop lookups match the per-decision formulas."""
+    
+    @staticmethod
+    def _cautious_formula(card1, card2):
+        if card1.rank == card2.rank:
+            return 0.6 + (card1.rank.value / 14) * 0.3
+        suited_bonus = 0.05 if card1.suit == card2.suit else 0
+        high_card_value = max(card1.rank.value, card2.rank.value) / 14
+        low_card_value = min(card1.rank.value, card2.rank.value) / 14
+        gap = abs(card1.rank.value - card2.rank.value)
+        connected_bonus = 0.05 if gap == 1 else 0.03 if gap == 2 else 0
+        return min(high_card_value * 0.6 + low_card_value * 0.2 +
+                   suited_bonus + connected_bonus, 1.0)
+    
+    @staticmethod
+    def _balanced_formula(card1, card2):
+        if card1.rank == card2.rank:
+            return 0.5 + card1.rank.value * 0.03
+        high_value = max(card1.rank.value, card2.rank.value)
+        low_value = min(card1.rank.value, card2.rank.value)
+        suited = 0.1 if card1.suit == card2.suit else 0
+        connected = 0.05 if abs(card1.rank.value - card2.rank.value) <= 2 else 0
+        return high_value * 0.04 + low_value * 0.02 + suited + connected
+    
+    def test_tables_match_formulas_for_every_deal(self):
+        """Test every ordered pair of hole cards gets the same strength."""
+        from itertools import permutations
+        cautious = CautiousAI("Cautious_Bot", 1000)
+        balanced = BalancedAI("Balanced_Bot", 1000)
+        deck = [Card(suit, rank) for suit in Suit for rank in Rank]
+        
+        for hole_cards in permutations(deck, 2):
+            cautious.hole_cards = list(hole_cards)
+            balanced.hole_cards = list(hole_cards)
+            assert cautious._evaluate_preflop_strength() == self._cautious_formula(*hole_cards)
+            assert balanced._preflop_hand_strength() == self._balanced_formula(*hole_cards)
+
+
+class TestMadeHandRank:
+    """Test the memoized made-hand rank used by the post-flop AIs."""
+    
+    def test_matches_hand_evaluator(self):
+        """Test ranks agree with Hand for random 5-7 card sets in any order."""
+        import random
+        from game.ai_player import _made_hand_rank
+        rng = random.Random(5)
+        deck = [Card(suit, rank) for suit in Suit for rank in Rank]
+        
+        for _ in range(300):
+            cards = rng.sample(deck, rng.choice([5, 6, 7]))
+            expected = Hand.best_hand_from_cards(cards).rank.value
+            assert _made_hand_rank(cards) == expected
+            assert _made_hand_rank(list(reversed(cards))) == expected
+
+
 class TestWildAI:
     """Test cases for WildAI implementation."""
     
@@ -79,6 +79,30 @@ class TestCard:
         card = Card(Suit.DIAMONDS, Rank.JACK)
         assert str(card) == "J♦"
         
+    def test_card_short(self):
+        """Test the cached short display string."""
+        card = Card(Suit.CLUBS, Rank.KING)
+        assert card.short == "K♣"
+        assert card.short is card.short
+        assert str(card) == card.short
+        
+    def test_card_int_round_trip(self):
+        """Test converting cards to evaluator ints and back."""
+        for suit in Suit:
+            for rank in Rank:
+                card = Card(suit, rank)
+                assert Card.from_int(card.to_int()) == card
+        
+    def test_card_code_packs_rank_and_suit(self):
+        """Test the 0-51 code keeps rank in the high bits and suit in the low two."""
+        codes = {Card(suit, rank).code for suit in Suit for rank in Rank}
+        assert codes == set(range(52))
+        
+        card = Card(Suit.CLUBS, Rank.QUEEN)
+        assert card.code >> 2 == Rank.QUEEN.value - 2
+        assert card.code & 3 == list(Suit).index(Suit.CLUBS)
+        assert hash(card) == card.code
+        
     def test_card_repr(self):
         """Test repr representation of cards."""
         card = Card(Suit.HEARTS, Rank.ACE)
@@ -41,6 +41,20 @@ class TestDataManager:
         assert "last_played" in player_data
         assert player_data["games_played"] == 0
         assert player_data["total_winnings"] == 0
+        with pytest.raises(TypeError):
+            player_data["bankroll"] = 0
+        
+    def test_created_players_are_independent(self):
+        """Test new player records don't share state with each other."""
+        first = self.manager.create_player("First", 1000)
+        self.manager.update_player_stats("First", {"games_played": 3})
+        second = self.manager.create_player("Second", 2000)
+        
+        assert first["games_played"] == 3
+        assert second["games_played"] == 0
+        assert list(second) == ["name", "bankroll", "created_at", "last_played",
+                                "games_played", "games_won", "total_winnings",
+                                "hands_played", "hands_won", "biggest_pot"]
         
     def test_create_duplicate_player(self):
         """Test creating player with existing name."""
@@ -49,6 +63,17 @@ class TestDataManager:
         with pytest.raises(ValueError, match="Player 'TestPlayer' already exists"):
             self.manager.create_player("TestPlayer", 3000)
             
+    def test_try_create_player_reports_errors(self):
+        """Test the non-raising create path returns the same error messages."""
+        created, player_data, error = self.manager._try_create_player("TestPlayer", 5000)
+        assert created and error is None
+        assert player_data["bankroll"] == 5000
+        
+        assert self.manager._try_create_player("TestPlayer", 3000) == (
+            False, None, "Player 'TestPlayer' already exists")
+        assert self.manager._try_create_player("  ", 3000)[2] == "Player name cannot be empty"
+        assert self.manager._try_create_player("Other", 0)[2] == "Initial bankroll must be positive"
+            
     def test_create_player_invalid_name(self):
         """Test creating player with invalid name."""
         with pytest.raises(ValueError, match="Player name cannot be empty"):
@@ -84,6 +109,15 @@ class TestDataManager:
         assert new_manager.players_data["Player1"]["bankroll"] == 5000
         assert new_manager.players_data["Player2"]["bankroll"] == 10000
         
+    def test_save_players_with_non_string_keys(self):
+        """Test nested stats keyed by numbers are saved like json.dumps would."""
+        self.manager.create_player("Player1", 5000)
+        self.manager.update_player_stats("Player1", {"hands_by_seat": {1: 4, 2: 7}})
+        self.manager.save_players()
+        
+        new_manager = DataManager(self.data_file)
+        assert new_manager.get_player("Player1")["hands_by_seat"] == {"1": 4, "2": 7}
+        
     def test_load_players_nonexistent_file(self):
         """Test loading players from non-existent file."""
         non_existent_file = os.path.join(self.temp_dir, "nonexistent.json")
@@ -111,6 +145,35 @@ class TestDataManager:
         assert player_data["name"] == "TestPlayer"
         assert player_data["bankroll"] == 5000
         
+    def test_get_player_is_read_only(self):
+        """Test get_player returns a read-only view and copies on request."""
+        self.manager.create_player("TestPlayer", 5000)
+        
+        with pytest.raises(TypeError):
+            self.manager.get_player("TestPlayer")["bankroll"] = 0
+        
+        player_copy = self.manager.get_player_mutable_copy("TestPlayer")
+        player_copy["bankroll"] = 0
+        assert self.manager.get_player("TestPlayer")["bankroll"] == 5000
+
+    def test_reads_do_not_wait_for_writer_lock(self):
+        """Test single-player reads proceed while another thread holds the lock."""
+        import threading
+        self.manager.create_player("TestPlayer", 5000)
+        self.manager.get_data_summary()
+        results = []
+
+        with self.manager._lock:
+            reader = threading.Thread(target=lambda: results.append((
+                self.manager.get_player("TestPlayer")["bankroll"],
+                self.manager.player_exists("TestPlayer"),
+                self.manager.get_data_summary()["total_bankroll"],
+            )))
+            reader.start()
+            reader.join(timeout=2)
+
+        assert results == [(5000, True, 5000)]
+
     def test_get_player_not_exists(self):
         """Test getting non-existent player."""
         player_data = self.manager.get_player("NonExistentPlayer")
@@ -125,6 +188,23 @@ class TestDataManager:
         player_data = self.manager.get_player("TestPlayer")
         assert player_data["bankroll"] == 7500
         
+    def test_update_timestamps_reused_within_a_second(self):
+        """Test last_played strings are reused for updates within one second."""
+        self.manager.create_player("TestPlayer", 5000)
+        self.manager._now_cache = (float("-inf"), "")
+        
+        with patch("data.manager.time.monotonic", return_value=1000.0):
+            self.manager.update_player_bankroll("TestPlayer", 6000)
+            first = self.manager.get_player("TestPlayer")["last_played"]
+            with patch("data.manager.datetime") as mock_datetime:
+                self.manager.update_player_bankroll("TestPlayer", 7000)
+                mock_datetime.now.assert_not_called()
+        assert self.manager.get_player("TestPlayer")["last_played"] == first
+        
+        with patch("data.manager.time.monotonic", return_value=1001.5):
+            self.manager.update_player_stats("TestPlayer", {"games_played": 1})
+        assert self.manager.get_player("TestPlayer")["last_played"] >= first
+        
     def test_update_player_bankroll_not_exists(self):
         """Test updating bankroll for non-existent player."""
         with pytest.raises(ValueError, match="Player 'NonExistentPlayer' not found"):
@@ -156,6 +236,76 @@ class TestDataManager:
         assert player_data["total_winnings"] == 2500
         assert player_data["biggest_pot"] == 1000
         
+    def test_update_and_save(self):
+        """Test applying stats and a player object with a single save."""
+        self.manager.create_player("TestPlayer", 5000)
+        player = Player("TestPlayer", 6500)
+
+        with patch.object(self.manager, "save_players") as mock_save:
+            self.manager.update_and_save("TestPlayer", {"training_difficulty": 3}, player)
+            mock_save.assert_called_once()
+
+        stored = self.manager.get_player("TestPlayer")
+        assert stored["training_difficulty"] == 3
+        assert stored["bankroll"] == 6500
+
+    def test_save_player_coalesces_saves(self):
+        """Repeated save_player calls within the interval share one save."""
+        self.manager.create_player("TestPlayer", 5000)
+        player = Player("TestPlayer", 5500)
+
+        with patch.object(self.manager, "save_players", wraps=self.manager.save_players) as mock_save:
+            self.manager.save_player(player)
+            player.bankroll = 6000
+            self.manager.save_player(player)
+            player.bankroll = 6500
+            self.manager.save_player(player)
+            assert mock_save.call_count == 1
+
+            self.manager.close()
+            assert mock_save.call_count == 2
+
+        with open(self.data_file, encoding="utf-8") as f:
+            assert json.load(f)["TestPlayer"]["bankroll"] == 6500
+
+    def test_deferred_save_written_at_exit(self):
+        """A save still waiting on the timer is written when the interpreter exits."""
+        import subprocess
+        import sys
+        
+        src_dir = os.path.dirname(os.path.dirname(sys.modules[DataManager.__module__].__file__))
+        script = (
+            "from data.manager import DataManager\n"
+            "from game.player import Player\n"
+            f"manager = DataManager({self.data_file!r}, save_interval=60)\n"
+            "manager.create_player('TestPlayer', 100)\n"
+            "player = Player('TestPlayer', 200)\n"
+            "manager.save_player(player)\n"
+            "player.bankroll = 300\n"
+            "manager.save_player(player)\n"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ, PYTHONPATH=src_dir))
+        
+        with open(self.data_file, encoding="utf-8") as f:
+            assert json.load(f)["TestPlayer"]["bankroll"] == 300
+
+    def test_deferred_save_error_raised_by_flush(self):
+        """An error from a save on the timer thread is raised by the next flush."""
+        self.manager.create_player("TestPlayer", 5000)
+        self.manager._dirty = True
+        
+        with patch.object(self.manager, "save_players", side_effect=OSError("disk full")):
+            self.manager._flush_if_dirty()
+        
+        with pytest.raises(OSError, match="disk full"):
+            self.manager.flush()
+        self.manager.flush()
+
+    def test_update_and_save_not_exists(self):
+        """Test update_and_save with a missing player."""
+        with pytest.raises(ValueError, match="Player 'Missing' not found"):
+            self.manager.update_and_save("Missing", {"games_played": 1})
+
     def test_update_player_stats_not_exists(self):
         """Test updating stats for non-existent player."""
         stats = {"games_played": 5}
@@ -171,6 +321,32 @@ class TestDataManager:
         self.manager.delete_player("TestPlayer")
         assert "TestPlayer" not in self.manager.players_data
         
+    def test_cleanup_inactive_players(self):
+        """Test stale, missing and malformed last_played dates are removed."""
+        for name in ("Recent", "Stale", "NoDate", "BadDate", "DateOnly"):
+            self.manager.create_player(name, 1000)
+        players = self.manager.players_data
+        players["Stale"]["last_played"] = "2000-01-01T12:00:00"
+        del players["NoDate"]["last_played"]
+        players["BadDate"]["last_played"] = "not a date"
+        players["DateOnly"]["last_played"] = "2000-01-01"
+        
+        assert self.manager.cleanup_inactive_players(days_inactive=30) == 4
+        assert list(self.manager.players_data) == ["Recent"]
+
+    def test_cleanup_inactive_players_timezone_aware(self):
+        """Test aware last_played timestamps are compared, not treated as invalid."""
+        from datetime import datetime, timezone
+        
+        for name in ("AwareRecent", "AwareStale"):
+            self.manager.create_player(name, 1000)
+        players = self.manager.players_data
+        players["AwareRecent"]["last_played"] = datetime.now(timezone.utc).isoformat()
+        players["AwareStale"]["last_played"] = "2000-01-01T12:00:00+00:00"
+        
+        assert self.manager.cleanup_inactive_players(days_inactive=30) == 1
+        assert list(self.manager.players_data) == ["AwareRecent"]
+        
     def test_delete_player_not_exists(self):
         """Test deleting non-existent player."""
         with pytest.raises(ValueError, match="Player 'NonExistentPlayer' not found"):
@@ -215,6 +391,32 @@ class TestDataManager:
         assert players[0]["name"] == "Veteran"
         assert players[1]["name"] == "Newbie"
         
+    def test_list_players_sorted_by_sparse_field(self):
+        """Test players missing the sort field sort as 0, mixed types by name."""
+        for name in ("B", "A", "C"):
+            self.manager.create_player(name, 1000)
+        self.manager.update_player_stats("B", {"rating": 5})
+        self.manager.update_player_stats("C", {"rating": -2})
+        
+        players = self.manager.list_players(sort_by="rating")
+        assert [p["name"] for p in players] == ["C", "A", "B"]
+        
+        self.manager.update_player_stats("A", {"rating": "high"})
+        players = self.manager.list_players(sort_by="rating")
+        assert [p["name"] for p in players] == ["A", "B", "C"]
+        
+    def test_list_players_order_is_cached_until_change(self):
+        """Test sorted listings are reused until player data changes."""
+        self.manager.create_player("Poor", 1000)
+        self.manager.create_player("Rich", 50000)
+        
+        first = self.manager.list_players(sort_by="bankroll")
+        first.clear()
+        assert [p["name"] for p in self.manager.list_players(sort_by="bankroll")] == ["Poor", "Rich"]
+        
+        self.manager.update_player_bankroll("Poor", 99000)
+        assert [p["name"] for p in self.manager.list_players(sort_by="bankroll")] == ["Rich", "Poor"]
+        
     def test_player_exists(self):
         """Test checking if player exists."""
         assert not self.manager.player_exists("TestPlayer")
@@ -266,6 +468,70 @@ class TestDataManager:
         assert "BackupPlayer1" in self.manager.players_data
         assert "BackupPlayer2" in self.manager.players_data
         assert self.manager.players_data["BackupPlayer1"]["bankroll"] == 7500
+        # Neither record has created_at; they are restored but reported
+        assert self.manager.invalid_players == ["BackupPlayer1", "BackupPlayer2"]
+        
+    def test_restore_players_data_rejects_non_object(self):
+        """Test a backup that isn't a JSON object leaves the current data alone."""
+        self.manager.create_player("Current", 5000)
+        backup_file = os.path.join(self.temp_dir, "restore_list.json")
+        with open(backup_file, 'w') as f:
+            json.dump([{"name": "Listed", "bankroll": 100}], f)
+        
+        with pytest.raises(IOError, match="JSON object"):
+            self.manager.restore_players_data(backup_file)
+        
+        assert list(self.manager.players_data) == ["Current"]
+        
+    def test_load_players_ignores_non_object_players(self):
+        """Test a 'players' entry that isn't an object loads as no players."""
+        with open(self.data_file, 'w') as f:
+            json.dump({"players": [{"name": "Listed"}]}, f)
+        
+        assert DataManager(self.data_file).players_data == {}
+        
+    def test_load_players_validates_records(self):
+        """Test loaded records are validated while created players are not."""
+        self.manager.create_player("Valid", 5000)
+        self.manager.players_data["Broken"] = {"name": "Broken", "bankroll": "lots"}
+        self.manager.save_players()
+        
+        with patch.object(DataManager, "validate_player_data", return_value=True) as mock_validate:
+            self.manager.create_player("Fresh", 1000)
+            mock_validate.assert_not_called()
+        
+        new_manager = DataManager(self.data_file)
+        assert new_manager.invalid_players == ["Broken"]
+        assert new_manager.get_player("Broken")["bankroll"] == "lots"
+        
+    def test_export_data_csv(self):
+        """Test CSV export writes a header and one row per player."""
+        import csv
+        self.manager.create_player("Player1", 5000)
+        self.manager.create_player("Player2", 10000)
+        del self.manager.players_data["Player2"]["biggest_pot"]
+        export_file = os.path.join(self.temp_dir, "players.csv")
+        
+        self.manager.export_data(export_file, format="csv")
+        
+        with open(export_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [row["name"] for row in rows] == ["Player1", "Player2"]
+        assert rows[1]["bankroll"] == "10000"
+        assert rows[1]["biggest_pot"] == ""
+        assert list(rows[0])[:3] == ["name", "bankroll", "created_at"]
+        
+    def test_export_data_csv_keeps_extra_fields(self):
+        """Test fields outside the schema follow the schema columns."""
+        self.manager.create_player("Player1", 5000)
+        self.manager.update_player_stats("Player1", {"rank": "gold"})
+        export_file = os.path.join(self.temp_dir, "players.csv")
+        
+        self.manager.export_data(export_file, format="csv")
+        
+        with open(export_file, newline='', encoding='utf-8') as f:
+            header = f.readline().strip().split(",")
+        assert header == list(DataManager.PLAYER_SCHEMA["properties"]) + ["rank"]
         
     def test_validate_player_data_valid(self):
         """Test validating valid player data."""
@@ -297,6 +563,30 @@ class TestDataManager:
         
         assert self.manager.validate_player_data(invalid_data) is False
         
+    def test_validate_player_data_matches_schema(self):
+        """Test the hand-written fast path agrees with the JSON schema."""
+        from jsonschema import Draft7Validator
+        validator = Draft7Validator(DataManager.PLAYER_SCHEMA)
+        base = self.manager.create_player("TestPlayer", 5000)
+        samples = [
+            dict(base),
+            {"name": "Minimal", "bankroll": 0, "created_at": ""},
+            dict(base, bankroll=12.5, total_winnings=-40.0),
+            dict(base, name=""),
+            dict(base, bankroll=-1),
+            dict(base, bankroll=True),
+            dict(base, games_played=-3),
+            dict(base, games_played=2.0),
+            dict(base, hands_won=None),
+            dict(base, biggest_pot=-0.5),
+            dict(base, last_played=20230101),
+            {"name": "NoBankroll", "created_at": ""},
+            ["not", "a", "dict"],
+        ]
+        
+        for sample in samples:
+            assert self.manager.validate_player_data(sample) is validator.is_valid(sample), sample
+        
     def test_get_player_statistics(self):
         """Test getting comprehensive player statistics."""
         self.manager.create_player("TestPlayer", 5000)
@@ -318,6 +608,104 @@ class TestDataManager:
         assert player_stats["hand_win_rate"] == 200/1000  # hands won / hands played
         assert player_stats["average_winnings"] == 12500/50  # total winnings / games
         
+    def test_player_statistics_cache_invalidation(self):
+        """Cached statistics and summaries refresh after updates."""
+        self.manager.create_player("TestPlayer", 5000)
+        first = self.manager.get_player_statistics("TestPlayer")
+        with pytest.raises(TypeError):
+            first["win_rate"] = 99  # Callers get read-only views
+        assert self.manager.get_player_statistics("TestPlayer")["win_rate"] == 0.0
+        assert self.manager.get_data_summary()["total_bankroll"] == 5000
+        
+        self.manager.update_player_stats("TestPlayer", {"games_played": 4, "games_won": 1})
+        self.manager.update_player_bankroll("TestPlayer", 6000)
+        
+        assert self.manager.get_player_statistics("TestPlayer")["win_rate"] == 0.25
+        summary = self.manager.get_data_summary()
+        assert summary["total_bankroll"] == 6000
+        assert summary["total_games_played"] == 4
+        
+    def test_data_summary_rolls_forward_on_player_changes(self):
+        """Single-player changes adjust cached totals without a full rescan."""
+        self.manager.create_player("A", 1000)
+        self.manager.create_player("B", 2000)
+        self.manager.get_data_summary()
+        
+        self.manager.create_player("C", 500)
+        self.manager.update_player_stats("A", {"games_played": 7})
+        self.manager.delete_player("B")
+        with patch.object(self.manager, "players_data", wraps=self.manager.players_data) as data:
+            summary = self.manager.get_data_summary()
+            data.items.assert_not_called()
+        assert (summary["total_bankroll"], summary["total_games_played"]) == (1500, 7)
+        
+        # Float values are summed afresh rather than adjusted
+        self.manager.update_player_stats("A", {"bankroll": 0.1})
+        self.manager.update_player_stats("C", {"bankroll": 0.2})
+        assert self.manager.get_data_summary()["total_bankroll"] == 0.1 + 0.2
+        
+    def test_data_summary_file_exists_without_stat(self):
+        """Test file_exists tracks saves without touching the filesystem."""
+        assert self.manager.get_data_summary()["file_exists"] is False
+        self.manager.create_player("A", 1000)
+        self.manager.save_players()
+        
+        with patch("data.manager.os.path.exists") as mock_exists:
+            assert self.manager.get_data_summary()["file_exists"] is True
+            mock_exists.assert_not_called()
+        assert DataManager(self.data_file).get_data_summary()["file_exists"] is True
+        
+    def test_get_leaderboard(self):
+        """Leaderboard returns the top players by metric, ties in roster order."""
+        for name, bankroll in [("A", 3000), ("B", 9000), ("C", 3000), ("D", 5000)]:
+            self.manager.create_player(name, bankroll)
+        
+        top = self.manager.get_leaderboard("bankroll", limit=3)
+        
+        assert [p["name"] for p in top] == ["B", "D", "A"]
+        with pytest.raises(TypeError):
+            top[0]["bankroll"] = 0  # Entries are read-only views
+        assert self.manager.get_player("B")["bankroll"] == 9000
+        assert len(self.manager.get_leaderboard("bankroll", limit=10)) == 4
+        
+    def test_leaderboard_index_follows_updates(self):
+        """The kept-sorted leaderboard matches a fresh ranking after changes."""
+        import heapq
+        import random
+        rng = random.Random(7)
+        for i in range(30):
+            self.manager.create_player(f"P{i}", rng.choice([1000, 2000, 3000]))
+        self.manager.get_leaderboard("bankroll")
+        self.manager.get_leaderboard("games_won")
+        
+        for _ in range(200):
+            name = f"P{rng.randrange(40)}"
+            action = rng.random()
+            if not self.manager.player_exists(name):
+                self.manager.create_player(name, rng.choice([1000, 2000, 3000]))
+            elif action < 0.4:
+                self.manager.update_player_bankroll(name, rng.choice([0, 1000, 2000, 3000]))
+            elif action < 0.8:
+                self.manager.update_player_stats(name, {"games_won": rng.randrange(4)})
+            else:
+                self.manager.delete_player(name)
+            
+            for metric in ("bankroll", "games_won"):
+                expected = heapq.nlargest(
+                    5, self.manager.players_data.values(), key=lambda p: p.get(metric, 0))
+                top = self.manager.get_leaderboard(metric, limit=5)
+                assert [p["name"] for p in top] == [p["name"] for p in expected]
+        
+    def test_leaderboard_mixed_metric_types_fall_back(self):
+        """Metrics that can't be compared rank players by name instead."""
+        self.manager.create_player("A", 1000)
+        self.manager.create_player("B", 2000)
+        assert [p["name"] for p in self.manager.get_leaderboard("rank")] == ["A", "B"]
+        
+        self.manager.update_player_stats("A", {"rank": "gold"})
+        self.manager.update_player_stats("B", {"rank": 3})
+        assert [p["name"] for p in self.manager.get_leaderboard("rank")] == ["B", "A"]
+        
     def test_data_manager_thread_safety(self):
         """Test thread safety of data operations."""
         import threading
@@ -346,6 +734,88 @@ class TestDataManager:
         # Should have created players successfully
         assert len(self.manager.players_data) <= 10  # At most 10 unique players
         
+    def test_save_players_replaces_atomically(self):
+        """Saving swaps in a complete file and only backs up on request."""
+        self.manager.create_player("TestPlayer", 5000)
+        self.manager.save_players()
+        
+        assert not os.path.exists(f"{self.data_file}.tmp")
+        assert not os.path.exists(f"{self.data_file}.bak")
+        
+        self.manager.update_player_bankroll("TestPlayer", 6000)
+        self.manager.save_players(keep_backup=True)
+        
+        with open(f"{self.data_file}.bak", encoding="utf-8") as f:
+            assert json.load(f)["TestPlayer"]["bankroll"] == 5000
+        with open(self.data_file, encoding="utf-8") as f:
+            assert json.load(f)["TestPlayer"]["bankroll"] == 6000
+        
+    def test_save_players_unserializable_leaves_no_tmp_file(self):
+        """A value JSON can't encode fails the save without leaving a tmp file."""
+        self.manager.create_player("TestPlayer", 5000)
+        self.manager.save_players()
+        self.manager.players_data["TestPlayer"]["notes"] = object()
+        
+        with pytest.raises(TypeError):
+            self.manager.save_players()
+        
+        assert not os.path.exists(f"{self.data_file}.tmp")
+        with open(self.data_file, encoding="utf-8") as f:
+            assert "notes" not in json.load(f)["TestPlayer"]
+        
+    def test_save_players_backs_up_every_nth_save(self):
+        """The backup is refreshed only on every backup_every-th save."""
+        manager = DataManager(self.data_file, backup_every=3)
+        manager.create_player("TestPlayer", 1000)
+        
+        for bankroll in (2000, 3000, 4000):
+            manager.update_player_bankroll("TestPlayer", bankroll)
+            manager.save_players()
+            if bankroll < 4000:
+                assert not os.path.exists(f"{self.data_file}.bak")
+        
+        with open(f"{self.data_file}.bak", encoding="utf-8") as f:
+            assert json.load(f)["TestPlayer"]["bankroll"] == 3000
+        
+    def test_write_ahead_log_replays_unsaved_changes(self):
+        """Changes logged since the last save survive a restart."""
+        manager = DataManager(self.data_file, write_ahead_log=True)
+        manager.create_player("Saved", 1000)
+        manager.save_players()
+        assert not os.path.exists(f"{self.data_file}.wal")
+        
+        manager.create_player("Unsaved", 2000)
+        manager.update_player_bankroll("Saved", 1500)
+        manager.delete_player("Unsaved")
+        manager.create_player("Later", 3000)
+        with open(f"{self.data_file}.wal", "ab") as f:
+            f.write(b'{"op": "put", "name": "Torn"')  # crash mid-append
+        
+        reloaded = DataManager(self.data_file, write_ahead_log=True)
+        assert sorted(reloaded.players_data) == ["Later", "Saved"]
+        assert reloaded.get_player("Saved")["bankroll"] == 1500
+        
+        reloaded.save_players()
+        assert not os.path.exists(f"{self.data_file}.wal")
+        with open(self.data_file, encoding="utf-8") as f:
+            assert sorted(json.load(f)) == ["Later", "Saved"]
+        
+    def test_write_ahead_log_restore_takes_a_snapshot(self):
+        """Restoring a backup replaces logged changes with a fresh snapshot."""
+        backup_file = os.path.join(self.temp_dir, "backup.json")
+        with open(backup_file, "w", encoding="utf-8") as f:
+            json.dump({"Restored": {"name": "Restored", "bankroll": 10,
+                                    "created_at": "2023-01-01T00:00:00"}}, f)
+        manager = DataManager(self.data_file, write_ahead_log=True)
+        manager.create_player("Logged", 1000)
+        
+        manager.restore_players_data(backup_file)
+        manager.create_player("After", 500)
+        manager.close()
+        
+        reloaded = DataManager(self.data_file, write_ahead_log=True)
+        assert sorted(reloaded.players_data) == ["After", "Restored"]
+        
     def test_data_file_permissions(self):
         """Test handling of file permission errors."""
         with patch("builtins.open", mock_open()) as mock_file:
@@ -412,6 +882,59 @@ class TestDataManager:
         """Missing hand history file returns empty list."""
         assert self.manager.load_hand_history("MissingPlayer", limit=10, reverse=True) == []
 
+    def test_hand_history_path_is_cached(self):
+        """History paths are computed once per name and dropped on delete."""
+        self.manager.create_player("TestPlayer", 1000)
+        path = self.manager.append_hand_history("TestPlayer", {"hand_number": 1})
+
+        with patch("data.manager.hashlib.blake2b") as mock_hash:
+            assert self.manager.append_hand_history(" TestPlayer ", {"hand_number": 2}) == path
+            mock_hash.assert_not_called()
+
+        self.manager.delete_player("TestPlayer")
+        assert "TestPlayer" not in self.manager._history_paths
+
+    def test_hand_history_uses_existing_legacy_file(self):
+        """Histories saved under the old SHA-256 filename keep being used."""
+        import hashlib
+        digest = hashlib.sha256(b"TestPlayer").hexdigest()[:10]
+        legacy_path = os.path.join(self.manager.hand_history_dir, f"TestPlayer__{digest}.jsonl")
+        os.makedirs(self.manager.hand_history_dir, exist_ok=True)
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"hand_number": 1}) + "\n")
+
+        assert self.manager.append_hand_history("TestPlayer", {"hand_number": 2}) == legacy_path
+        hands = self.manager.load_hand_history("TestPlayer", reverse=False)
+        assert [h["hand_number"] for h in hands] == [1, 2]
+
+        other = self.manager.append_hand_history("OtherPlayer", {"hand_number": 1})
+        expected = hashlib.blake2b(b"OtherPlayer", digest_size=5).hexdigest()
+        assert os.path.basename(other) == f"OtherPlayer__{expected}.jsonl"
+
+    def test_hand_history_appends_are_buffered(self):
+        """Appends are buffered until flushed, read back, or closed."""
+        path = self.manager.append_hand_history("TestPlayer", {"hand_number": 1})
+        assert os.path.getsize(path) == 0
+
+        assert len(self.manager.load_hand_history("TestPlayer")) == 1
+        self.manager.append_hand_history("TestPlayer", {"hand_number": 2})
+        self.manager.close()
+
+        with open(path, encoding="utf-8") as f:
+            assert [json.loads(line)["hand_number"] for line in f] == [1, 2]
+
+    def test_read_last_jsonl_lines(self):
+        """Only the requested tail is returned, skipping blank lines."""
+        path = os.path.join(self.temp_dir, "history.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(f'{{"n": {i}}}\n' for i in range(1000)) + "\n\n")
+
+        assert self.manager._read_last_jsonl_lines(path, 3) == ['{"n": 997}', '{"n": 998}', '{"n": 999}']
+        assert len(self.manager._read_last_jsonl_lines(path, 5000)) == 1000
+
+        open(path, "w").close()
+        assert self.manager._read_last_jsonl_lines(path, 3) == []
+
     def test_append_hand_history_rejects_non_dict(self):
         """Non-dict hand payloads are rejected."""
         with pytest.raises(ValueError):
@@ -2,6 +2,7 @@
 Test suite for Deck class.
 Tests deck creation, shuffling, and card dealing functionality.
 """
+import random
 import pytest
 from game.deck import Deck
 from game.card import Card, Suit, Rank
@@ -30,6 +31,14 @@ class TestDeck:
         assert len(ranks) == 13
         assert suits == {Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES}
         
+    def test_decks_share_card_instances(self):
+        """Test new decks reuse the same Card objects instead of allocating."""
+        first = Deck()
+        second = Deck()
+        
+        assert all(a is b for a, b in zip(first.cards, second.cards))
+        assert first.cards[0] == Card(Suit.HEARTS, Rank.TWO)
+        
     def test_deck_shuffle(self):
         """Test deck shuffling functionality."""
         deck1 = Deck()
@@ -166,6 +175,32 @@ class TestDeck:
         assert len(deck.cards) == original_count - 1
         assert burned_card not in deck.cards
         
+    def test_deal_flop_and_streets_burn_first(self):
+        """Test street dealing skips a burn card before each street."""
+        deck = Deck()
+        expected = deck.cards
+
+        flop = deck.deal_flop()
+        turn = deck.deal_turn_or_river()
+        river = deck.deal_turn_or_river()
+
+        assert flop == expected[1:4]
+        assert turn == expected[5]
+        assert river == expected[7]
+        assert deck.cards_remaining == 52 - 8
+
+    def test_deal_flop_short_deck(self):
+        """Test street dealing raises when too few cards remain."""
+        deck = Deck()
+        deck.deal_cards(49)
+
+        with pytest.raises(ValueError, match="Cannot deal the flop"):
+            deck.deal_flop()
+
+        deck.deal_cards(2)
+        with pytest.raises(ValueError, match="Cannot deal a street"):
+            deck.deal_turn_or_river()
+
     def test_deck_remaining_count(self):
         """Test cards_remaining property accuracy."""
         deck = Deck()
@@ -197,6 +232,20 @@ class TestDeck:
         
         assert deck1.cards == deck2.cards
         
+    def test_deck_seed_is_per_instance(self):
+        """Test a seeded deck is reproducible without reseeding global random."""
+        random.seed(99)
+        expected_next = random.random()
+        random.seed(99)
+        
+        deck1 = Deck(seed=7)
+        deck2 = Deck(seed=7)
+        deck1.shuffle()
+        deck2.shuffle()
+        
+        assert deck1.cards == deck2.cards
+        assert random.random() == expected_next
+        
     def test_deck_iterator(self):
         """Test deck iteration functionality."""
         deck = Deck()
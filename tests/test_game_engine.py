@@ -173,7 +173,33 @@ class TestGameEngine:
         assert self.human_player.bankroll == 9000  # 10000 - 1000
         self.mock_data_manager.save_player.assert_called_once_with(self.human_player)
         assert self.game_engine.tournament_mode is False
-        
+
+    def test_saved_sessions_keep_history_and_biggest_pot(self, tmp_path):
+        """Test later sessions merge with the stored player instead of resetting it."""
+        from data.manager import DataManager
+
+        manager = DataManager(str(tmp_path / "players.json"))
+        manager.create_player("Human", 10000)
+        self.game_engine.data_manager = manager
+        tracker = self.game_engine.session_tracker
+
+        for pot_total in (800, 300):
+            tracker.start_session(
+                game_type="cash",
+                limit_type="no_limit",
+                bankroll_start=10000,
+                small_blind=10,
+                big_blind=20,
+            )
+            tracker.start_hand(hero_hole_cards=["As", "Kd"])
+            tracker.end_hand(winners=["Human"], pot_total=pot_total)
+            self.game_engine._finalize_and_persist_session(result="completed")
+
+        player = manager.get_player("Human")
+        assert len(player["sessions"]) == 2
+        assert [hand["pot_total"] for hand in player["recent_hands"]] == [800, 300]
+        assert player["biggest_pot"] == 800
+
     def test_deal_hole_cards(self):
         """Test dealing hole cards to players."""
         # Set up table with players
@@ -277,6 +277,24 @@ class TestHand:
         best_hand = Hand.best_hand_from_cards(seven_cards)
         assert best_hand.rank == HandRank.ROYAL_FLUSH
         
+    def test_best_hand_ignores_card_order(self):
+        """Test the same cards in any order give the same best hand."""
+        seven_cards = [
+            Card(Suit.HEARTS, Rank.NINE),
+            Card(Suit.CLUBS, Rank.NINE),
+            Card(Suit.SPADES, Rank.FOUR),
+            Card(Suit.DIAMONDS, Rank.FOUR),
+            Card(Suit.HEARTS, Rank.KING),
+            Card(Suit.SPADES, Rank.TWO),
+            Card(Suit.CLUBS, Rank.SEVEN)
+        ]
+        
+        forward = Hand.best_hand_from_cards(seven_cards)
+        backward = Hand.best_hand_from_cards(list(reversed(seven_cards)))
+        
+        assert forward.rank == HandRank.TWO_PAIR
+        assert forward.cards == backward.cards
+        
     def test_best_hand_from_insufficient_cards(self):
         """Test error when trying to find best hand from < 5 cards."""
         cards = [
@@ -287,6 +305,22 @@ class TestHand:
         with pytest.raises(ValueError, match="Need at least 5 cards"):
             Hand.best_hand_from_cards(cards)
             
+    def test_duplicate_cards_rejected(self):
+        """Test a repeated card raises ValueError rather than a lookup error."""
+        cards = [
+            Card(Suit.HEARTS, Rank.ACE),
+            Card(Suit.HEARTS, Rank.ACE),
+            Card(Suit.SPADES, Rank.KING),
+            Card(Suit.CLUBS, Rank.QUEEN),
+            Card(Suit.DIAMONDS, Rank.JACK),
+            Card(Suit.DIAMONDS, Rank(9)),
+        ]
+        
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            Hand(cards[:5])
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            Hand.best_hand_from_cards(cards)
+            
     def test_hand_string_representation(self):
         """Test string representation of hands."""
         cards = [
@@ -332,3 +366,46 @@ class TestHand:
         assert hand.kickers[0].rank == Rank.KING
         assert hand.kickers[1].rank == Rank.QUEEN
         assert hand.kickers[2].rank == Rank.JACK
+        
+    def test_wheel_loses_to_six_high_straight(self):
+        """Test the ace-low straight ranks below every other straight."""
+        wheel = Hand([
+            Card(Suit.HEARTS, Rank.ACE),
+            Card(Suit.DIAMONDS, Rank.TWO),
+            Card(Suit.CLUBS, Rank.THREE),
+            Card(Suit.SPADES, Rank.FOUR),
+            Card(Suit.HEARTS, Rank.FIVE)
+        ])
+        six_high = Hand([
+            Card(Suit.HEARTS, Rank.SIX),
+            Card(Suit.DIAMONDS, Rank.TWO),
+            Card(Suit.CLUBS, Rank.THREE),
+            Card(Suit.SPADES, Rank.FOUR),
+            Card(Suit.HEARTS, Rank.FIVE)
+        ])
+        
+        assert wheel.rank == HandRank.STRAIGHT
+        assert wheel.high_card.rank == Rank.FIVE
+        assert wheel < six_high
+
+
+class TestCactusEvaluator:
+    """Test cases for the packed-integer hand evaluator."""
+    
+    def test_lookup_tables_cover_all_hands(self):
+        """Test the tables hold one entry per distinct 5-card hand value."""
+        from game._cactus import FLUSH_LOOKUP, UNSUITED_LOOKUP
+        
+        scores = set(FLUSH_LOOKUP.values()) | set(UNSUITED_LOOKUP.values())
+        assert scores == set(range(1, 7463))
+        
+    def test_card_to_int(self):
+        """Test card packing into evaluator integers."""
+        ace = Card(Suit.SPADES, Rank.ACE).to_int()
+        deuce = Card(Suit.HEARTS, Rank.TWO).to_int()
+        
+        assert ace & 0xFF == 41
+        assert (ace >> 8) & 0xF == 12
+        assert ace >> 16 == 1 << 12
+        assert deuce & 0xFF == 2
+        assert deuce >> 16 == 1
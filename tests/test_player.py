@@ -217,6 +217,24 @@ class TestPlayer:
         # Bankroll and total_bet should remain
         assert player.bankroll == 900
         
+    def test_reset(self):
+        """Test resetting player to its starting state."""
+        player = Player("TestPlayer", 1000)
+        player.deal_hole_cards([
+            Card(Suit.HEARTS, Rank.ACE),
+            Card(Suit.SPADES, Rank.KING)
+        ])
+        player.place_bet(300)
+        player.add_winnings(50)
+        
+        player.reset()
+        
+        assert player.hole_cards == []
+        assert player.current_bet == 0
+        assert player.total_bet == 0
+        assert player.bankroll == 1000
+        assert player.total_winnings == 0
+        
     def test_reset_for_new_round(self):
         """Test resetting player for new betting round."""
         player = Player("TestPlayer", 1000)
@@ -0,0 +1,49 @@
+"""
+Test suite for preflop starting-hand buckets.
+Tests the mapping of hole cards onto the 169 canonical starting hands.
+"""
+import pytest
+from itertools import combinations
+from game.card import Card, Suit, Rank
+from game.deck import Deck
+from game.preflop import NUM_BUCKETS, bucket169, bucket_label, bucket_ranks
+
+
+class TestPreflopBuckets:
+    """Test cases for the 169-bucket preflop abstraction."""
+    
+    def test_all_combos_cover_169_buckets(self):
+        """Test every two-card combo maps onto exactly 169 buckets."""
+        counts = [0] * NUM_BUCKETS
+        for card1, card2 in combinations(Deck().cards, 2):
+            counts[bucket169(card1, card2)] += 1
+            
+        # 6 combos per pair, 4 per suited hand, 12 per offsuit hand
+        assert sum(counts) == 1326
+        assert sorted(set(counts)) == [4, 6, 12]
+        assert counts.count(6) == 13
+        assert counts.count(4) == 78
+        assert counts.count(12) == 78
+        
+    def test_bucket_ignores_card_order(self):
+        """Test both card orders land in the same bucket."""
+        ace = Card(Suit.HEARTS, Rank.ACE)
+        king = Card(Suit.CLUBS, Rank.KING)
+        
+        assert bucket169(ace, king) == bucket169(king, ace)
+        
+    def test_bucket_labels(self):
+        """Test bucket labels for pairs, suited and offsuit hands."""
+        aks = bucket169(Card(Suit.SPADES, Rank.ACE), Card(Suit.SPADES, Rank.KING))
+        t9o = bucket169(Card(Suit.HEARTS, Rank.NINE), Card(Suit.CLUBS, Rank.TEN))
+        sevens = bucket169(Card(Suit.HEARTS, Rank.SEVEN), Card(Suit.CLUBS, Rank.SEVEN))
+        
+        assert bucket_label(aks) == "AKs"
+        assert bucket_label(t9o) == "T9o"
+        assert bucket_label(sevens) == "77"
+        assert bucket_ranks(aks) == (14, 13, True)
+        
+    def test_invalid_bucket(self):
+        """Test out-of-range buckets are rejected."""
+        with pytest.raises(ValueError, match="Invalid preflop bucket"):
+            bucket_ranks(169)
@@ -41,6 +41,23 @@ class TestPotOddsCalculator:
         
         assert ratio == (3, 1)
         
+    def test_calculate_pot_odds_percentages(self):
+        """Test batched pot odds match the single-pair calculation."""
+        calculator = PotOddsCalculator()
+        pots = [100, 300, 75]
+        bets = [20, 100, 25]
+        
+        batch = calculator.calculate_pot_odds_percentages(pots, bets)
+        
+        assert batch == pytest.approx([
+            calculator.calculate_pot_odds_percentage(pot, bet)
+            for pot, bet in zip(pots, bets)
+        ])
+        with pytest.raises(ValueError):
+            calculator.calculate_pot_odds_percentages([100], [0])
+        with pytest.raises(ValueError):
+            calculator.calculate_pot_odds_percentages([100, 200], [20])
+        
     def test_calculate_pot_odds_invalid_inputs(self):
         """Test pot odds calculation with invalid inputs."""
         calculator = PotOddsCalculator()
@@ -227,6 +244,34 @@ class TestEquityCalculator:
         assert equity2 < 0.25
         assert abs((equity1 + equity2) - 1.0) < 0.01  # Should sum to 1
         
+    def test_simulate_equity(self):
+        """Test Monte Carlo equity estimation."""
+        calculator = EquityCalculator()
+        aces = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.SPADES, Rank.ACE)]
+        
+        equity = calculator.simulate_equity(aces, trials=400, seed=7)
+        
+        # AA is roughly 85% against a random hand
+        assert 0.75 < equity < 0.95
+        assert equity == calculator.simulate_equity(aces, trials=400, seed=7)
+        
+        # Royal flush on the board chops every time
+        board = [Card(Suit.CLUBS, r) for r in (Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN)]
+        assert calculator.simulate_equity(aces, board, trials=50) == 0.5
+        assert calculator.simulate_equity(aces, board, trials=50, opponents=3) == 0.25
+        
+        # Equity drops against more opponents
+        assert calculator.simulate_equity(aces, trials=400, seed=7, opponents=4) < equity
+        
+        with pytest.raises(ValueError):
+            calculator.simulate_equity(aces, trials=0)
+        with pytest.raises(ValueError):
+            calculator.simulate_equity(aces, opponents=9)
+        with pytest.raises(ValueError, match="two hole cards"):
+            calculator.simulate_equity(aces[:1])
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            calculator.simulate_equity(aces, [aces[0]], trials=10)
+        
     def test_calculate_equity_multiway(self):
         """Test equity calculation in multiway pot."""
         calculator = EquityCalculator()
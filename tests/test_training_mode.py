@@ -93,6 +93,18 @@ class TestPokerTrainer:
         result = trainer.evaluate_answer(0.2, 0.3, tolerance=0.01)
         assert result['correct'] is False
         
+    def test_evaluate_answers_batch(self):
+        """Test grading several answers without touching performance stats."""
+        trainer = PokerTrainer()
+        
+        graded = trainer.evaluate_answers([0.2, 0.2, 0.2, 150], [0.195, 20, 0.35, 160],
+                                          tolerance=0.1)
+        
+        assert graded == [True, True, False, True]
+        assert trainer.performance_stats['total_quizzes'] == 0
+        with pytest.raises(ValueError):
+            trainer.evaluate_answers([0.2], [])
+        
     def test_quiz_difficulty_adjustment(self):
         """Test quiz difficulty adjustment based on performance."""
         trainer = PokerTrainer()
@@ -155,6 +167,40 @@ class TestHandAnalyzer:
         assert analysis['recommendation'] == 'fold'
         assert 'unprofitable' in analysis['reasoning'].lower()
         
+    def test_preflop_equity_lookup(self):
+        """Test preflop equity comes from the shipped table."""
+        analyzer = HandAnalyzer()
+        aces = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.SPADES, Rank.ACE)]
+        trash = [Card(Suit.CLUBS, Rank.SEVEN), Card(Suit.DIAMONDS, Rank.TWO)]
+        
+        assert 0.8 < analyzer.preflop_equity(aces) < 0.9
+        assert analyzer.preflop_equity(trash) < 0.4
+        assert analyzer.preflop_equity(aces, 8) < analyzer.preflop_equity(aces, 1)
+        
+        with pytest.raises(ValueError, match="between 1 and 8"):
+            analyzer.preflop_equity(aces, 9)
+        
+    def test_analyze_decision_uses_preflop_equity(self):
+        """Test hole cards stand in for hand equity preflop."""
+        analyzer = HandAnalyzer()
+        aces = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.SPADES, Rank.ACE)]
+        
+        analysis = analyzer.analyze_decision(
+            action=PlayerAction.CALL,
+            pot_size=100,
+            bet_to_call=50,
+            hand_equity=None,
+            opponent_type="loose-passive",
+            hole_cards=aces,
+            num_opponents=2,
+        )
+        
+        assert analysis['hand_equity'] == analyzer.preflop_equity(aces, 2)
+        assert analysis['math_recommendation'] == 'call'
+        
+        with pytest.raises(ValueError, match="hole_cards"):
+            analyzer.analyze_decision(PlayerAction.CALL, 100, 50, None, "balanced")
+        
     def test_analyze_bluff_against_opponent_type(self):
         """Test analyzing bluff attempts against different opponent types."""
         analyzer = HandAnalyzer()
@@ -324,6 +370,32 @@ class TestTrainerHUD:
         assert 'AI_1' in hud.opponent_data
         assert hud.opponent_data['AI_1']['type'] == 'balanced'
         
+    def test_record_starting_hand(self):
+        """Test counting shown starting hands by preflop bucket."""
+        hud = TrainerHUD()
+        
+        hud.record_starting_hand('AI_1', [Card(Suit.HEARTS, Rank.ACE), Card(Suit.HEARTS, Rank.KING)])
+        hud.record_starting_hand('AI_1', [Card(Suit.SPADES, Rank.KING), Card(Suit.SPADES, Rank.ACE)])
+        hud.record_starting_hand('AI_1', [Card(Suit.CLUBS, Rank.ACE), Card(Suit.HEARTS, Rank.KING)])
+        
+        counts = hud.starting_hand_counts['AI_1']
+        assert len(counts) == 169
+        assert sum(counts) == 3
+        assert max(counts) == 2  # Both suited AK land in one bucket
+        
+    def test_update_opponent_stats_counts_shown_hands(self):
+        """Test shown hole cards in opponent stats feed the starting-hand counts."""
+        hud = TrainerHUD()
+        aces = [Card(Suit.HEARTS, Rank.ACE), Card(Suit.SPADES, Rank.ACE)]
+        
+        hud.update_opponent_stats({'AI_1': {'vpip': 0.3, 'type': 'balanced', 'hole_cards': aces}})
+        hud.update_opponent_stats({'AI_1': {'vpip': 0.3, 'type': 'balanced'}})
+        
+        assert 'hole_cards' not in hud.opponent_data['AI_1']
+        assert sum(hud.starting_hand_counts['AI_1']) == 1
+        assert hud.format_starting_hands('AI_1') == "AA x1"
+        assert hud.format_starting_hands('AI_2') == "No hands shown"
+        
     def test_format_opponent_display(self):
         """Test formatting opponent stats for display."""
         hud = TrainerHUD()